@@ -0,0 +1,237 @@
+"""
+Benchmarks de generate_coor, generate_connectivity, write e make_mesh por tamanho de malha.
+
+Para cada tamanho (número total de elementos) e tipo de malha (Mesh e MeshWithStandoff)
+mede o melhor tempo, a vazão (malhas/s, nós/s e MB/s escritos) e o pico de memória
+(tracemalloc, numa execução separada da cronometrada). O resultado é salvo em JSON e
+pode ser comparado com um baseline salvo antes:
+
+    uv run python benchmarks/bench_suite.py --output baseline.json
+    uv run python benchmarks/bench_suite.py --output atual.json --baseline baseline.json
+
+Na comparação, tempos ou picos de memória acima de baseline * (1 + threshold) são
+marcados como regressão e o script sai com código 1.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from tencim1d_mesh_generator.backend import get_numpy
+from tencim1d_mesh_generator.mesh import Mesh, MeshWithStandoff, ThicknessEnum, make_mesh
+from tencim1d_mesh_generator.standoff import StandoffRigid
+
+SIZES = (80, 1_000, 10_000, 100_000, 1_000_000)
+KINDS = ('mesh', 'standoff')
+PHASES = ('generate_coor', 'generate_connectivity', 'write', 'make_mesh')
+
+CASING_INTERNAL_DIAMETER = 0.15716
+CASING_EXTERNAL_DIAMETER = 0.17304
+WELL_DIAMETER = 0.20955
+
+
+def element_counts(elements: int) -> tuple[int, int, int, float]:
+    """(casing, sheath, formation, formation_ratio) com elements elementos no total."""
+    nc, ns, nf = Mesh.casing_elements_number, Mesh.sheath_elements_number, Mesh.formation_elements_number
+    if elements == nc + ns + nf:
+        return nc, ns, nf, Mesh.formation_ratio
+
+    nf = elements - nc - ns
+    if nf < 1:
+        raise ValueError(f'São necessários mais que {nc + ns} elementos, recebido {elements}')
+    # Com a razão padrão (1.1) q**nf estoura o float para nf grande.
+    return nc, ns, nf, 1.0 + 1.0 / nf
+
+
+@contextmanager
+def mesh_size(elements: int) -> Iterator[None]:
+    """Muda os números de elementos da classe Mesh, que é o que make_mesh usa."""
+    names = ('casing_elements_number', 'sheath_elements_number', 'formation_elements_number', 'formation_ratio')
+    old = [getattr(Mesh, name) for name in names]
+    for name, value in zip(names, element_counts(elements), strict=True):
+        setattr(Mesh, name, value)
+    try:
+        yield
+    finally:
+        for name, value in zip(names, old, strict=True):
+            setattr(Mesh, name, value)
+
+
+def standoff() -> StandoffRigid:
+    return StandoffRigid(CASING_EXTERNAL_DIAMETER, WELL_DIAMETER, dc=0.19, gamma_max=0.001)
+
+
+def new_mesh(kind: str) -> Mesh:
+    if kind == 'mesh':
+        return Mesh(CASING_INTERNAL_DIAMETER, CASING_EXTERNAL_DIAMETER, WELL_DIAMETER)
+    return MeshWithStandoff(
+        CASING_INTERNAL_DIAMETER,
+        CASING_EXTERNAL_DIAMETER,
+        WELL_DIAMETER,
+        standoff=standoff(),
+        thickness=ThicknessEnum.THICK,
+    )
+
+
+def phase(kind: str, name: str, tmp: Path) -> tuple[Callable[[], None], Callable[[], int], int]:
+    """(função medida, bytes escritos por chamada, malhas por chamada)."""
+    match name:
+        case 'generate_coor':
+            return lambda: new_mesh(kind).generate_coor(), lambda: 0, 1
+        case 'generate_connectivity':
+            return lambda: new_mesh(kind).generate_connectivity(), lambda: 0, 1
+        case 'write':
+            mesh = new_mesh(kind)
+            mesh.generate()
+            path = tmp / 'mesh.dat'
+            return lambda: mesh.write(path), lambda: path.stat().st_size, 1
+        case 'make_mesh':
+            base_dir = tmp / 'make_mesh'
+            kwargs = {'standoff': standoff()} if kind == 'standoff' else {}
+
+            def run():
+                make_mesh(CASING_INTERNAL_DIAMETER, CASING_EXTERNAL_DIAMETER, WELL_DIAMETER, base_dir, **kwargs)
+
+            def written():
+                return sum(p.stat().st_size for p in base_dir.iterdir())
+
+            # com standoff make_mesh escreve as malhas espessa e fina
+            return run, written, 2 if kind == 'standoff' else 1
+    raise ValueError(name)
+
+
+def best_time(fn: Callable[[], None], repeat: int, min_time: float) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def peak_memory(fn: Callable[[], None]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(kind: str, name: str, elements: int, repeat: int, min_time: float) -> dict:
+    with mesh_size(elements), tempfile.TemporaryDirectory() as tmp:
+        fn, written, meshes = phase(kind, name, Path(tmp))
+        fn()
+        nbytes = written()
+        seconds = best_time(fn, repeat, min_time)
+        peak = peak_memory(fn)
+
+    nodes = elements + 3
+    return {
+        'kind': kind,
+        'phase': name,
+        'elements': elements,
+        'seconds': seconds,
+        'meshes_per_s': meshes / seconds,
+        'nodes_per_s': meshes * nodes / seconds,
+        'mb_per_s': nbytes / seconds / 1e6,
+        'bytes_written': nbytes,
+        'peak_memory_bytes': peak,
+    }
+
+
+def metadata() -> dict:
+    try:
+        package = version('tencim1d-mesh-generator')
+    except PackageNotFoundError:
+        package = None
+    np = get_numpy()
+    return {
+        'date': datetime.now(UTC).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'numpy': np.__version__ if np is not None else None,
+        'package': package,
+    }
+
+
+def run_suite(sizes, kinds, phases, repeat: int, min_time: float) -> dict:
+    results = {}
+    for elements in sizes:
+        for kind in kinds:
+            for name in phases:
+                t0 = time.perf_counter()
+                result = run_case(kind, name, elements, repeat, min_time)
+                key = f'{kind}/{name}/{elements}'
+                results[key] = result
+                print(
+                    f'{key:40} {result["seconds"] * 1e3:12.3f} ms  {result["nodes_per_s"]:14,.0f} nós/s  '
+                    f'{result["mb_per_s"]:8.1f} MB/s  {result["peak_memory_bytes"] / 2**20:8.2f} MiB  '
+                    f'({time.perf_counter() - t0:.1f} s)',
+                    flush=True,
+                )
+    return {'meta': metadata(), 'results': results}
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Casos presentes nos dois resultados cujo tempo ou pico de memória piorou mais que threshold."""
+    regressions = []
+    for key, result in current['results'].items():
+        base = baseline['results'].get(key)
+        if base is None:
+            continue
+        for metric in ('seconds', 'peak_memory_bytes'):
+            if base[metric] and result[metric] > base[metric] * (1.0 + threshold):
+                ratio = result[metric] / base[metric]
+                regressions.append(f'{key} {metric}: {base[metric]:.6g} -> {result[metric]:.6g} ({ratio:.2f}x)')
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='Número total de elementos.')
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=KINDS)
+    parser.add_argument('--phases', nargs='+', choices=PHASES, default=PHASES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='Tempo mínimo de cada repetição (s).')
+    parser.add_argument('--quick', action='store_true', help='Só até 10**4 elementos, com menos repetições.')
+    parser.add_argument('--output', type=Path, help='Arquivo JSON com os resultados.')
+    parser.add_argument('--baseline', type=Path, help='JSON de uma execução anterior para comparar.')
+    parser.add_argument('--threshold', type=float, default=0.20, help='Piora relativa tolerada (0.20 = 20%%).')
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes
+    repeat, min_time = args.repeat, args.min_time
+    if args.quick:
+        sizes = [s for s in sizes if s <= 10_000]
+        repeat, min_time = 3, 0.05
+
+    current = run_suite(sizes, args.kinds, args.phases, repeat, min_time)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(current, indent=2) + '\n', encoding='utf-8')
+
+    if args.baseline is None:
+        return 0
+
+    regressions = compare(current, json.loads(args.baseline.read_text(encoding='utf-8')), args.threshold)
+    for line in regressions:
+        print(f'REGRESSÃO {line}')
+    if not regressions:
+        print(f'Sem regressões acima de {args.threshold:.0%} em relação a {args.baseline}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
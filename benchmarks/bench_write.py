@@ -0,0 +1,82 @@
+"""
+Compara a escrita do .dat linha a linha (implementação antiga) com a escrita em blocos
+e com a escrita paralela via mmap.
+
+    uv run python benchmarks/bench_write.py --elements 1000000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from tencim1d_mesh_generator.mesh import Mesh
+from tencim1d_mesh_generator.writer import write_dat, write_dat_parallel
+
+
+def legacy_write(path, x, conn, decimal_places):
+    with open(path, mode='w', encoding='utf-8') as fp:
+        fp.write('coordinates\n')
+        for node, xi in enumerate(x, start=1):
+            fp.write(f'{node} {xi:10.{decimal_places}f}\n')
+        fp.write('end coordinates\n')
+
+        fp.write('bar2\n')
+        for el, c in enumerate(conn, start=1):
+            fp.write(f'{el} {c[0]:4} {c[1]:4} {c[2]:4}\n')
+        fp.write('end bar2\n')
+
+        fp.write('return\n')
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--elements', type=int, default=1_000_000, help='Elementos na formação.')
+    parser.add_argument('--decimal-places', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=None, help='Processos do writer paralelo.')
+    args = parser.parse_args()
+
+    mesh = Mesh(0.15716, 0.17304, 0.20955, decimal_places=args.decimal_places)
+    mesh.formation_elements_number = args.elements
+    mesh.formation_ratio = 1.0 + 1.0 / args.elements
+    mesh.generate()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy, fast, parallel = Path(tmp) / 'legacy.dat', Path(tmp) / 'fast.dat', Path(tmp) / 'parallel.dat'
+
+        t_legacy = best_of(lambda: legacy_write(legacy, mesh.x, mesh.conn, args.decimal_places), args.repeat)
+        t_fast = best_of(lambda: write_dat(fast, mesh.x_array, mesh.connectivity, args.decimal_places), args.repeat)
+        t_parallel = best_of(
+            lambda: write_dat_parallel(
+                parallel,
+                mesh.x_array,
+                mesh.connectivity,
+                args.decimal_places,
+                max_workers=args.workers,
+                use_processes=True,
+            ),
+            args.repeat,
+        )
+
+        assert legacy.read_bytes() == fast.read_bytes() == parallel.read_bytes()
+        size = fast.stat().st_size
+
+    print(f'nós: {len(mesh.x_array)}  arquivo: {size / 1e6:.1f} MB')
+    print(f'linha a linha: {t_legacy:.3f} s  ({size / t_legacy / 1e6:.1f} MB/s)')
+    print(f'em blocos:     {t_fast:.3f} s  ({size / t_fast / 1e6:.1f} MB/s)')
+    print(f'mmap paralelo: {t_parallel:.3f} s  ({size / t_parallel / 1e6:.1f} MB/s)')
+    print(f'speedup:       {t_legacy / t_fast:.2f}x em blocos, {t_legacy / t_parallel:.2f}x paralelo')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Várias malhas num único arquivo zip, em vez de um diretório por caso.
+
+Cada malha fica em '<caso>/<arquivo>.dat' (ex.: '000042/mesh_thick.dat'), com o mesmo
+conteúdo que make_mesh escreveria em base_dir/<arquivo>.dat. O diretório central do zip
+é o índice: qualquer malha é lida sem percorrer as outras. Por padrão as entradas não
+são comprimidas (ZIP_STORED), o que mantém a escrita na velocidade do formatador.
+
+Para extrair um caso quando o Tencim1D for rodar:
+
+    python -m tencim1d_mesh_generator.archive sweep.zip 000042 caso_42/
+"""
+
+import argparse
+import io
+import threading
+import zipfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from tencim1d_mesh_generator.data import MeshData
+from tencim1d_mesh_generator.mesh import Mesh, generate_standoff_pair
+from tencim1d_mesh_generator.reader import parse_mesh
+from tencim1d_mesh_generator.standoff import StandoffABC
+from tencim1d_mesh_generator.writer import atomic_path, write_blocks
+
+
+class MeshArchive:
+    """Arquivo zip de malhas, aberto para leitura ('r'), escrita ('w') ou acréscimo ('a')."""
+
+    def __init__(self, path: Path, mode: str = 'r', compression: int = zipfile.ZIP_STORED):
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path, mode=mode, compression=compression)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._zip.close()
+
+    @staticmethod
+    def name(case_id: str, filename: str) -> str:
+        return f'{case_id}/{filename}'
+
+    def cases(self) -> list[str]:
+        """Casos na ordem em que foram escritos."""
+        return list(dict.fromkeys(name.partition('/')[0] for name in self._zip.namelist()))
+
+    def files(self, case_id: str) -> list[str]:
+        prefix = f'{case_id}/'
+        return [name.removeprefix(prefix) for name in self._zip.namelist() if name.startswith(prefix)]
+
+    def write_dat(
+        self,
+        case_id: str,
+        filename: str,
+        x: Iterable[float],
+        conn: Iterable[tuple[int, int, int]],
+        decimal_places: int = 8,
+    ):
+        """Escreve uma malha no arquivo, com o mesmo conteúdo de writer.write_dat."""
+        with (
+            self._lock,
+            self._zip.open(self.name(case_id, filename), mode='w', force_zip64=True) as raw,
+            io.TextIOWrapper(raw, encoding='utf-8', write_through=True) as fp,
+        ):
+            write_blocks(fp, x, conn, decimal_places)
+
+    def write_mesh(self, case_id: str, mesh: Mesh, filename: str = 'mesh.dat'):
+        self.write_dat(case_id, filename, mesh.x_array, mesh.connectivity, mesh.decimal_places)
+
+    def make_mesh(
+        self,
+        case_id: str,
+        casing_internal_diameter: float,
+        casing_external_diameter: float,
+        well_diameter: float,
+        standoff: StandoffABC | None = None,
+        decimal_places: int = 8,
+    ):
+        """Como mesh.make_mesh, com os arquivos do caso escritos no arquivo zip."""
+        if standoff:
+            standoff.validate_infos()
+            thick, thin = generate_standoff_pair(
+                casing_internal_diameter=casing_internal_diameter,
+                casing_external_diameter=casing_external_diameter,
+                well_diameter=well_diameter,
+                standoff=standoff,
+                decimal_places=decimal_places,
+            )
+            self.write_mesh(case_id, thick, 'mesh_thick.dat')
+            self.write_mesh(case_id, thin, 'mesh_thin.dat')
+        else:
+            mesh = Mesh(
+                casing_internal_diameter=casing_internal_diameter,
+                well_diameter=well_diameter,
+                casing_external_diameter=casing_external_diameter,
+                decimal_places=decimal_places,
+            )
+            mesh.generate()
+            self.write_mesh(case_id, mesh)
+
+    def read_bytes(self, case_id: str, filename: str = 'mesh.dat') -> bytes:
+        with self._lock:
+            return self._zip.read(self.name(case_id, filename))
+
+    def read(self, case_id: str, filename: str = 'mesh.dat', backend: str = 'auto') -> MeshData:
+        name = self.name(case_id, filename)
+        return parse_mesh(self.read_bytes(case_id, filename), backend, name=f'{self.path}:{name}')
+
+    def extract(self, case_id: str, dest_dir: Path, filenames: Iterable[str] | None = None) -> list[Path]:
+        """Escreve os arquivos do caso (ou só filenames) em dest_dir, prontos para o Tencim1D."""
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        paths = []
+        for filename in self.files(case_id) if filenames is None else filenames:
+            path = dest_dir / filename
+            with atomic_path(path) as tmp:
+                tmp.write_bytes(self.read_bytes(case_id, filename))
+            paths.append(path)
+        return paths
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description='Extrai as malhas de um caso de um arquivo zip de malhas.')
+    parser.add_argument('archive', type=Path)
+    parser.add_argument('case_id')
+    parser.add_argument('dest_dir', type=Path)
+    parser.add_argument('--file', action='append', dest='filenames', help='arquivo do caso (padrão: todos)')
+    args = parser.parse_args(argv)
+
+    with MeshArchive(args.archive) as archive:
+        for path in archive.extract(args.case_id, args.dest_dir, args.filenames):
+            print(path)
+
+
+if __name__ == '__main__':
+    main()
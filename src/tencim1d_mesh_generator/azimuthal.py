@@ -0,0 +1,126 @@
+"""
+Malhas radiais ao redor de todo o anular excêntrico.
+
+Com standoff s, o centro do revestimento fica deslocado e = (1 - s) * (rw - rp) do centro
+do poço. Na direção θ, medida a partir do lado espesso, a parede do poço fica a
+
+    r(θ) = e * cos(θ) + sqrt(rw**2 - (e * sin(θ))**2)
+
+do centro do revestimento, e r(θ) é o raio efetivo do poço da malha radial nesse ângulo.
+Em θ = 0 e θ = π ele é igual ao effective_well_radius de ThicknessEnum.THICK e THIN.
+"""
+
+import csv
+from pathlib import Path
+
+from tencim1d_mesh_generator.backend import require_numpy
+from tencim1d_mesh_generator.batch import ArrayLike, coor_from_radii
+from tencim1d_mesh_generator.mesh import Mesh, generate_connectivity, validate_diameters
+from tencim1d_mesh_generator.standoff import StandoffABC, validate_standoff_ratio
+from tencim1d_mesh_generator.writer import write_blocks, write_dat
+
+
+def azimuthal_angles(angles_number: int):
+    """angles_number ângulos igualmente espaçados em [0, 2π), começando no lado espesso."""
+    np = require_numpy()
+    return 2.0 * np.pi * np.arange(angles_number) / angles_number
+
+
+def eccentric_well_radius(pipe_radius: float, well_radius: float, standoff_ratio: float, angles: ArrayLike):
+    np = require_numpy()
+    angles = np.asarray(angles, dtype=np.float64)
+    e = (1.0 - standoff_ratio) * (well_radius - pipe_radius)
+    return e * np.cos(angles) + np.sqrt(well_radius**2 - (e * np.sin(angles)) ** 2)
+
+
+def generate_coor_azimuthal(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    standoff_ratio: float,
+    angles_number: int = 36,
+    formation_diamenter: float = 60.0,
+):
+    """Coordenadas das malhas de todos os ângulos de uma vez: shape (angles_number, n_nodes)."""
+    validate_diameters(casing_internal_diameter, casing_external_diameter, well_diameter, formation_diamenter)
+    validate_standoff_ratio(standoff_ratio)
+
+    pipe_radius = 0.5 * casing_external_diameter
+    well_radius = 0.5 * well_diameter
+    effective_well_radius = eccentric_well_radius(
+        pipe_radius,
+        well_radius,
+        standoff_ratio,
+        azimuthal_angles(angles_number),
+    )
+
+    return coor_from_radii(
+        0.5 * casing_internal_diameter,
+        pipe_radius,
+        effective_well_radius,
+        0.5 * formation_diamenter,
+    )
+
+
+def make_mesh_azimuthal(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    base_dir: Path,
+    standoff: StandoffABC,
+    angles_number: int = 36,
+    decimal_places: int = 8,
+    single_file: bool = False,
+):
+    """
+    Escreve uma malha por ângulo.
+
+    Com single_file=False: base_dir/mesh_angle_000.dat, ... e o índice base_dir/angles.csv.
+    Com single_file=True: todas as malhas em base_dir/mesh_azimuthal.dat, cada uma precedida
+    por 'mesh <índice> <ângulo em graus>', e o índice base_dir/mesh_azimuthal.csv com o
+    offset e o tamanho em bytes de cada malha.
+    """
+    np = require_numpy()
+
+    standoff.validate_infos()
+
+    x = generate_coor_azimuthal(
+        casing_internal_diameter,
+        casing_external_diameter,
+        well_diameter,
+        standoff.ratio,
+        angles_number,
+    )
+    conn = generate_connectivity(
+        Mesh.casing_elements_number,
+        Mesh.sheath_elements_number,
+        Mesh.formation_elements_number,
+    )
+    degrees = np.degrees(azimuthal_angles(angles_number)).tolist()
+    sheath = (
+        x[:, Mesh.casing_elements_number + Mesh.sheath_elements_number + 1] - 0.5 * casing_external_diameter
+    ).tolist()
+
+    base_dir.mkdir(parents=True, exist_ok=True)
+
+    if not single_file:
+        with open(base_dir / 'angles.csv', mode='w', encoding='utf-8', newline='') as fp:
+            index = csv.writer(fp)
+            index.writerow(('angle_index', 'angle_deg', 'effective_sheath_thickness', 'file'))
+            for k, (angle, xk) in enumerate(zip(degrees, x, strict=True)):
+                name = f'mesh_angle_{k:03d}.dat'
+                write_dat(base_dir / name, xk.tolist(), conn, decimal_places)
+                index.writerow((k, angle, sheath[k], name))
+        return
+
+    with (
+        open(base_dir / 'mesh_azimuthal.dat', mode='w', encoding='utf-8', newline='\n') as fp,
+        open(base_dir / 'mesh_azimuthal.csv', mode='w', encoding='utf-8', newline='') as fp_index,
+    ):
+        index = csv.writer(fp_index)
+        index.writerow(('angle_index', 'angle_deg', 'effective_sheath_thickness', 'offset', 'size'))
+        for k, (angle, xk) in enumerate(zip(degrees, x, strict=True)):
+            fp.write(f'mesh {k} {angle}\n')
+            offset = fp.tell()
+            write_blocks(fp, xk.tolist(), conn, decimal_places)
+            index.writerow((k, angle, sheath[k], offset, fp.tell() - offset))
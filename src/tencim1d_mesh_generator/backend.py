@@ -0,0 +1,38 @@
+from functools import cache
+from types import ModuleType
+
+
+@cache
+def get_numpy() -> ModuleType | None:
+    """O NumPy é opcional e só é importado na primeira vez que for necessário."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def has_numpy() -> bool:
+    return get_numpy() is not None
+
+
+def require_numpy() -> ModuleType:
+    np = get_numpy()
+    if np is None:
+        raise ImportError('Esta funcionalidade precisa do NumPy instalado: pip install numpy')
+    return np
+
+
+def use_numpy(size: int, threshold: int, backend: str = 'auto') -> bool:
+    """
+    Escolhe entre o caminho em Python puro e o do NumPy.
+
+    backend 'python' ou 'numpy' força a escolha ('numpy' exige o NumPy instalado); com 'auto'
+    o NumPy é usado quando está instalado e size >= threshold.
+    """
+    if backend == 'python':
+        return False
+    if backend == 'numpy':
+        require_numpy()
+        return True
+    return size >= threshold and get_numpy() is not None
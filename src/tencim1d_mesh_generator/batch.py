@@ -0,0 +1,264 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from tencim1d_mesh_generator.archive import MeshArchive
+from tencim1d_mesh_generator.backend import require_numpy
+from tencim1d_mesh_generator.connectivity import SegmentConnectivity
+from tencim1d_mesh_generator.coor import template
+from tencim1d_mesh_generator.mesh import Mesh, ThicknessEnum, generate_connectivity
+from tencim1d_mesh_generator.standoff import StandoffABC
+from tencim1d_mesh_generator.validation import ArrayLike, ValidationReport, validate_batch
+from tencim1d_mesh_generator.writer import write_dat
+
+
+@dataclass(frozen=True)
+class MeshBatch:
+    """Coordenadas de várias malhas com a mesma conectividade: x tem shape (n_cases, n_nodes)."""
+
+    x: Any
+    conn: SegmentConnectivity
+    decimal_places: int = 8
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    @property
+    def nodes_number(self) -> int:
+        return self.x.shape[1]
+
+    def write(
+        self,
+        base_dir: Path,
+        filename: str = 'mesh.dat',
+        case_dir_fmt: str = '{:06d}',
+        cases: Iterable[int] | None = None,
+    ) -> list[Path]:
+        """Escreve cada linha em base_dir / case_dir_fmt.format(caso); cases numera as linhas (padrão 0, 1, ...)."""
+        if cases is None:
+            cases = range(len(self))
+
+        paths = []
+        for case, x in zip(cases, self.x, strict=True):
+            case_dir = base_dir / case_dir_fmt.format(case)
+            case_dir.mkdir(parents=True, exist_ok=True)
+            path = case_dir / filename
+            write_dat(path, x.tolist(), self.conn, self.decimal_places)
+            paths.append(path)
+        return paths
+
+    def write_archive(
+        self,
+        archive: MeshArchive,
+        filename: str = 'mesh.dat',
+        case_dir_fmt: str = '{:06d}',
+        cases: Iterable[int] | None = None,
+    ):
+        """Como write, com cada caso escrito em archive como case_dir_fmt.format(caso)/filename."""
+        if cases is None:
+            cases = range(len(self))
+
+        for case, x in zip(cases, self.x, strict=True):
+            archive.write_dat(case_dir_fmt.format(case), filename, x.tolist(), self.conn, self.decimal_places)
+
+
+def coor_from_radii(internal_radius, pipe_radius, effective_well_radius, formation_radius):
+    """
+    Coordenadas (n_cases, n_nodes) a partir dos raios de cada caso, já validados.
+
+    Raios com mais de uma dimensão são achatados após o broadcast: os casos seguem a ordem C
+    (o último eixo varia mais rápido).
+    """
+    np = require_numpy()
+
+    internal_radius, pipe_radius, effective_well_radius, formation_radius = (
+        r.ravel()
+        for r in np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(r, dtype=np.float64))
+                for r in (internal_radius, pipe_radius, effective_well_radius, formation_radius)
+            )
+        )
+    )
+
+    nc = Mesh.casing_elements_number
+    ns = Mesh.sheath_elements_number
+    nf = Mesh.formation_elements_number
+    q = Mesh.formation_ratio
+
+    n_cases = internal_radius.shape[0]
+    x = np.empty((n_cases, nc + ns + nf + 3), dtype=np.float64)
+
+    # Cada camada é o template unitário escalado por caso: r0 + (r1 - r0) * t
+    layers = (
+        # casing
+        (internal_radius, pipe_radius, None, nc),
+        # Sheath
+        (pipe_radius, effective_well_radius, None, ns),
+        # Formation
+        (effective_well_radius, formation_radius, q, nf),
+    )
+    col = 0
+    for r0, r1, ratio, n in layers:
+        t = template(n, ratio, backend='numpy')
+        x[:, col : col + n] = r0[:, None] + (r1 - r0)[:, None] * t
+        x[:, col + n] = r1
+        col += n + 1
+
+    return x
+
+
+def _coor_batch(di, de, dw, df, standoff_ratio, thickness: str):
+    internal_radius = 0.5 * di
+    pipe_radius = 0.5 * de
+    well_radius = 0.5 * dw
+    formation_radius = 0.5 * df
+
+    if standoff_ratio is None:
+        effective_well_radius = well_radius
+    else:
+        st = (well_radius - pipe_radius) * (1.0 - standoff_ratio)
+        effective_well_radius = well_radius + st if thickness == ThicknessEnum.THICK.value else well_radius - st
+
+    return coor_from_radii(internal_radius, pipe_radius, effective_well_radius, formation_radius)
+
+
+def _ratio(standoff_ratio: ArrayLike | None, standoff: StandoffABC | None):
+    """Razões de standoff dos casos, de standoff_ratio ou do standoff vetorizado."""
+    if standoff is None:
+        return standoff_ratio
+    if standoff_ratio is not None:
+        raise ValueError('Passe standoff_ratio ou standoff, não os dois')
+
+    np = require_numpy()
+    # parâmetros inválidos (ex.: la == 0) ficam como inf/NaN e são marcados por validate_batch
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.asarray(standoff.ratio, dtype=np.float64)
+
+
+def _validated_columns(
+    casing_internal_diameter,
+    casing_external_diameter,
+    well_diameter,
+    formation_diamenter,
+    standoff_ratio: ArrayLike | None,
+    standoff: StandoffABC | None,
+):
+    """Colunas com broadcast, validadas e achatadas na ordem C; o relatório segue a mesma ordem."""
+    np = require_numpy()
+    ratio = _ratio(standoff_ratio, standoff)
+    columns = [casing_internal_diameter, casing_external_diameter, well_diameter, formation_diamenter]
+    if ratio is not None:
+        columns.append(ratio)
+    di, de, dw, df, *ratio = np.broadcast_arrays(*(np.atleast_1d(np.asarray(c, dtype=np.float64)) for c in columns))
+    ratio = ratio[0] if ratio else None
+
+    if standoff is None:
+        report = validate_batch(di, de, dw, standoff_ratio=ratio, formation_diamenter=df)
+    else:
+        report = validate_batch(di, de, dw, formation_diamenter=df, standoff=standoff)
+
+    # grades (ndim > 1) viram uma linha por caso
+    report = ValidationReport(report.reasons.ravel())
+    return di.ravel(), de.ravel(), dw.ravel(), df.ravel(), None if ratio is None else ratio.ravel(), report
+
+
+def generate_coor_batch(
+    casing_internal_diameter: ArrayLike,
+    casing_external_diameter: ArrayLike,
+    well_diameter: ArrayLike,
+    standoff_ratio: ArrayLike | None = None,
+    thickness: str = ThicknessEnum.THIN.value,
+    formation_diamenter: ArrayLike = 60.0,
+    standoff: StandoffABC | None = None,
+):
+    """
+    Gera as coordenadas de todos os casos de uma vez, coluna a coluna.
+
+    Os diâmetros são arrays (ou escalares) com broadcast entre si. O retorno é um array
+    de shape (n_cases, n_nodes) com os mesmos nós que Mesh.generate_coor (ou
+    MeshWithStandoff.generate_coor quando standoff_ratio é passado). Se o broadcast tiver
+    mais de uma dimensão (ex.: uma grade de diâmetros), os casos seguem a ordem C do
+    resultado achatado. Em vez das razões, standoff pode ser um standoff com parâmetros em
+    arrays (StandoffABC.many), cujos parâmetros também são validados.
+    """
+    *columns, report = _validated_columns(
+        casing_internal_diameter,
+        casing_external_diameter,
+        well_diameter,
+        formation_diamenter,
+        standoff_ratio,
+        standoff,
+    )
+    report.raise_if_invalid()
+    return _coor_batch(*columns, thickness)
+
+
+def _write(batch: MeshBatch, base_dir: Path, archive: MeshArchive | None, filename, case_dir_fmt, cases):
+    if archive is None:
+        batch.write(base_dir, filename, case_dir_fmt, cases)
+    else:
+        batch.write_archive(archive, filename, case_dir_fmt, cases)
+
+
+def make_mesh_batch(
+    casing_internal_diameter: ArrayLike,
+    casing_external_diameter: ArrayLike,
+    well_diameter: ArrayLike,
+    base_dir: Path,
+    standoff_ratio: ArrayLike | None = None,
+    decimal_places: int = 8,
+    case_dir_fmt: str = '{:06d}',
+    skip_invalid: bool = False,
+    archive: MeshArchive | None = None,
+    standoff: StandoffABC | None = None,
+    formation_diamenter: ArrayLike = 60.0,
+) -> ValidationReport:
+    """
+    Versão em lote de make_mesh: cada caso é escrito em base_dir / case_dir_fmt.format(i).
+
+    Todas as linhas são validadas antes de gerar qualquer malha. Com skip_invalid=True as
+    linhas inválidas são apenas puladas (o diretório i não é criado); senão a primeira
+    restrição violada lança a exceção correspondente. Retorna o relatório da validação.
+
+    Com archive, os casos são escritos nele em vez de em diretórios (base_dir é ignorado).
+    standoff, no lugar de standoff_ratio, é um standoff com parâmetros em arrays
+    (StandoffABC.many); linhas com parâmetros inválidos contam como inválidas. Como em
+    generate_coor_batch, um broadcast com mais de uma dimensão é numerado na ordem C.
+    """
+    np = require_numpy()
+
+    di, de, dw, df, ratio, report = _validated_columns(
+        casing_internal_diameter,
+        casing_external_diameter,
+        well_diameter,
+        formation_diamenter,
+        standoff_ratio,
+        standoff,
+    )
+    if not skip_invalid:
+        report.raise_if_invalid()
+
+    cases = np.flatnonzero(report.mask)
+    di, de, dw, df = di[cases], de[cases], dw[cases], df[cases]
+    if ratio is not None:
+        ratio = ratio[cases]
+
+    conn = generate_connectivity(
+        Mesh.casing_elements_number,
+        Mesh.sheath_elements_number,
+        Mesh.formation_elements_number,
+    )
+
+    if ratio is None:
+        x = _coor_batch(di, de, dw, df, None, ThicknessEnum.THIN.value)
+        _write(MeshBatch(x, conn, decimal_places), base_dir, archive, 'mesh.dat', case_dir_fmt, cases.tolist())
+        return report
+
+    for thickness in (ThicknessEnum.THICK, ThicknessEnum.THIN):
+        x = _coor_batch(di, de, dw, df, ratio, thickness.value)
+        filename = f'mesh_{thickness.value.lower()}.dat'
+        _write(MeshBatch(x, conn, decimal_places), base_dir, archive, filename, case_dir_fmt, cases.tolist())
+
+    return report
@@ -0,0 +1,132 @@
+"""
+Formato binário da malha (.t1d), alternativo ao texto .dat do Tencim1D.
+
+Layout (little-endian):
+
+    cabeçalho de 32 bytes: magic b'T1DMESH\\0', versão (u32), decimal_places (u32),
+                           número de nós (u64), número de elementos (u64)
+    x:    n_nodes float64
+    conn: n_el * 3 int32, linhas (nó 1, nó 2, material)
+
+Os offsets dos arrays são múltiplos de 8, então read_binary mapeia o arquivo em memória
+e devolve views sem cópia. decimal_places é guardado para que binary_to_dat reproduza o
+.dat byte a byte; dat_to_binary lê o texto com reader.read_mesh.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+
+from tencim1d_mesh_generator.connectivity import SegmentConnectivity
+from tencim1d_mesh_generator.data import MeshData, readonly_conn, readonly_x
+from tencim1d_mesh_generator.errors import MeshFormatInvalid
+from tencim1d_mesh_generator.reader import read_mesh
+from tencim1d_mesh_generator.writer import atomic_path
+
+MAGIC = b'T1DMESH\0'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQ')
+
+
+def _little_endian(buffer: array | memoryview, typecode: str) -> array | memoryview:
+    if sys.byteorder != 'little':
+        buffer = array(typecode, memoryview(buffer).cast('B').cast(typecode))
+        buffer.byteswap()
+    return buffer
+
+
+def _x_buffer(x: Sequence[float] | memoryview) -> array | memoryview:
+    if isinstance(x, array | memoryview) and memoryview(x).format == 'd':
+        return x
+    return array('d', x)
+
+
+def _conn_buffer(conn: SegmentConnectivity | memoryview | Sequence[Sequence[int]]) -> array | memoryview:
+    if isinstance(conn, SegmentConnectivity):
+        return conn.to_array()
+    if isinstance(conn, memoryview) and conn.format == 'i':
+        return conn
+    buffer = array('i')
+    for element in conn:
+        buffer.extend(element)
+    return buffer
+
+
+def _parts(
+    x: Sequence[float] | memoryview,
+    conn: SegmentConnectivity | memoryview | Sequence[Sequence[int]],
+    decimal_places: int,
+) -> tuple[bytes, array | memoryview, array | memoryview]:
+    """Cabeçalho, x e conn do arquivo, sem concatenar."""
+    x_buffer = _x_buffer(x)
+    conn_buffer = _conn_buffer(conn)
+    nodes = memoryview(x_buffer).nbytes // 8
+    elements = memoryview(conn_buffer).nbytes // 12
+    header = HEADER.pack(MAGIC, VERSION, decimal_places, nodes, elements)
+    return header, _little_endian(x_buffer, 'd'), _little_endian(conn_buffer, 'i')
+
+
+def write_binary(
+    path: Path,
+    x: Sequence[float] | memoryview,
+    conn: SegmentConnectivity | memoryview | Sequence[Sequence[int]],
+    decimal_places: int = 8,
+):
+    with atomic_path(path) as tmp, open(tmp, mode='wb') as fp:
+        for part in _parts(x, conn, decimal_places):
+            fp.write(part)
+
+
+def to_bytes(
+    x: Sequence[float] | memoryview,
+    conn: SegmentConnectivity | memoryview | Sequence[Sequence[int]],
+    decimal_places: int = 8,
+) -> bytes:
+    """Conteúdo de um arquivo .t1d em memória (ex.: para enviar a malha por um socket)."""
+    return b''.join(_parts(x, conn, decimal_places))
+
+
+def read_binary(path: Path) -> MeshData:
+    """Lê um arquivo .t1d mapeado em memória: x e conn são views somente leitura do arquivo."""
+    with open(path, mode='rb') as fp:
+        try:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # arquivo vazio
+            buffer = b''
+    return from_bytes(buffer, name=f'Arquivo {path}')
+
+
+def from_bytes(buffer: bytes | mmap.mmap | memoryview, name: str = 'Buffer') -> MeshData:
+    """Malha de um conteúdo .t1d em memória, com x e conn como views de buffer."""
+    if len(buffer) < HEADER.size:
+        raise MeshFormatInvalid(f'{name} muito pequeno para uma malha binária')
+
+    magic, version, decimal_places, nodes, elements = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        raise MeshFormatInvalid(f'{name} não é uma malha binária (versão {VERSION})')
+
+    x_end = HEADER.size + 8 * nodes
+    conn_end = x_end + 12 * elements
+    if len(buffer) != conn_end:
+        raise MeshFormatInvalid(f'{name} com tamanho {len(buffer)}, esperado {conn_end}')
+
+    view = memoryview(buffer)
+    x = view[HEADER.size : x_end].cast('d')
+    conn = view[x_end:conn_end].cast('i')
+    if sys.byteorder != 'little':
+        x, conn = _little_endian(x, 'd'), _little_endian(conn, 'i')
+
+    return MeshData(x=readonly_x(x), conn=readonly_conn(conn), decimal_places=decimal_places)
+
+
+def dat_to_binary(src: Path, dest: Path):
+    data = read_mesh(src)
+    write_binary(dest, data.x, data.conn, data.decimal_places)
+
+
+def binary_to_dat(src: Path, dest: Path):
+    read_binary(src).write(dest)
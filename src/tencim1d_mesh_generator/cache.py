@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tencim1d_mesh_generator.compress import compression_level, compression_of
+from tencim1d_mesh_generator.profiling import count, phase
+from tencim1d_mesh_generator.writer import atomic_path
+
+if TYPE_CHECKING:
+    from tencim1d_mesh_generator.mesh import Mesh
+
+# Incrementar sempre que a saída do gerador mudar, para invalidar as entradas antigas.
+CACHE_VERSION = 1
+
+
+def cache_key(params: dict[str, Any]) -> str:
+    payload = json.dumps({'cache_version': CACHE_VERSION, **params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class MeshCache:
+    """
+    Cache em disco dos arquivos .dat, endereçado pelo hash dos parâmetros da malha.
+
+    Cada entrada é um arquivo directory/ab/abcdef....dat. Num acerto o arquivo é
+    ligado (hard link) ou copiado para o destino e tem o mtime atualizado; quando o
+    cache passa de max_bytes as entradas com mtime mais antigo são removidas (LRU).
+
+    As entradas são somente leitura, já que com link=True o arquivo no destino é o
+    mesmo inode da entrada do cache. Os writers nunca abrem o destino para escrita (ver
+    writer.atomic_path): uma nova malha no mesmo caminho substitui o link.
+
+    O cache pode ser passado para outros processos (ex.: MeshJob num sweep com processos):
+    o diretório é compartilhado, mas hits, misses e o tamanho conhecido são de cada processo.
+    """
+
+    suffix = '.dat'
+
+    def __init__(self, directory: Path, max_bytes: int = 1 << 30, link: bool = True):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+        self._size: int | None = None
+        self._last_used_ns = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f'{key}{self.suffix}'
+
+    def _entries(self) -> list[Path]:
+        return list(self.directory.glob(f'*/*{self.suffix}'))
+
+    @property
+    def size(self) -> int:
+        if self._size is None:
+            self._size = sum(p.stat().st_size for p in self._entries())
+        return self._size
+
+    def _touch(self, entry: Path):
+        # O relógio do kernel usado no mtime pode ter resolução de milissegundos.
+        with self._lock:
+            self._last_used_ns = max(time.time_ns(), self._last_used_ns + 1)
+            ns = self._last_used_ns
+        os.utime(entry, ns=(ns, ns))
+
+    def get(self, key: str, dest: Path) -> bool:
+        entry = self.path(key)
+        try:
+            self._touch(entry)
+            _place(entry, dest, self.link)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def put(self, key: str, src: Path):
+        entry = self.path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        # .tmp no fim para que o temporário não seja listado como entrada
+        with atomic_path(entry, suffix='.tmp') as tmp:
+            shutil.copyfile(src, tmp)
+            os.chmod(tmp, 0o444)
+        self._touch(entry)
+
+        with self._lock:
+            if self._size is not None:
+                self._size += entry.stat().st_size
+        self.evict()
+
+    def evict(self):
+        with self._lock:
+            if self.size <= self.max_bytes:
+                return
+
+            entries = []
+            for p in self._entries():
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+            entries.sort()
+
+            size = sum(s for _, s, _ in entries)
+            for _, s, p in entries:
+                if size <= self.max_bytes:
+                    break
+                p.unlink(missing_ok=True)
+                size -= s
+            self._size = size
+
+    def clear(self):
+        with self._lock:
+            for p in self._entries():
+                p.unlink(missing_ok=True)
+            self._size = 0
+
+    def write(self, mesh: 'Mesh', path: Path, level: int | None = None) -> bool:
+        """Escreve a malha em path usando o cache. Retorna True num acerto."""
+        params = mesh.params()
+        compression = compression_of(path)
+        if compression is not None:
+            # o conteúdo do arquivo comprimido depende da compressão e do nível (None é o padrão)
+            params |= {'compression': compression, 'level': compression_level(compression, level)}
+
+        key = cache_key(params)
+        with phase('io'):
+            hit = self.get(key, path)
+        count('cache_hits' if hit else 'cache_misses')
+        if hit:
+            return True
+
+        mesh.generate()
+        mesh.write(path, level)
+        count('meshes')
+        with phase('io'):
+            self.put(key, path)
+        return False
+
+
+def _place(entry: Path, dest: Path, link: bool):
+    dest.unlink(missing_ok=True)
+    if link:
+        try:
+            os.link(entry, dest)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(entry, dest)
@@ -0,0 +1,299 @@
+"""
+Linha de comando tencim1d-mesh: gera as malhas dos casos de um arquivo CSV, JSON ou NDJSON.
+
+    tencim1d-mesh casos.csv -o malhas/ --jobs 8
+    cat casos.ndjson | tencim1d-mesh - --format ndjson -o malhas/
+
+Cada caso (linha do CSV, objeto do JSON ou linha do NDJSON) tem os campos:
+
+    casing_internal_diameter (ou cid), casing_external_diameter (ou ced), well_diameter (ou wd)
+    decimal_places   opcional, padrão --decimal-places
+    case             opcional, nome do diretório do caso (padrão: número da linha, 000000, 000001, ...)
+    standoff         opcional: rigid, flexible ou ratio; se omitido, é deduzido dos campos abaixo
+    dc, gamma_max                                   standoff rígido
+    lateral_forces, restoring_force, gamma_max      standoff flexível
+    standoff_ratio                                  razão de standoff conhecida
+
+Campos vazios (ex.: células em branco do CSV) contam como ausentes. As malhas de cada caso
+vão para <output_dir>/<case>/, como em make_mesh. Casos com erro, inclusive linhas que não
+podem ser lidas (ex.: JSON inválido numa linha do NDJSON), são informados no stderr (número
+na entrada, caso e erro) sem interromper os demais, e o código de saída é 1 se algum falhou.
+
+CSV e NDJSON são lidos em streaming; um JSON precisa ser uma lista de objetos.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from itertools import batched, chain
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO
+
+# Os módulos de geração (e o NumPy, que eles só importam quando precisam) são importados
+# nas funções que os usam, depois do parse dos argumentos: --help e erros de uso respondem rápido.
+
+FORMATS = ('csv', 'json', 'ndjson')
+SUFFIXES = {'.csv': 'csv', '.json': 'json', '.ndjson': 'ndjson', '.jsonl': 'ndjson'}
+ALIASES = {'cid': 'casing_internal_diameter', 'ced': 'casing_external_diameter', 'wd': 'well_diameter'}
+DIAMETERS = ('casing_internal_diameter', 'casing_external_diameter', 'well_diameter')
+STANDOFF_FIELDS = {
+    'rigid': (('dc',), ('gamma_max',)),
+    'flexible': (('lateral_forces', 'restoring_force', 'gamma_max'), ()),
+    'ratio': (('standoff_ratio',), ()),
+}
+# casos submetidos por vez a cada sweep (cada um com o seu pool)
+CHUNK_SIZE = 1024
+
+
+def detect_format(path: str, head: str = '') -> str:
+    """Formato pela extensão de path ou, sem extensão conhecida, pelo início head do conteúdo."""
+    suffix = Path(path).suffix.lower()
+    if suffix in SUFFIXES:
+        return SUFFIXES[suffix]
+    start = head.lstrip()[:1]
+    if start == '[':
+        return 'json'
+    if start == '{':
+        return 'ndjson'
+    return 'csv'
+
+
+class RowError(NamedTuple):
+    """Caso que não pôde ser lido: linha da entrada (elemento, no JSON) e o erro."""
+
+    line: int
+    error: Exception
+
+
+def read_rows(lines: Iterable[str], fmt: str) -> Iterator[dict[str, Any] | RowError]:
+    """
+    Casos das linhas de texto lines como dicionários, sem os campos vazios.
+
+    Um caso que não pode ser lido vira um RowError e a leitura continua; ValueError só se o
+    formato for inválido ou o JSON não puder ser lido como uma lista.
+    """
+    match fmt:
+        case 'csv':
+            yield from _read_csv(lines)
+        case 'json':
+            rows = json.loads(''.join(lines))
+            if not isinstance(rows, list):
+                raise ValueError('O JSON precisa ser uma lista de casos')
+            for line, row in enumerate(rows, start=1):
+                yield _row(line, row)
+        case 'ndjson':
+            for line, text in enumerate(lines, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    row = json.loads(text)
+                except ValueError as e:
+                    yield RowError(line, ValueError(f'JSON inválido: {e}'))
+                    continue
+                yield _row(line, row)
+        case _:
+            raise ValueError(f'Formato {fmt!r} inválido, use um de {list(FORMATS)}')
+
+
+def _read_csv(lines: Iterable[str]) -> Iterator[dict[str, Any] | RowError]:
+    reader = csv.DictReader(lines)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield RowError(reader.line_num, e)
+            continue
+        yield _row(reader.line_num, row)
+
+
+def _row(line: int, row: Any) -> dict[str, Any] | RowError:
+    if not isinstance(row, dict):
+        return RowError(line, ValueError(f'Cada caso precisa ser um objeto, recebido {row!r}'))
+    return normalize_row(row)
+
+
+def normalize_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Caso com os nomes longos dos diâmetros (cid -> casing_internal_diameter, ...) e sem os campos vazios."""
+    return {ALIASES.get(k, k): v for k, v in row.items() if k is not None and v not in (None, '')}
+
+
+def _float(row: dict[str, Any], name: str) -> float:
+    try:
+        value = row[name]
+    except KeyError:
+        raise ValueError(f'Campo {name} ausente') from None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'Campo {name} inválido: {value!r}') from None
+
+
+def standoff_kind(row: dict[str, Any]) -> str | None:
+    kind = row.get('standoff')
+    if kind is not None:
+        kind = str(kind).lower()
+        if kind not in STANDOFF_FIELDS:
+            raise ValueError(f'Standoff {kind!r} inválido, use um de {list(STANDOFF_FIELDS)}')
+        return kind
+    if 'dc' in row:
+        return 'rigid'
+    if 'lateral_forces' in row or 'restoring_force' in row:
+        return 'flexible'
+    if 'standoff_ratio' in row:
+        return 'ratio'
+    return None
+
+
+def make_standoff(row: dict[str, Any]):
+    from tencim1d_mesh_generator.standoff import StandoffFlexible, StandoffRatio, StandoffRigid
+
+    kind = standoff_kind(row)
+    if kind is None:
+        return None
+
+    required, optional = STANDOFF_FIELDS[kind]
+    params = {name: _float(row, name) for name in required}
+    params |= {name: _float(row, name) for name in optional if name in row}
+    cls = {'rigid': StandoffRigid, 'flexible': StandoffFlexible, 'ratio': StandoffRatio}[kind]
+    return cls(_float(row, 'casing_external_diameter'), _float(row, 'well_diameter'), **params)
+
+
+def case_params(row: dict[str, Any], decimal_places: int = 8) -> dict[str, Any]:
+    """
+    Argumentos de make_mesh do caso (diâmetros, standoff e decimal_places); ValueError se
+    faltar um campo ou algum não for número.
+    """
+    cid, ced, wd = (_float(row, name) for name in DIAMETERS)
+    if 'decimal_places' in row:
+        try:
+            decimal_places = int(row['decimal_places'])
+        except (TypeError, ValueError):
+            raise ValueError(f'Campo decimal_places inválido: {row["decimal_places"]!r}') from None
+
+    return {
+        'casing_internal_diameter': cid,
+        'casing_external_diameter': ced,
+        'well_diameter': wd,
+        'standoff': make_standoff(row),
+        'decimal_places': decimal_places,
+    }
+
+
+def make_job(row: dict[str, Any], case: str, output_dir: Path, decimal_places: int):
+    from tencim1d_mesh_generator.sweep import MeshJob
+
+    return MeshJob(base_dir=output_dir / case, **case_params(row, decimal_places))
+
+
+def _report(err: TextIO, number: int, case: str, error: Exception, line: int | None = None):
+    where = f'caso {case}' if line is None else f'caso {case}, linha {line}'
+    print(f'#{number} ({where}): {type(error).__name__}: {error}', file=err)
+
+
+def run(
+    rows: Iterable[dict[str, Any] | RowError],
+    output_dir: Path,
+    decimal_places: int = 8,
+    jobs: int = 1,
+    backend: str | None = None,
+    case_fmt: str = '{:06d}',
+    out: TextIO | None = None,
+    err: TextIO | None = None,
+) -> tuple[int, int]:
+    """
+    Gera os casos de rows em output_dir e retorna (casos gerados, casos com erro).
+
+    Cada caso gerado é escrito em out (caso e diretório) e cada erro em err (padrão:
+    stdout e stderr), com o número do caso na entrada a partir de 1; um RowError de rows
+    conta como caso com erro. Com jobs > 1 os casos rodam num pool de jobs workers
+    (threads no Python sem GIL, processos senão).
+    """
+    from tencim1d_mesh_generator.sweep import iter_sweep
+
+    out = sys.stdout if out is None else out
+    err = sys.stderr if err is None else err
+    backend = backend if jobs > 1 else 'serial'
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    ok = failed = 0
+    for chunk in batched(enumerate(rows), CHUNK_SIZE):
+        pending = []
+        for i, row in chunk:
+            if isinstance(row, RowError):
+                _report(err, i + 1, case_fmt.format(i), row.error, row.line)
+                failed += 1
+                continue
+            case = str(row.get('case', case_fmt.format(i)))
+            try:
+                pending.append((i, case, make_job(row, case, output_dir, decimal_places)))
+            except ValueError as e:
+                _report(err, i + 1, case, e)
+                failed += 1
+
+        results = iter_sweep((job for _, _, job in pending), backend=backend, max_workers=jobs)
+        for (i, case, _), result in zip(pending, results, strict=True):
+            if result.ok:
+                print(f'{case}\t{result.job.base_dir}', file=out)
+                ok += 1
+            else:
+                _report(err, i + 1, case, result.error)
+                failed += 1
+    return ok, failed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='tencim1d-mesh',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('input', nargs='?', default='-', help='Arquivo de casos, ou - para a entrada padrão.')
+    parser.add_argument('-f', '--format', choices=FORMATS, help='Formato da entrada (padrão: pela extensão).')
+    parser.add_argument('-o', '--output-dir', type=Path, default=Path('.'), help='Diretório dos casos.')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Casos gerados em paralelo.')
+    parser.add_argument('--backend', choices=('thread', 'process'), help='Tipo de pool com --jobs > 1.')
+    parser.add_argument('--decimal-places', type=int, default=8)
+    parser.add_argument('--case-format', default='{:06d}', help='Nome do diretório pelo número da linha.')
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error('--jobs precisa ser pelo menos 1')
+
+    start = time.perf_counter()
+    try:
+        fp = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8', newline='')
+    except OSError as e:
+        print(f'tencim1d-mesh: {e}', file=sys.stderr)
+        return 2
+
+    try:
+        # a primeira linha decide o formato da entrada padrão e volta para o início da leitura
+        first = fp.readline()
+        fmt = args.format or detect_format(args.input, first)
+        ok, failed = run(
+            read_rows(chain([first], fp), fmt),
+            args.output_dir,
+            decimal_places=args.decimal_places,
+            jobs=args.jobs,
+            backend=args.backend,
+            case_fmt=args.case_format,
+        )
+    except (OSError, ValueError) as e:
+        # erro de leitura da entrada (arquivo, CSV ou JSON), não de um caso
+        print(f'tencim1d-mesh: {e}', file=sys.stderr)
+        return 2
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+
+    print(f'{ok} casos gerados, {failed} com erro em {time.perf_counter() - start:.2f} s', file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Cliente do servidor de malhas (server.py), com os mesmos resultados de mesh.make_mesh.
+
+    from tencim1d_mesh_generator.client import make_mesh
+
+    make_mesh(0.15, 0.17, 0.21, Path('caso'))  # gerada no servidor, se ele estiver rodando
+
+Sem servidor no socket (arquivo ausente ou conexão recusada) as funções geram a malha no
+próprio processo, então trocar mesh.make_mesh por client.make_mesh não muda o resultado.
+O socket é o da variável TENCIM1D_MESH_SOCKET ou, sem ela, tencim1d-mesh.sock em
+$XDG_RUNTIME_DIR ou, sem ele, mesh.sock num diretório tencim1d-mesh-<uid> (modo 0700) no
+diretório temporário. O cliente só conversa com um servidor do próprio usuário: o dono
+do socket e, no Linux, o do processo do outro lado (SO_PEERCRED) precisam ser o usuário
+atual; senão a malha é gerada no próprio processo.
+"""
+
+import base64
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tencim1d_mesh_generator import errors
+from tencim1d_mesh_generator.standoff import StandoffABC, StandoffFlexible, StandoffRatio, StandoffRigid
+
+if TYPE_CHECKING:
+    from tencim1d_mesh_generator.data import MeshData
+
+SOCKET_ENV = 'TENCIM1D_MESH_SOCKET'
+STANDOFF_KINDS = {StandoffRigid: 'rigid', StandoffFlexible: 'flexible', StandoffRatio: 'ratio'}
+ERRORS = {
+    cls.__name__: cls
+    for cls in (
+        errors.MeshDiameterInvalid,
+        errors.StandoffRatioInvalid,
+        errors.StandoffInfosInvalid,
+        errors.MeshFormatInvalid,
+        ValueError,
+        ZeroDivisionError,
+    )
+}
+
+
+def default_socket() -> Path:
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return Path(path)
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / 'tencim1d-mesh.sock'
+    return Path(tempfile.gettempdir()) / f'tencim1d-mesh-{os.getuid()}' / 'mesh.sock'
+
+
+def check_socket_owner(path: Path):
+    """PermissionError se path não for um socket do usuário atual (o link simbólico não é seguido)."""
+    st = os.lstat(path)
+    if not stat.S_ISSOCK(st.st_mode):
+        raise PermissionError(f'{path} não é um socket')
+    if st.st_uid != os.getuid():
+        raise PermissionError(f'O socket {path} pertence a outro usuário (uid {st.st_uid})')
+
+
+def peer_uid(sock: socket.socket) -> int | None:
+    """uid do processo do outro lado de um socket Unix conectado (None fora do Linux)."""
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    _, uid, _ = struct.unpack('3i', creds)
+    return uid
+
+
+class MeshClient:
+    """
+    Conexão com o servidor; FileNotFoundError ou ConnectionRefusedError se ele não estiver
+    rodando e PermissionError se o socket ou o servidor forem de outro usuário.
+    """
+
+    def __init__(self, path: Path | None = None, timeout: float | None = 60.0):
+        self.path = default_socket() if path is None else Path(path)
+        check_socket_owner(self.path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.settimeout(timeout)
+            self._sock.connect(str(self.path))
+            uid = peer_uid(self._sock)
+            if uid is not None and uid != os.getuid():
+                raise PermissionError(f'O servidor em {self.path} roda com outro usuário (uid {uid})')
+        except BaseException:
+            self._sock.close()
+            raise
+        self._file = self._sock.makefile('rwb')
+        self._id = 0
+
+    def __enter__(self) -> 'MeshClient':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    def call(self, request: dict[str, Any]) -> dict[str, Any]:
+        self._id += 1
+        self._file.write(json.dumps({'id': self._id, **request}).encode('utf-8') + b'\n')
+        self._file.flush()
+
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError(f'O servidor em {self.path} fechou a conexão')
+        reply = json.loads(line)
+        if 'error' in reply:
+            raise ValueError(reply['error'])
+        return reply
+
+    def generate(self, cases: list[dict[str, Any]], reply: str = 'path') -> list[dict[str, Any]]:
+        """Resultados dos casos (campos da linha de comando), um por caso, como o servidor devolve."""
+        return self.call({'op': 'generate', 'reply': reply, 'cases': cases})['results']
+
+    def stats(self) -> dict[str, Any]:
+        return self.call({'op': 'stats'})['stats']
+
+
+def encode_case(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    standoff: StandoffABC | None = None,
+    decimal_places: int = 8,
+) -> dict[str, Any] | None:
+    """Caso no formato do servidor, ou None se o standoff não puder ser enviado."""
+    case = {
+        'casing_internal_diameter': casing_internal_diameter,
+        'casing_external_diameter': casing_external_diameter,
+        'well_diameter': well_diameter,
+        'decimal_places': decimal_places,
+    }
+    if standoff is None:
+        return case
+
+    kind = STANDOFF_KINDS.get(type(standoff))
+    params = dict(vars(standoff))
+    # o servidor monta o standoff com os diâmetros do caso
+    same_diameters = (params.pop('casing_external_diameter'), params.pop('well_diameter')) == (
+        casing_external_diameter,
+        well_diameter,
+    )
+    if kind is None or not same_diameters or not all(isinstance(v, int | float) for v in params.values()):
+        return None
+    return case | {'standoff': kind, **params}
+
+
+def raise_for(result: dict[str, Any]):
+    """Relança o erro de um caso com a classe original (MeshDiameterInvalid, ...)."""
+    if not result['ok']:
+        raise ERRORS.get(result['error'], errors.MeshGenerateError)(result['message'])
+
+
+def _remote(case: dict[str, Any] | None, reply: str, socket_path: Path | None) -> dict[str, Any] | None:
+    """Resultado do caso no servidor, ou None se não houver um servidor do usuário."""
+    if case is None:
+        return None
+    try:
+        client = MeshClient(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError, PermissionError):
+        return None
+    with client:
+        result = client.generate([case], reply)[0]
+    raise_for(result)
+    return result
+
+
+def make_mesh(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    base_dir: Path,
+    standoff: StandoffABC | None = None,
+    decimal_places: int = 8,
+    socket_path: Path | None = None,
+):
+    """mesh.make_mesh no servidor; sem servidor, no próprio processo."""
+    case = encode_case(casing_internal_diameter, casing_external_diameter, well_diameter, standoff, decimal_places)
+    if case is not None:
+        case['base_dir'] = str(Path(base_dir).absolute())
+    if _remote(case, 'path', socket_path) is not None:
+        return
+
+    from tencim1d_mesh_generator.mesh import make_mesh as local_make_mesh
+
+    local_make_mesh(
+        casing_internal_diameter,
+        casing_external_diameter,
+        well_diameter,
+        Path(base_dir),
+        standoff=standoff,
+        decimal_places=decimal_places,
+    )
+
+
+def mesh_data(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    standoff: StandoffABC | None = None,
+    decimal_places: int = 8,
+    socket_path: Path | None = None,
+) -> dict[str, 'MeshData']:
+    """
+    Malhas do caso em memória, pelo nome do arquivo que make_mesh escreveria (mesh.dat ou
+    mesh_thick.dat e mesh_thin.dat), sem passar pelo disco.
+    """
+    case = encode_case(casing_internal_diameter, casing_external_diameter, well_diameter, standoff, decimal_places)
+    result = _remote(case, 'inline', socket_path)
+    if result is not None:
+        from tencim1d_mesh_generator.binary import from_bytes
+
+        return {name: from_bytes(base64.b64decode(data), name=name) for name, data in result['meshes'].items()}
+
+    from tencim1d_mesh_generator.spec import case_specs, generate_mesh
+
+    specs = case_specs(casing_internal_diameter, casing_external_diameter, well_diameter, standoff, decimal_places)
+    return {name: generate_mesh(spec) for name, spec in specs.items()}
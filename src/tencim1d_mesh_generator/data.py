@@ -0,0 +1,59 @@
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tencim1d_mesh_generator.connectivity import SegmentConnectivity
+from tencim1d_mesh_generator.writer import write_dat
+
+if TYPE_CHECKING:
+    from tencim1d_mesh_generator.mesh import Mesh
+
+
+def readonly_x(x: array | memoryview) -> memoryview:
+    return memoryview(x).toreadonly()
+
+
+def readonly_conn(conn: array | memoryview) -> memoryview:
+    """Buffer int32 achatado -> memoryview somente leitura de shape (n_el, 3)."""
+    view = memoryview(conn)
+    if view.ndim == 1:
+        view = view.cast('B').cast('i', (len(view) // 3, 3))
+    return view.toreadonly()
+
+
+@dataclass(frozen=True, slots=True)
+class MeshData:
+    """
+    Malha gerada, imutável e compartilhável.
+
+    x é um memoryview float64 somente leitura e conn um memoryview int32 somente
+    leitura de shape (n_el, 3); ambos podem ser passados para numpy.asarray sem cópia.
+    Quando a malha vem do gerador, connectivity guarda os segmentos, usados na escrita.
+    """
+
+    x: memoryview
+    conn: memoryview
+    decimal_places: int = 8
+    connectivity: SegmentConnectivity | None = None
+
+    @classmethod
+    def from_mesh(cls, mesh: 'Mesh') -> 'MeshData':
+        return cls(
+            x=readonly_x(mesh.x_array),
+            conn=readonly_conn(mesh.conn_array),
+            decimal_places=mesh.decimal_places,
+            connectivity=mesh.connectivity,
+        )
+
+    @property
+    def nodes_number(self) -> int:
+        return self.x.shape[0]
+
+    @property
+    def elements_number(self) -> int:
+        return self.conn.shape[0]
+
+    def write(self, path: Path, level: int | None = None):
+        conn = self.connectivity if self.connectivity is not None else self.conn.tolist()
+        write_dat(path, self.x, conn, self.decimal_places, level=level)
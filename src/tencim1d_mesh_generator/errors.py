@@ -8,3 +8,9 @@ class StandoffRatioInvalid(MeshGenerateError): ...
 
 
 class StandoffInfosInvalid(MeshGenerateError): ...
+
+
+class MeshFormatInvalid(MeshGenerateError): ...
+
+
+class MeshNotGenerated(MeshGenerateError): ...
@@ -1,14 +1,46 @@
+import copy
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from contextvars import copy_context
 from enum import StrEnum
 from functools import cached_property
+from itertools import chain
 from pathlib import Path
-
-from tencim1d_mesh_generator.errors import MeshDiameterInvalid
+from typing import Any
+
+from tencim1d_mesh_generator.binary import write_binary
+from tencim1d_mesh_generator.cache import MeshCache
+from tencim1d_mesh_generator.compress import with_compression
+from tencim1d_mesh_generator.connectivity import SegmentConnectivity
+from tencim1d_mesh_generator.coor import geometric_denominator, layer
+from tencim1d_mesh_generator.errors import MeshDiameterInvalid, MeshNotGenerated
+from tencim1d_mesh_generator.profiling import MeshProfiler, MeshStats, count, phase
 from tencim1d_mesh_generator.standoff import StandoffABC
+from tencim1d_mesh_generator.writer import CHUNK_SIZE, write_dat, write_dat_parallel
 
 type Coor = tuple[float]
 type Connectivity = tuple[tuple[int, int, int]]
 
 
+def validate_diameters(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    formation_diamenter: float = 60.0,
+) -> bool:
+    """MeshDiameterInvalid se os diâmetros não forem crescentes, do interno do revestimento à formação."""
+    if not (casing_internal_diameter < casing_external_diameter < well_diameter < formation_diamenter):
+        raise MeshDiameterInvalid(
+            'Diametro precisa seguir a relação '
+            'casing_internal_diameter < casing_external_diameter < well_diameter < formation_diamenter. '
+            'Foi passado: '
+            f'{casing_internal_diameter=}, {casing_external_diameter=}, {well_diameter=} e {formation_diamenter=}'
+        )
+    return True
+
+
 class ThicknessEnum(StrEnum):
     THICK = 'THICK'
     THIN = 'THIN'
@@ -21,6 +53,9 @@ class Mesh:
 
     formation_ratio = 1.1
 
+    # 'auto', 'numpy' ou 'python', veja tencim1d_mesh_generator.coor
+    backend = 'auto'
+
     def __init__(
         self,
         casing_internal_diameter: float,
@@ -35,16 +70,11 @@ class Mesh:
         self.formation_diamenter = formation_diamenter
         self.decimal_places = decimal_places
 
-        if not (casing_internal_diameter < casing_external_diameter < well_diameter < formation_diamenter):
-            raise MeshDiameterInvalid(
-                'Diametro precisa seguir a relação '
-                'casing_internal_diameter < casing_external_diameter < well_diameter < formation_diamenter. '
-                'Foi passado: '
-                f'{casing_internal_diameter=}, {casing_external_diameter=}, {well_diameter=} e {formation_diamenter=}'
-            )
+        validate_diameters(casing_internal_diameter, casing_external_diameter, well_diameter, formation_diamenter)
 
-        self._x = (0.0,)
-        self._conn = ((0, 0, 0),)
+        # Coordenadas em float64 contíguo e conectividade implícita por segmentos
+        self._x = array('d', (0.0,))
+        self._conn = SegmentConnectivity(())
 
     @cached_property
     def internal_radius(self) -> float:
@@ -87,7 +117,7 @@ class Mesh:
         return (
             self.formation_thickness
             * (self.formation_ratio - 1.0)
-            / (self.formation_ratio**self.formation_elements_number - 1.0)
+            / geometric_denominator(self.formation_elements_number, self.formation_ratio)
         )
 
     @cached_property
@@ -96,102 +126,162 @@ class Mesh:
 
     @property
     def x(self) -> Coor:
-        return self._x
+        return tuple(self._x)
 
     @property
     def conn(self) -> Connectivity:
+        return tuple(self._conn)
+
+    @property
+    def connectivity(self) -> SegmentConnectivity:
         return self._conn
 
+    @property
+    def x_array(self) -> array:
+        """Coordenadas sem cópia: suporta o buffer protocol (ex.: numpy.asarray(mesh.x_array))."""
+        return self._x
+
+    @property
+    def conn_array(self) -> memoryview:
+        """
+        Conectividade como um memoryview int32 somente leitura de shape (n_el, 3).
+
+        O buffer é montado no primeiro acesso e depois compartilhado por todas as views (e por
+        MeshData), por isso não pode ser alterado por elas.
+
+        Antes de generate() a conectividade é vazia (conn é ()) e um memoryview não pode ter
+        shape (0, 3), então MeshNotGenerated é lançado.
+        """
+        if not self._conn:
+            raise MeshNotGenerated('A conectividade ainda não foi gerada, chame generate() antes de usar conn_array')
+        return memoryview(self._conn.to_array()).cast('B').cast('i', (len(self._conn), 3)).toreadonly()
+
     @cached_property
     def effective_well_radius(self) -> float:
         return self.well_radius
 
+    def params(self) -> dict[str, Any]:
+        """Todos os parâmetros que definem a malha gerada."""
+        return {
+            'type': type(self).__name__,
+            'casing_internal_diameter': self.casing_internal_diameter,
+            'casing_external_diameter': self.casing_external_diameter,
+            'well_diameter': self.well_diameter,
+            'formation_diamenter': self.formation_diamenter,
+            'decimal_places': self.decimal_places,
+            'casing_elements_number': self.casing_elements_number,
+            'sheath_elements_number': self.sheath_elements_number,
+            'formation_elements_number': self.formation_elements_number,
+            'formation_ratio': self.formation_ratio,
+        }
+
     def element_size_formation(self, element_number_pos: int) -> float:
         """O tamanho do elemento é uma PG"""
         if not 0 < element_number_pos < self.formation_elements_number:
             raise Exception('Numero de elemento invalido')
         return self.initial_element_size_formation * self.formation_ratio ** (element_number_pos - 1)
 
+    def _coor_layers(self) -> tuple[tuple[float, float, float | None, int], ...]:
+        """(r0, r1, razão da PG ou None para camada uniforme, número de elementos)"""
+        return (
+            # casing
+            (self.internal_radius, self.pipe_radius, None, self.casing_elements_number),
+            # Interface Steel - sheath + Sheath
+            (self.pipe_radius, self.effective_well_radius, None, self.sheath_elements_number),
+            # Interface sheath - Formantion + Formantion
+            (self.effective_well_radius, self.formation_radius, self.formation_ratio, self.formation_elements_number),
+        )
+
     def generate_coor(self):
-        # casing
-        x = [self.internal_radius]
-        for node, _ in enumerate(
-            range(1, self.casing_elements_number),
-            start=1,
-        ):
-            x.append(x[node - 1] + self.element_size_casing)
-        x.append(self.pipe_radius)
-
-        # Interface Steel - sheath
-        x.append(self.pipe_radius)
-
-        # Sheath
-        for node, _ in enumerate(
-            range(1, self.sheath_elements_number),
-            start=self.casing_elements_number + 2,
-        ):
-            x.append(x[node - 1] + self.element_size_sheath)
-
-        # Last Node Well
-        x.append(self.effective_well_radius)
-        # Interface sheath - Formantion
-        x.append(self.effective_well_radius)
-
-        # Formantion
-        for node, el_formation in enumerate(
-            range(1, self.formation_elements_number),
-            start=self.casing_elements_number + self.sheath_elements_number + 3,
-        ):
-            x.append(x[node - 1] + self.element_size_formation(el_formation))
-        x.append(self.formation_radius)
-
-        self._x = tuple(x)
+        with phase('generate_coor', self.element_total_number):
+            x = array('d')
+            for r0, r1, q, n in self._coor_layers():
+                x.extend(layer(r0, r1, n, q, self.backend))
+            self._x = x
+
+    def iter_coor(self, chunk_size: int = CHUNK_SIZE) -> Iterator[list[float]]:
+        """Coordenadas em chunks de no máximo chunk_size nós, sem guardar a malha inteira."""
+        for r0, r1, q, n in self._coor_layers():
+            for start in range(0, n + 1, chunk_size):
+                yield layer(r0, r1, n, q, self.backend, start, start + chunk_size, cached=False)
+
+    def iter_conn(self, chunk_size: int = CHUNK_SIZE) -> Iterator[array]:
+        """Conectividade em buffers int32 achatados de no máximo chunk_size elementos."""
+        yield from generate_connectivity(
+            self.casing_elements_number,
+            self.sheath_elements_number,
+            self.formation_elements_number,
+        ).chunks(chunk_size)
 
     def generate_connectivity(self):
-        conn, el = [], 0
-
-        # Casing
-        for _ in range(self.casing_elements_number):
-            el += 1
-            conn.append((el, el + 1, 1))
-
-        # Interface Casing - Sheath
-        el += 1
-        conn.append((el, el + 1, 2))
-
-        # Sheath
-        for _ in range(self.sheath_elements_number):
-            el += 1
-            conn.append((el, el + 1, 3))
-
-        # Interface Sheath - Formation
-        el += 1
-        conn.append((el, el + 1, 2))
-
-        # Formation
-        for _ in range(self.formation_elements_number):
-            el += 1
-            conn.append((el, el + 1, 4))
+        with phase('generate_connectivity', self.element_total_number):
+            self._conn = generate_connectivity(
+                self.casing_elements_number,
+                self.sheath_elements_number,
+                self.formation_elements_number,
+            )
 
-        self._conn = tuple(conn)
+    def generate_sharing_casing(self, other: 'Mesh'):
+        """Gera reaproveitando o bloco do casing e a conectividade de uma malha com o mesmo casing."""
+        with phase('generate_coor', self.sheath_elements_number + self.formation_elements_number):
+            x = other.x_array[: self.casing_elements_number + 1]
+            for r0, r1, q, n in self._coor_layers()[1:]:
+                x.extend(layer(r0, r1, n, q, self.backend))
+            self._x = x
+        self._conn = other.connectivity
 
     def generate(self):
         self.generate_coor()
         self.generate_connectivity()
 
-    def write(self, path: Path):
-        with open(path, mode='w', encoding='utf-8') as fp:
-            fp.write('coordinates\n')
-            for node, x in enumerate(self.x, start=1):
-                fp.write(f'{node} {x:10.{self.decimal_places}f}\n')
-            fp.write('end coordinates\n')
+    def write(self, path: Path, level: int | None = None):
+        """Escreve o .dat; com extensão .gz, .xz ou .zst o arquivo é comprimido com o nível level."""
+        write_dat(path, self._x, self._conn, self.decimal_places, level=level)
+
+    def write_streaming(self, path: Path, chunk_size: int = CHUNK_SIZE, level: int | None = None):
+        """
+        Escreve a malha sem gerar x e conn antes: memória O(chunk_size) em vez de O(n_nodes).
+        """
+        conn = generate_connectivity(
+            self.casing_elements_number,
+            self.sheath_elements_number,
+            self.formation_elements_number,
+        )
+        x = chain.from_iterable(self.iter_coor(chunk_size))
+        write_dat(path, x, conn, self.decimal_places, chunk_size, level)
+
+    def write_binary(self, path: Path):
+        """Escreve a malha no formato binário .t1d (ver binary.py)."""
+        write_binary(path, self._x, self._conn, self.decimal_places)
+
+    def write_parallel(
+        self,
+        path: Path,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        level: int | None = None,
+    ):
+        write_dat_parallel(
+            path,
+            self._x,
+            self._conn,
+            self.decimal_places,
+            max_workers=max_workers,
+            use_processes=use_processes,
+            level=level,
+        )
 
-            fp.write('bar2\n')
-            for el, conn in enumerate(self.conn, start=1):
-                fp.write(f'{el} {conn[0]:4} {conn[1]:4} {conn[2]:4}\n')
-            fp.write('end bar2\n')
 
-            fp.write('return\n')
+def generate_connectivity(
+    casing_elements_number: int,
+    sheath_elements_number: int,
+    formation_elements_number: int,
+) -> SegmentConnectivity:
+    return SegmentConnectivity.from_layers(
+        casing_elements_number,
+        sheath_elements_number,
+        formation_elements_number,
+    )
 
 
 class MeshWithStandoff(Mesh):
@@ -239,6 +329,13 @@ class MeshWithStandoff(Mesh):
 
         return self.well_radius + st
 
+    def params(self) -> dict[str, Any]:
+        return {
+            **super().params(),
+            'thickness': str(self.thickness),
+            'standoff': self.standoff.infos(),
+        }
+
     @cached_property
     def effective_sheath_thickness(self) -> float:
         return self.effective_well_radius - self.pipe_radius
@@ -251,6 +348,77 @@ class MeshWithStandoff(Mesh):
     def element_size_sheath(self) -> float:
         return self.effective_sheath_thickness / self.sheath_elements_number
 
+    # cached_property que dependem do lado (thickness)
+    _thickness_dependent = (
+        'effective_well_radius',
+        'effective_sheath_thickness',
+        'formation_thickness',
+        'element_size_sheath',
+        'initial_element_size_formation',
+    )
+
+    def with_thickness(self, thickness: str) -> 'MeshWithStandoff':
+        """
+        Mesma malha para o outro lado, sem validar de novo nem recalcular os raios
+        e espessuras que não dependem do lado.
+        """
+        other = copy.copy(self)
+        other.thickness = thickness
+        for name in self._thickness_dependent:
+            other.__dict__.pop(name, None)
+        return other
+
+
+def generate_standoff_pair(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    standoff: StandoffABC,
+    formation_diamenter: float = 60.0,
+    decimal_places: int = 8,
+) -> tuple[MeshWithStandoff, MeshWithStandoff]:
+    """
+    Gera as malhas (espessa, fina) de um standoff numa única passada: a validação, os
+    raios, o bloco do casing e a conectividade são calculados uma vez e compartilhados;
+    só a bainha e a formação dependem de effective_well_radius.
+    """
+    thick = MeshWithStandoff(
+        casing_internal_diameter=casing_internal_diameter,
+        casing_external_diameter=casing_external_diameter,
+        well_diameter=well_diameter,
+        standoff=standoff,
+        thickness=ThicknessEnum.THICK,
+        formation_diamenter=formation_diamenter,
+        decimal_places=decimal_places,
+    )
+    thick.generate()
+
+    thin = thick.with_thickness(ThicknessEnum.THIN)
+    thin.generate_sharing_casing(thick)
+
+    return thick, thin
+
+
+def _write_all(meshes: Iterable[tuple[Mesh, Path]], concurrent: bool, level: int | None = None):
+    if concurrent:
+        with ThreadPoolExecutor() as pool:
+            # cada tarefa roda numa cópia do contexto, para herdar o profiler ativo
+            futures = [pool.submit(copy_context().run, mesh.write, path=path, level=level) for mesh, path in meshes]
+            for future in futures:
+                future.result()
+    else:
+        for mesh, path in meshes:
+            mesh.write(path=path, level=level)
+
+
+def _generate_and_write(mesh: Mesh, path: Path, cache: MeshCache | None, level: int | None = None):
+    if cache is None:
+        mesh.generate()
+        mesh.write(path=path, level=level)
+        count('meshes')
+    else:
+        cache.write(mesh, path, level)
+
 
 def make_mesh(
     casing_internal_diameter: float,
@@ -259,41 +427,86 @@ def make_mesh(
     base_dir: Path,
     standoff: StandoffABC | None = None,
     decimal_places: int = 8,
+    cache: MeshCache | None = None,
+    concurrent: bool = False,
+    compression: str | None = None,
+    level: int | None = None,
+    profile: bool = False,
+) -> MeshStats | None:
+    """
+    Gera e escreve as malhas em base_dir (mesh.dat, ou mesh_thick.dat e mesh_thin.dat).
+
+    compression ('gz', 'xz' ou 'zst') acrescenta a extensão aos arquivos, que são escritos
+    comprimidos com o nível level (padrão em compress.DEFAULT_LEVELS).
+
+    Com profile=True retorna as estatísticas por fase da chamada (ver profiling.py).
+    """
+    profiler = MeshProfiler() if profile else nullcontext()
+    with profiler:
+        _make_mesh(
+            casing_internal_diameter,
+            casing_external_diameter,
+            well_diameter,
+            base_dir,
+            standoff,
+            decimal_places,
+            cache,
+            concurrent,
+            compression,
+            level,
+        )
+    return profiler.stats if profile else None
+
+
+def _make_mesh(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    base_dir: Path,
+    standoff: StandoffABC | None,
+    decimal_places: int,
+    cache: MeshCache | None,
+    concurrent: bool,
+    compression: str | None,
+    level: int | None,
 ):
     if not base_dir.exists():
         base_dir.mkdir(exist_ok=True)
 
     if standoff:
-        standoff.validate_infos()
-
-        mesh_with_standoff = MeshWithStandoff(
-            casing_internal_diameter=casing_internal_diameter,
-            well_diameter=well_diameter,
-            casing_external_diameter=casing_external_diameter,
-            standoff=standoff,
-            thickness=ThicknessEnum.THICK,
-            decimal_places=decimal_places,
-        )
-        mesh_with_standoff.generate()
-        mesh_with_standoff.write(path=base_dir / 'mesh_thick.dat')
-
-        mesh_with_standoff = MeshWithStandoff(
-            casing_internal_diameter=casing_internal_diameter,
-            well_diameter=well_diameter,
-            casing_external_diameter=casing_external_diameter,
-            standoff=standoff,
-            thickness=ThicknessEnum.THIN,
-            decimal_places=decimal_places,
-        )
-        mesh_with_standoff.generate()
-        mesh_with_standoff.write(path=base_dir / 'mesh_thin.dat')
+        with phase('validate'):
+            standoff.validate_infos()
+
+        paths = tuple(with_compression(base_dir / name, compression) for name in ('mesh_thick.dat', 'mesh_thin.dat'))
+
+        if cache is None:
+            meshes = generate_standoff_pair(
+                casing_internal_diameter=casing_internal_diameter,
+                casing_external_diameter=casing_external_diameter,
+                well_diameter=well_diameter,
+                standoff=standoff,
+                decimal_places=decimal_places,
+            )
+            _write_all(zip(meshes, paths, strict=True), concurrent, level)
+            count('meshes', 2)
+        else:
+            thick = MeshWithStandoff(
+                casing_internal_diameter=casing_internal_diameter,
+                well_diameter=well_diameter,
+                casing_external_diameter=casing_external_diameter,
+                standoff=standoff,
+                thickness=ThicknessEnum.THICK,
+                decimal_places=decimal_places,
+            )
+            for mesh, path in zip((thick, thick.with_thickness(ThicknessEnum.THIN)), paths, strict=True):
+                cache.write(mesh, path, level)
     else:
-        mesh = Mesh(
-            casing_internal_diameter=casing_internal_diameter,
-            well_diameter=well_diameter,
-            casing_external_diameter=casing_external_diameter,
-            decimal_places=decimal_places,
-        )
+        with phase('validate'):
+            mesh = Mesh(
+                casing_internal_diameter=casing_internal_diameter,
+                well_diameter=well_diameter,
+                casing_external_diameter=casing_external_diameter,
+                decimal_places=decimal_places,
+            )
 
-        mesh.generate()
-        mesh.write(path=base_dir / 'mesh.dat')
+        _generate_and_write(mesh, with_compression(base_dir / 'mesh.dat', compression), cache, level)
@@ -0,0 +1,220 @@
+"""
+Métricas de sweeps longos, exportadas para arquivos locais: texto do Prometheus (para o
+textfile collector do node exporter) e um snapshot JSON.
+
+    metrics = SweepMetrics()
+    with MetricsExporter(metrics, prometheus_path='/var/lib/node_exporter/tencim1d.prom', interval=15):
+        run_sweep(jobs, metrics=metrics)
+
+Os arquivos são escritos num temporário e renomeados, então o coletor nunca lê um
+arquivo pela metade. O exportador escreve a cada interval segundos e uma última vez ao sair.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from tencim1d_mesh_generator.profiling import DEFAULT_BUCKETS, Histogram, MeshStats
+from tencim1d_mesh_generator.writer import atomic_path
+
+PREFIX = 'tencim1d_mesh'
+
+
+class SweepMetrics:
+    """
+    Contadores e histogramas acumulados dos jobs de um ou mais sweeps.
+
+    Os contadores de malhas, cache e bytes vêm das estatísticas de profiling dos jobs;
+    as falhas são contadas pela classe do erro (MeshDiameterInvalid, StandoffRatioInvalid, ...).
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.started = time.time()
+        self.jobs_expected = 0
+        self.jobs = 0
+        self.failures: dict[str, int] = {}
+        self.stats = MeshStats()
+        self.job_seconds = Histogram(buckets)
+        self.phase_seconds: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def expect(self, n: int):
+        """Soma n aos jobs previstos, para acompanhar o progresso."""
+        with self._lock:
+            self.jobs_expected += n
+
+    def observe(self, elapsed: float, stats: MeshStats | None = None, error: Exception | None = None):
+        """Registra um job concluído."""
+        with self._lock:
+            self.jobs += 1
+            self.job_seconds.observe(elapsed)
+            if error is not None:
+                name = type(error).__name__
+                self.failures[name] = self.failures.get(name, 0) + 1
+            if stats is not None:
+                self.stats.merge(stats)
+                for name, phase in stats.phases.items():
+                    histogram = self.phase_seconds.get(name)
+                    if histogram is None:
+                        histogram = self.phase_seconds[name] = Histogram(self.buckets)
+                    histogram.observe(phase.wall)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counters = self.stats.counters
+            return {
+                'started': self.started,
+                'updated': time.time(),
+                'jobs_expected': self.jobs_expected,
+                'jobs': self.jobs,
+                'jobs_failed': sum(self.failures.values()),
+                'failures': dict(self.failures),
+                'meshes': counters.get('meshes', 0),
+                'cache_hits': counters.get('cache_hits', 0),
+                'cache_misses': counters.get('cache_misses', 0),
+                'bytes_written': self.stats.bytes_written,
+                'job_seconds': _histogram_dict(self.job_seconds),
+                'phase_seconds': {name: _histogram_dict(h) for name, h in self.phase_seconds.items()},
+            }
+
+    def to_prometheus(self) -> str:
+        """Métricas no formato de texto do Prometheus."""
+        s = self.snapshot()
+        lines = []
+        _metric(lines, 'sweep_start_time_seconds', 'gauge', 'Início da coleta (epoch).', [('', s['started'])])
+        _metric(lines, 'jobs_expected', 'gauge', 'Jobs previstos.', [('', s['jobs_expected'])])
+        _metric(lines, 'jobs_total', 'counter', 'Jobs concluídos, com ou sem erro.', [('', s['jobs'])])
+        _metric(
+            lines,
+            'job_failures_total',
+            'counter',
+            'Jobs com erro, pela classe do erro.',
+            [(_labels(error=name), n) for name, n in sorted(s['failures'].items())],
+        )
+        _metric(lines, 'meshes_total', 'counter', 'Malhas geradas e escritas.', [('', s['meshes'])])
+        _metric(lines, 'cache_hits_total', 'counter', 'Malhas copiadas do cache.', [('', s['cache_hits'])])
+        _metric(lines, 'cache_misses_total', 'counter', 'Malhas ausentes no cache.', [('', s['cache_misses'])])
+        _metric(lines, 'bytes_written_total', 'counter', 'Bytes de texto .dat escritos.', [('', s['bytes_written'])])
+
+        with self._lock:
+            job_seconds = _histogram_samples(self.job_seconds)
+            phase_seconds = [
+                sample
+                for name, histogram in sorted(self.phase_seconds.items())
+                for sample in _histogram_samples(histogram, phase=name)
+            ]
+        _metric(lines, 'job_seconds', 'histogram', 'Duração de cada job.', job_seconds)
+        _metric(lines, 'phase_seconds', 'histogram', 'Duração de cada fase por job.', phase_seconds)
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: Path):
+        _write_atomic(Path(path), self.to_prometheus())
+
+    def write_json(self, path: Path):
+        _write_atomic(Path(path), json.dumps(self.snapshot(), indent=2) + '\n')
+
+
+def _histogram_dict(histogram: Histogram) -> dict[str, Any]:
+    return {
+        'buckets': list(histogram.buckets),
+        'counts': list(histogram.counts),
+        'sum': histogram.total,
+        'count': histogram.count,
+    }
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _histogram_samples(histogram: Histogram, **labels: str) -> list[tuple[str, float]]:
+    les = [repr(float(b)) for b in histogram.buckets] + ['+Inf']
+    samples = [(f'_bucket{_labels(**labels, le=le)}', n) for le, n in zip(les, histogram.cumulative(), strict=True)]
+    samples.append((f'_sum{_labels(**labels)}', histogram.total))
+    samples.append((f'_count{_labels(**labels)}', histogram.count))
+    return samples
+
+
+def _metric(
+    lines: list[str],
+    name: str,
+    kind: str,
+    description: str,
+    samples: Iterable[tuple[str, float]],
+):
+    """Acrescenta HELP, TYPE e as amostras; cada amostra é (sufixo e rótulos, valor)."""
+    name = f'{PREFIX}_{name}'
+    lines.append(f'# HELP {name} {description}')
+    lines.append(f'# TYPE {name} {kind}')
+    for suffix, value in samples:
+        lines.append(f'{name}{suffix} {value}')
+
+
+def _write_atomic(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # temporário sem a extensão .prom, que o textfile collector ignora
+    with atomic_path(path, suffix='.tmp') as tmp:
+        tmp.write_text(text, encoding='utf-8')
+        os.chmod(tmp, 0o644)
+
+
+class MetricsExporter:
+    """Escreve as métricas em prometheus_path e/ou json_path a cada interval segundos, numa thread."""
+
+    def __init__(
+        self,
+        metrics: SweepMetrics,
+        prometheus_path: Path | None = None,
+        json_path: Path | None = None,
+        interval: float = 15.0,
+    ):
+        if interval <= 0:
+            raise ValueError(f'O intervalo deve ser positivo, recebido {interval}')
+        self.metrics = metrics
+        self.prometheus_path = None if prometheus_path is None else Path(prometheus_path)
+        self.json_path = None if json_path is None else Path(json_path)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> 'MetricsExporter':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def export(self):
+        if self.prometheus_path is not None:
+            self.metrics.write_prometheus(self.prometheus_path)
+        if self.json_path is not None:
+            self.metrics.write_json(self.json_path)
+
+    def start(self):
+        self._stop.clear()
+        self.export()
+        self._thread = threading.Thread(target=self._loop, name='tencim1d-metrics', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Para a thread e exporta os valores finais."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.export()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.export()
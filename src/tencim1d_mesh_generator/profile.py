@@ -0,0 +1,102 @@
+"""
+Malhas ao longo do poço a partir de um perfil (profundidade, standoff).
+
+Estações com razões de standoff próximas compartilham a mesma malha: a razão é
+quantizada em múltiplos de tolerance e cada razão distinta é gerada uma única vez,
+em base_dir/standoff_<razão>/mesh_thick.dat e mesh_thin.dat. O índice
+base_dir/profile.csv liga cada profundidade ao diretório da sua malha.
+"""
+
+import csv
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from tencim1d_mesh_generator.cache import MeshCache
+from tencim1d_mesh_generator.mesh import make_mesh
+from tencim1d_mesh_generator.standoff import RATIO_MAX, RATIO_MIN, StandoffABC, StandoffRatio, validate_standoff_ratio
+
+
+class Station(NamedTuple):
+    depth: float
+    ratio: float
+    quantized_ratio: float
+    directory: Path
+
+
+def quantize_ratio(ratio: float, tolerance: float) -> float:
+    """Múltiplo de tolerance mais próximo de ratio, limitado ao intervalo válido [0.01, 1.0]."""
+    if tolerance <= 0.0:
+        raise ValueError(f'A tolerância precisa ser positiva, valor obtido foi {tolerance}')
+
+    # round(..., 12) remove o ruído de ponto flutuante (ex.: 0.30000000000000004)
+    quantized = round(round(ratio / tolerance) * tolerance, 12)
+    return min(max(quantized, RATIO_MIN), RATIO_MAX)
+
+
+def _ratio(standoff: StandoffABC | float) -> float:
+    if isinstance(standoff, StandoffABC):
+        standoff.validate_infos()
+        return standoff.ratio
+
+    validate_standoff_ratio(standoff)
+    return standoff
+
+
+def make_mesh_profile(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    base_dir: Path,
+    stations: Iterable[tuple[float, StandoffABC | float]],
+    tolerance: float = 0.01,
+    decimal_places: int = 8,
+    cache: MeshCache | None = None,
+    concurrent: bool = False,
+) -> list[Station]:
+    """
+    Gera as malhas do perfil stations, pares (profundidade, standoff ou razão).
+
+    Retorna as estações na ordem de entrada; o número de malhas geradas é o número de
+    razões quantizadas distintas.
+    """
+    base_dir.mkdir(parents=True, exist_ok=True)
+
+    directories: dict[float, Path] = {}
+    profile = []
+    for depth, standoff in stations:
+        ratio = _ratio(standoff)
+        quantized = quantize_ratio(ratio, tolerance)
+
+        directory = directories.get(quantized)
+        if directory is None:
+            directory = directories[quantized] = base_dir / f'standoff_{quantized}'
+            make_mesh(
+                casing_internal_diameter,
+                casing_external_diameter,
+                well_diameter,
+                base_dir=directory,
+                standoff=StandoffRatio(casing_external_diameter, well_diameter, quantized),
+                decimal_places=decimal_places,
+                cache=cache,
+                concurrent=concurrent,
+            )
+
+        profile.append(Station(depth, ratio, quantized, directory))
+
+    with open(base_dir / 'profile.csv', mode='w', encoding='utf-8', newline='') as fp:
+        index = csv.writer(fp)
+        index.writerow(('depth', 'ratio', 'quantized_ratio', 'mesh_thick', 'mesh_thin'))
+        for station in profile:
+            directory = station.directory.relative_to(base_dir)
+            index.writerow(
+                (
+                    station.depth,
+                    station.ratio,
+                    station.quantized_ratio,
+                    (directory / 'mesh_thick.dat').as_posix(),
+                    (directory / 'mesh_thin.dat').as_posix(),
+                )
+            )
+
+    return profile
@@ -0,0 +1,203 @@
+"""
+Instrumentação opcional das fases da geração: validate, generate_coor,
+generate_connectivity, format (formatação do texto) e io (abertura, escrita e
+fechamento dos arquivos, e cópia do cache).
+
+    with MeshProfiler() as profiler:
+        make_mesh(...)
+    profiler.stats.phases['format'].wall
+
+Sem profiler ativo, phase() devolve um context manager nulo compartilhado: o custo de
+cada fase é uma leitura de ContextVar. Profilers podem ser aninhados; ao sair, o interno
+soma as suas estatísticas no externo. As threads criadas pelo pacote herdam o profiler.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from itertools import accumulate
+from typing import Any
+
+DEFAULT_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+_current: ContextVar['MeshProfiler | None'] = ContextVar('tencim1d_mesh_profiler', default=None)
+_NULL = nullcontext()
+
+
+@dataclass(slots=True)
+class PhaseStats:
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    nbytes: int = 0
+    elements: int = 0
+
+    def merge(self, other: 'PhaseStats'):
+        self.calls += other.calls
+        self.wall += other.wall
+        self.cpu += other.cpu
+        self.nbytes += other.nbytes
+        self.elements += other.elements
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseRecord:
+    """Uma execução de uma fase, passada aos hooks do profiler."""
+
+    name: str
+    wall: float
+    cpu: float
+    nbytes: int = 0
+    elements: int = 0
+
+
+@dataclass
+class MeshStats:
+    """
+    Estatísticas por fase e contadores (meshes, cache_hits, cache_misses).
+
+    meshes conta as malhas geradas e escritas com sucesso; acertos do cache não entram.
+
+    nbytes é o número de bytes de texto do .dat, antes de uma eventual compressão.
+    """
+
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def wall(self) -> float:
+        return sum(p.wall for p in self.phases.values())
+
+    @property
+    def cpu(self) -> float:
+        return sum(p.cpu for p in self.phases.values())
+
+    @property
+    def bytes_written(self) -> int:
+        return sum(p.nbytes for p in self.phases.values())
+
+    def add(self, record: PhaseRecord):
+        phase = self.phases.get(record.name)
+        if phase is None:
+            phase = self.phases[record.name] = PhaseStats()
+        phase.calls += 1
+        phase.wall += record.wall
+        phase.cpu += record.cpu
+        phase.nbytes += record.nbytes
+        phase.elements += record.elements
+
+    def merge(self, other: 'MeshStats'):
+        for name, stats in other.phases.items():
+            self.phases.setdefault(name, PhaseStats()).merge(stats)
+        for name, value in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'phases': {name: asdict(stats) for name, stats in self.phases.items()},
+            'counters': dict(self.counters),
+            'wall': self.wall,
+            'cpu': self.cpu,
+            'bytes_written': self.bytes_written,
+        }
+
+
+class MeshProfiler:
+    def __init__(self, hooks: Iterable[Callable[[PhaseRecord], None]] = ()):
+        self.stats = MeshStats()
+        self.hooks = tuple(hooks)
+        self._lock = threading.Lock()
+        self._parent: MeshProfiler | None = None
+        self._token = None
+
+    def __enter__(self) -> 'MeshProfiler':
+        self._parent = _current.get()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _current.reset(self._token)
+        if self._parent is not None:
+            self._parent.merge(self.stats)
+
+    def merge(self, stats: MeshStats):
+        with self._lock:
+            self.stats.merge(stats)
+
+    def record(self, record: PhaseRecord):
+        with self._lock:
+            self.stats.add(record)
+        for hook in self.hooks:
+            hook(record)
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.stats.counters[name] = self.stats.counters.get(name, 0) + n
+
+    @contextmanager
+    def phase(self, name: str, elements: int = 0, nbytes: int = 0) -> Iterator[None]:
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(PhaseRecord(name, time.perf_counter() - wall, time.thread_time() - cpu, nbytes, elements))
+
+
+def current_profiler() -> MeshProfiler | None:
+    return _current.get()
+
+
+def phase(name: str, elements: int = 0, nbytes: int = 0):
+    """Mede a fase name no profiler ativo; sem profiler não faz nada."""
+    profiler = _current.get()
+    if profiler is None:
+        return _NULL
+    return profiler.phase(name, elements, nbytes)
+
+
+def count(name: str, n: int = 1):
+    profiler = _current.get()
+    if profiler is not None:
+        profiler.count(name, n)
+
+
+@dataclass
+class Histogram:
+    """
+    counts[i] conta os valores em (buckets[i - 1], buckets[i]] e o último os acima de
+    buckets[-1]; cumulative() dá a forma acumulada (le) do Prometheus.
+    """
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            # o último contador é o bucket +Inf
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[int]:
+        return list(accumulate(self.counts))
+
+
+def aggregate(stats: Iterable[MeshStats], buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> dict[str, Histogram]:
+    """Histograma do tempo (wall) de cada fase, com uma observação por MeshStats (ex.: por job)."""
+    histograms: dict[str, Histogram] = {}
+    for s in stats:
+        for name, phase_stats in s.phases.items():
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = Histogram(buckets)
+            histogram.observe(phase_stats.wall)
+    return histograms
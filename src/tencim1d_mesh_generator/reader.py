@@ -0,0 +1,119 @@
+"""
+Leitura dos arquivos .dat do Tencim1D escritos por Mesh.write.
+
+O arquivo é mapeado em memória e cada seção (coordinates e bar2) é convertida em bloco,
+sem laço em Python por linha: as seções são quebradas em tokens de uma vez e convertidas
+com map(float/int) para arrays, ou com o NumPy para arquivos a partir de NUMPY_MIN_BYTES.
+A numeração dos nós e elementos é assumida sequencial (1, 2, ...), como o gerador escreve;
+só o último número de cada seção é conferido.
+"""
+
+import mmap
+import warnings
+from array import array
+from pathlib import Path
+
+from tencim1d_mesh_generator.backend import require_numpy, use_numpy
+from tencim1d_mesh_generator.compress import compression_of, read_bytes
+from tencim1d_mesh_generator.data import MeshData, readonly_conn, readonly_x
+from tencim1d_mesh_generator.errors import MeshFormatInvalid
+
+NUMPY_MIN_BYTES = 64 * 1024
+
+
+def _section(buffer: mmap.mmap | bytes, name: bytes, start: int, path: Path | str) -> tuple[bytes, int]:
+    """Conteúdo da seção name, entre a sua linha de abertura e 'end name', e a posição do fim."""
+    begin = buffer.find(name, start)
+    end = buffer.find(b'end ' + name, begin)
+    if begin == -1 or end == -1:
+        raise MeshFormatInvalid(f'Seção {name.decode()} não encontrada em {path}')
+    begin = buffer.find(b'\n', begin, end) + 1
+    return buffer[begin:end] if begin else b'', end + len(name) + 4
+
+
+def _check_last(tokens: list[bytes], columns: int, number: int, name: str, path: Path | str):
+    if len(tokens) != columns * number or (number and int(tokens[-columns]) != number):
+        raise MeshFormatInvalid(f'Seção {name} de {path} não tem {columns} colunas numeradas de 1 a {number}')
+
+
+def _decimal_places(tokens: list[bytes]) -> int:
+    if len(tokens) < 2:
+        return 0
+    _, _, decimals = tokens[1].partition(b'.')
+    return len(decimals.rstrip())
+
+
+def _parse_python(coordinates: bytes, bar2: bytes, path: Path | str):
+    tokens = coordinates.split()
+    _check_last(tokens, 2, len(tokens) // 2, 'coordinates', path)
+    x = array('d', map(float, tokens[1::2]))
+    decimal_places = _decimal_places(tokens)
+
+    tokens = bar2.split()
+    _check_last(tokens, 4, len(tokens) // 4, 'bar2', path)
+    conn = array('i', map(int, tokens))
+    # remove a numeração dos elementos
+    del conn[::4]
+
+    return x, conn, decimal_places
+
+
+def _parse_numpy(coordinates: bytes, bar2: bytes, path: Path | str):
+    np = require_numpy()
+
+    tokens = coordinates.split()
+    _check_last(tokens, 2, len(tokens) // 2, 'coordinates', path)
+    x = np.array(tokens[1::2], dtype=np.float64)
+    decimal_places = _decimal_places(tokens)
+
+    # Uma linha por elemento; fromstring com sep para no primeiro token inválido (com aviso).
+    elements = bar2.count(b'\n')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        values = np.fromstring(bar2, dtype=np.int32, sep=' ')
+    if values.size != 4 * elements or (elements and values[-4] != elements):
+        raise MeshFormatInvalid(f'Seção bar2 de {path} não tem 4 colunas numeradas de 1 a {elements}')
+    conn = np.ascontiguousarray(values.reshape(elements, 4)[:, 1:])
+
+    return x, conn, decimal_places
+
+
+def _parse(buffer: mmap.mmap | bytes, path: Path | str, backend: str) -> MeshData:
+    coordinates, end = _section(buffer, b'coordinates', 0, path)
+    bar2, end = _section(buffer, b'bar2', end, path)
+    if buffer.find(b'return', end) == -1:
+        raise MeshFormatInvalid(f'Arquivo {path} sem a linha return')
+
+    parse = _parse_numpy if use_numpy(len(buffer), NUMPY_MIN_BYTES, backend) else _parse_python
+    try:
+        x, conn, decimal_places = parse(coordinates, bar2, path)
+    except ValueError as e:
+        raise MeshFormatInvalid(f'Arquivo {path} com valor inválido: {e}') from e
+
+    return MeshData(x=readonly_x(x), conn=readonly_conn(conn), decimal_places=decimal_places)
+
+
+def read_mesh(path: Path, backend: str = 'auto') -> MeshData:
+    """
+    Lê um .dat (mesh.dat, mesh_thick.dat, ...) e retorna um MeshData, como o gerador.
+
+    backend é 'auto', 'numpy' ou 'python'; no 'auto' o NumPy é usado, se instalado, para
+    arquivos a partir de NUMPY_MIN_BYTES. Arquivos .gz, .xz e .zst são descomprimidos em
+    memória e então convertidos da mesma forma.
+    """
+    if compression_of(path) is not None:
+        return _parse(read_bytes(path), path, backend)
+
+    with open(path, mode='rb') as fp:
+        try:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise MeshFormatInvalid(f'Arquivo {path} vazio') from None
+
+    with buffer:
+        return _parse(buffer, path, backend)
+
+
+def parse_mesh(content: bytes, backend: str = 'auto', name: str = '<bytes>') -> MeshData:
+    """Como read_mesh, para o conteúdo de um .dat já em memória; name só aparece nos erros."""
+    return _parse(content, name, backend)
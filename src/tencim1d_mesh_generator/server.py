@@ -0,0 +1,209 @@
+"""
+Servidor de malhas num socket Unix, para processos que pedem poucas malhas por vez e não
+querem pagar a inicialização do interpretador e os imports em cada pedido.
+
+    python -m tencim1d_mesh_generator.server [--socket caminho]
+
+O protocolo é JSON por linha: cada linha recebida é um pedido e cada linha enviada a
+resposta, na mesma ordem. Um pedido gera vários casos:
+
+    {"id": 1, "op": "generate", "reply": "path", "cases": [{"cid": 0.15, "ced": 0.17, "wd": 0.21, "base_dir": "/c"}]}
+    {"id": 1, "results": [{"ok": true, "files": ["/c/mesh.dat"]}]}
+
+Os casos têm os campos da linha de comando (cli.py). Com reply "path" as malhas são
+escritas no diretório absoluto base_dir, como em make_mesh; com "inline" elas voltam em
+"meshes", pelo nome do arquivo, no formato .t1d em base64 (binary.from_bytes). Um caso com
+erro volta como {"ok": false, "error": "MeshDiameterInvalid", "message": "..."} sem afetar
+os outros; um pedido inválido volta como {"id": ..., "error": "..."}. {"op": "stats"}
+devolve o uso dos caches.
+
+O processo mantém quentes os templates de coordenadas (coor) e as malhas recentes
+(spec.generate_mesh, com o seu conteúdo .t1d), então pedidos repetidos não geram nada.
+O cliente está em client.py.
+"""
+
+import argparse
+import base64
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from tencim1d_mesh_generator.binary import to_bytes
+from tencim1d_mesh_generator.cli import case_params, normalize_row
+from tencim1d_mesh_generator.client import check_socket_owner, default_socket
+from tencim1d_mesh_generator.spec import MEMO_SIZE, MeshSpec, case_specs, generate_mesh
+
+REPLIES = ('path', 'inline')
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _inline(spec: MeshSpec) -> str:
+    data = generate_mesh(spec)
+    return base64.b64encode(to_bytes(data.x, data.conn, data.decimal_places)).decode('ascii')
+
+
+def generate_case(case: Any, reply: str = 'path') -> dict[str, Any]:
+    """Resultado de um caso do pedido: arquivos escritos, malhas inline ou o erro."""
+    try:
+        if not isinstance(case, dict):
+            raise ValueError(f'Cada caso precisa ser um objeto, recebido {case!r}')
+        row = normalize_row(case)
+        specs = case_specs(**case_params(row))
+
+        if reply == 'inline':
+            return {'ok': True, 'meshes': {name: _inline(spec) for name, spec in specs.items()}}
+
+        if 'base_dir' not in row:
+            raise ValueError('Campo base_dir ausente')
+        base_dir = Path(row['base_dir'])
+        if not base_dir.is_absolute():
+            raise ValueError(f'base_dir precisa ser absoluto, recebido {str(base_dir)!r}')
+        base_dir.mkdir(parents=True, exist_ok=True)
+
+        files = []
+        for name, spec in specs.items():
+            path = base_dir / name
+            generate_mesh(spec).write(path)
+            files.append(str(path))
+        return {'ok': True, 'files': files}
+    except Exception as e:
+        # qualquer erro (ex.: ZeroDivisionError de um standoff com la == 0) fica no caso
+        return {'ok': False, 'error': type(e).__name__, 'message': str(e)}
+
+
+def stats() -> dict[str, Any]:
+    return {
+        'meshes': generate_mesh.cache_info()._asdict(),
+        'inline': _inline.cache_info()._asdict(),
+    }
+
+
+def handle_request(line: bytes) -> dict[str, Any]:
+    """Resposta a uma linha do protocolo."""
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return {'id': None, 'error': f'JSON inválido: {e}'}
+    if not isinstance(request, dict):
+        return {'id': None, 'error': 'O pedido precisa ser um objeto'}
+
+    request_id = request.get('id')
+    match request.get('op', 'generate'):
+        case 'generate':
+            reply = request.get('reply', 'path')
+            cases = request.get('cases')
+            if reply not in REPLIES:
+                return {'id': request_id, 'error': f'reply {reply!r} inválido, use um de {list(REPLIES)}'}
+            if not isinstance(cases, list):
+                return {'id': request_id, 'error': 'O pedido precisa de uma lista cases'}
+            return {'id': request_id, 'results': [generate_case(case, reply) for case in cases]}
+        case 'stats':
+            return {'id': request_id, 'stats': stats()}
+        case op:
+            return {'id': request_id, 'error': f'Operação {op!r} inválida'}
+
+
+def _request_id(line: bytes) -> Any:
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    return request.get('id') if isinstance(request, dict) else None
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = handle_request(line)
+            except Exception as e:
+                # um pedido com erro inesperado não derruba a conexão nem os pedidos seguintes
+                reply = {'id': _request_id(line), 'error': f'{type(e).__name__}: {e}'}
+            self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+
+
+def _check_dir(path: Path):
+    """
+    PermissionError se outro usuário puder trocar arquivos em path: o diretório precisa ser
+    do usuário atual e sem escrita para grupo e outros, ou do root com sticky bit (ex.: /tmp).
+    """
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f'{path} não é um diretório')
+    writable = st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    if st.st_uid == os.getuid() and not writable:
+        return
+    if st.st_uid == 0 and (not writable or st.st_mode & stat.S_ISVTX):
+        return
+    raise PermissionError(f'O diretório {path} do socket pode ser alterado por outros usuários')
+
+
+def _remove_stale(path: Path):
+    """Remove o socket de um servidor do usuário que não está mais rodando; OSError se ele estiver."""
+    if not os.path.lexists(path):
+        return
+    check_socket_owner(path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except ConnectionRefusedError:
+            path.unlink()
+            return
+    raise OSError(f'Já existe um servidor de malhas em {path}')
+
+
+class MeshServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Servidor de malhas em path, uma thread por conexão.
+
+    O diretório de path é criado com modo 0700 e o socket com 0600: só o usuário conecta.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path | None = None):
+        self.path = default_socket() if path is None else Path(path)
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_dir(self.path.parent)
+        _remove_stale(self.path)
+        super().__init__(str(self.path), _Handler)
+
+    def server_bind(self):
+        # o socket já nasce com 0600, antes do listen
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description='Servidor de malhas num socket Unix.')
+    parser.add_argument('--socket', type=Path, default=None, help=f'Caminho do socket (padrão: {default_socket()}).')
+    args = parser.parse_args(argv)
+
+    # SIGTERM também para o servidor e remove o socket
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with MeshServer(args.socket) as server:
+        print(f'Servidor de malhas em {server.path}', file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
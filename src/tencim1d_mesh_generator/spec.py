@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from tencim1d_mesh_generator.data import MeshData
+from tencim1d_mesh_generator.mesh import Mesh, MeshWithStandoff, ThicknessEnum, validate_diameters
+from tencim1d_mesh_generator.standoff import StandoffABC, StandoffRatio, validate_standoff_ratio
+
+MEMO_SIZE = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class MeshSpec:
+    """
+    Parâmetros imutáveis e hashable de uma malha, validados uma única vez na criação.
+
+    O standoff entra só pela razão (standoff_ratio), que é tudo o que a malha usa dele.
+    """
+
+    casing_internal_diameter: float
+    casing_external_diameter: float
+    well_diameter: float
+    formation_diamenter: float = 60.0
+    decimal_places: int = 8
+    standoff_ratio: float | None = None
+    thickness: str = ThicknessEnum.THIN.value
+    casing_elements_number: int = Mesh.casing_elements_number
+    sheath_elements_number: int = Mesh.sheath_elements_number
+    formation_elements_number: int = Mesh.formation_elements_number
+    formation_ratio: float = Mesh.formation_ratio
+
+    def __post_init__(self):
+        validate_diameters(
+            self.casing_internal_diameter,
+            self.casing_external_diameter,
+            self.well_diameter,
+            self.formation_diamenter,
+        )
+        if self.standoff_ratio is not None:
+            validate_standoff_ratio(self.standoff_ratio)
+
+        # ValueError para espessura inválida
+        object.__setattr__(self, 'thickness', ThicknessEnum(self.thickness).value)
+
+    def to_mesh(self) -> Mesh:
+        if self.standoff_ratio is None:
+            mesh = Mesh(
+                casing_internal_diameter=self.casing_internal_diameter,
+                casing_external_diameter=self.casing_external_diameter,
+                well_diameter=self.well_diameter,
+                formation_diamenter=self.formation_diamenter,
+                decimal_places=self.decimal_places,
+            )
+        else:
+            mesh = MeshWithStandoff(
+                casing_internal_diameter=self.casing_internal_diameter,
+                casing_external_diameter=self.casing_external_diameter,
+                well_diameter=self.well_diameter,
+                standoff=StandoffRatio(self.casing_external_diameter, self.well_diameter, self.standoff_ratio),
+                thickness=self.thickness,
+                formation_diamenter=self.formation_diamenter,
+                decimal_places=self.decimal_places,
+            )
+
+        mesh.casing_elements_number = self.casing_elements_number
+        mesh.sheath_elements_number = self.sheath_elements_number
+        mesh.formation_elements_number = self.formation_elements_number
+        mesh.formation_ratio = self.formation_ratio
+        return mesh
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def generate_mesh(spec: MeshSpec) -> MeshData:
+    """
+    Gera a malha de spec, memorizando as MEMO_SIZE mais recentes.
+
+    Specs iguais retornam o mesmo MeshData (somente leitura). Use
+    generate_mesh.cache_info() e generate_mesh.cache_clear() para inspecionar/limpar.
+    """
+    mesh = spec.to_mesh()
+    mesh.generate()
+    return MeshData.from_mesh(mesh)
+
+
+def case_specs(
+    casing_internal_diameter: float,
+    casing_external_diameter: float,
+    well_diameter: float,
+    standoff: StandoffABC | None = None,
+    decimal_places: int = 8,
+) -> dict[str, MeshSpec]:
+    """
+    Specs das malhas que make_mesh escreveria, pelo nome do arquivo: mesh.dat ou, com
+    standoff, mesh_thick.dat e mesh_thin.dat. O standoff é validado como em make_mesh.
+    """
+    if standoff is None:
+        spec = MeshSpec(
+            casing_internal_diameter, casing_external_diameter, well_diameter, decimal_places=decimal_places
+        )
+        return {'mesh.dat': spec}
+
+    standoff.validate_infos()
+    return {
+        f'mesh_{thickness.value.lower()}.dat': MeshSpec(
+            casing_internal_diameter,
+            casing_external_diameter,
+            well_diameter,
+            decimal_places=decimal_places,
+            standoff_ratio=standoff.ratio,
+            thickness=thickness.value,
+        )
+        for thickness in (ThicknessEnum.THICK, ThicknessEnum.THIN)
+    }
@@ -1,7 +1,21 @@
 from abc import ABC, abstractmethod
+from typing import Any, Self
 
+from tencim1d_mesh_generator.backend import require_numpy
 from tencim1d_mesh_generator.errors import StandoffInfosInvalid, StandoffRatioInvalid
 
+RATIO_MIN = 0.01
+RATIO_MAX = 1.0
+
+
+def validate_standoff_ratio(ratio: float) -> bool:
+    """StandoffRatioInvalid se a razão de standoff estiver fora de [RATIO_MIN, RATIO_MAX]."""
+    if not RATIO_MIN <= ratio <= RATIO_MAX:
+        raise StandoffRatioInvalid(
+            f'A Razão de standoff precisa estar entre {RATIO_MIN} e {RATIO_MAX}, valor obtido foi {ratio}'
+        )
+    return True
+
 
 class StandoffABC(ABC):
     @property
@@ -12,20 +26,57 @@ class StandoffABC(ABC):
         return self.validate_ratio()
 
     def validate_ratio(self) -> bool:
-        if not 0.01 <= self.ratio <= 1.0:
-            raise StandoffRatioInvalid(
-                f'A Razão de standoff precisa estar entre 0.01 e 1.0, valor obtido foi {self.ratio}'
-            )
-        return True
+        return validate_standoff_ratio(self.ratio)
 
     def __init__(self, casing_external_diameter: float, well_diameter: float):
         self.well_diameter = well_diameter
         self.casing_external_diameter = casing_external_diameter
 
+    def infos(self) -> dict[str, Any]:
+        """Tipo e parâmetros do standoff, usados para identificar a malha (ex.: chave do cache)."""
+        return {'type': type(self).__name__, **vars(self)}
+
     @property
     def la(self) -> float:
         return (self.well_diameter - self.casing_external_diameter) * 0.5
 
+    @classmethod
+    def many(cls, *args, **kwargs) -> Self:
+        """
+        Standoff com os parâmetros convertidos em arrays NumPy (float64, com broadcast).
+
+        As fórmulas de la, sc e ratio são só aritmética, então no objeto retornado elas
+        devolvem arrays com um valor por combinação de parâmetros.
+        """
+        np = require_numpy()
+        return cls(
+            *(np.asarray(a, dtype=np.float64) for a in args),
+            **{k: np.asarray(v, dtype=np.float64) for k, v in kwargs.items()},
+        )
+
+    @classmethod
+    def ratio_many(cls, *args, **kwargs):
+        """Razão de standoff de cada combinação de parâmetros (mesmos argumentos do construtor)."""
+        np = require_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.asarray(cls.many(*args, **kwargs).ratio, dtype=np.float64)
+
+    def ratio_mask(self):
+        """Versão vetorizada de validate_ratio: True onde a razão está entre RATIO_MIN e RATIO_MAX."""
+        np = require_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.asarray(self.ratio, dtype=np.float64)
+        return (ratio >= RATIO_MIN) & (ratio <= RATIO_MAX)
+
+    def params_mask(self):
+        """Versão vetorizada de validate_params: True onde os parâmetros são válidos."""
+        np = require_numpy()
+        return np.ones(np.broadcast_shapes(*(np.shape(v) for v in vars(self).values())), dtype=bool)
+
+    def valid_mask(self):
+        """Versão vetorizada de validate_infos, sem lançar exceção."""
+        return self.ratio_mask() & self.params_mask()
+
 
 class StandoffRigid(StandoffABC):
     def __init__(
@@ -56,6 +107,17 @@ class StandoffRigid(StandoffABC):
 
         return True
 
+    def params_mask(self):
+        np = require_numpy()
+        dc = np.asarray(self.dc)
+        dc_gamma = dc - 2 * np.asarray(self.gamma_max)
+        return (
+            (self.well_diameter >= dc)
+            & (dc >= self.casing_external_diameter)
+            & (self.well_diameter >= dc_gamma)
+            & (dc_gamma >= self.casing_external_diameter)
+        )
+
     @property
     def sc(self) -> float:
         return 0.5 * (self.dc - self.casing_external_diameter)
@@ -86,3 +148,20 @@ class StandoffFlexible(StandoffABC):
     @property
     def ratio(self) -> float:
         return (self.sc - self.gamma_max) / self.la
+
+
+class StandoffRatio(StandoffABC):
+    """Standoff com a razão já conhecida (ex.: medida em campo ou quantizada)."""
+
+    def __init__(
+        self,
+        casing_external_diameter: float,
+        well_diameter: float,
+        standoff_ratio: float,
+    ):
+        super().__init__(casing_external_diameter, well_diameter)
+        self.standoff_ratio = standoff_ratio
+
+    @property
+    def ratio(self) -> float:
+        return self.standoff_ratio
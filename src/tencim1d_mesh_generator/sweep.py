@@ -0,0 +1,227 @@
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator, Sized
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from enum import StrEnum
+from itertools import batched
+from pathlib import Path
+
+from tencim1d_mesh_generator.cache import MeshCache
+from tencim1d_mesh_generator.mesh import make_mesh
+from tencim1d_mesh_generator.metrics import SweepMetrics
+from tencim1d_mesh_generator.profiling import DEFAULT_BUCKETS, Histogram, MeshProfiler, MeshStats, aggregate
+from tencim1d_mesh_generator.standoff import StandoffABC
+
+
+class BackendEnum(StrEnum):
+    SERIAL = 'SERIAL'
+    THREAD = 'THREAD'
+    PROCESS = 'PROCESS'
+
+
+@dataclass(frozen=True)
+class MeshJob:
+    """Argumentos de uma chamada de make_mesh."""
+
+    casing_internal_diameter: float
+    casing_external_diameter: float
+    well_diameter: float
+    base_dir: Path
+    standoff: StandoffABC | None = None
+    decimal_places: int = 8
+    cache: MeshCache | None = None
+
+    def run(self):
+        make_mesh(
+            casing_internal_diameter=self.casing_internal_diameter,
+            casing_external_diameter=self.casing_external_diameter,
+            well_diameter=self.well_diameter,
+            base_dir=self.base_dir,
+            standoff=self.standoff,
+            decimal_places=self.decimal_places,
+            cache=self.cache,
+        )
+
+
+@dataclass(frozen=True)
+class JobResult:
+    job: MeshJob
+    error: Exception | None = None
+    elapsed: float = 0.0
+    # estatísticas por fase, quando o sweep roda com profile=True
+    stats: MeshStats | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def default_backend() -> BackendEnum:
+    """Threads no Python free-threaded (3.13t sem GIL), processos caso contrário."""
+    return BackendEnum.PROCESS if gil_enabled() else BackendEnum.THREAD
+
+
+def _run(job: MeshJob, profile: bool = False) -> tuple[Exception | None, float, MeshStats | None]:
+    profiler = MeshProfiler() if profile else nullcontext()
+    error = None
+    start = time.perf_counter()
+    with profiler:
+        try:
+            job.run()
+        except Exception as e:
+            error = e
+    elapsed = time.perf_counter() - start
+    return error, elapsed, profiler.stats if profile else None
+
+
+def run_job(job: MeshJob, profile: bool = False) -> JobResult:
+    return JobResult(job, *_run(job, profile))
+
+
+def iter_sweep(
+    jobs: Iterable[MeshJob],
+    backend: str | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    profile: bool = False,
+    metrics: SweepMetrics | None = None,
+) -> Iterator[JobResult]:
+    """
+    Executa os jobs e devolve um JobResult por job, na ordem de entrada.
+
+    Erros (ex.: MeshDiameterInvalid) ficam no JobResult do próprio job e não
+    interrompem os demais; o mesmo vale para falhas do pool (job que não pode ser enviado
+    ao processo, worker que morreu), que ficam nos jobs do lote afetado. Com profile=True
+    cada JobResult traz as estatísticas por fase do seu job (veja sweep_histograms). Com
+    metrics, cada job concluído é registrado nele (o que liga o profile).
+    """
+    backend = default_backend() if backend is None else BackendEnum(backend.upper())
+    results = _iter_sweep(jobs, backend, max_workers, chunksize, profile or metrics is not None, metrics)
+
+    if metrics is None:
+        yield from results
+        return
+    for result in results:
+        metrics.observe(result.elapsed, result.stats, result.error)
+        yield result
+
+
+def _iter_sweep(
+    jobs: Iterable[MeshJob],
+    backend: BackendEnum,
+    max_workers: int | None,
+    chunksize: int,
+    profile: bool,
+    metrics: SweepMetrics | None,
+) -> Iterator[JobResult]:
+    if backend == BackendEnum.SERIAL:
+        if metrics is not None and isinstance(jobs, Sized):
+            metrics.expect(len(jobs))
+        for job in jobs:
+            yield run_job(job, profile)
+        return
+
+    # Os jobs são submetidos em lotes de chunksize; o resultado é associado ao job original
+    # porque com processos o job que volta é uma cópia.
+    jobs = list(jobs)
+    if metrics is not None:
+        metrics.expect(len(jobs))
+    pool_cls = ProcessPoolExecutor if backend == BackendEnum.PROCESS else ThreadPoolExecutor
+    yield from _iter_pool(jobs, pool_cls, max_workers, chunksize, profile)
+
+
+def _iter_pool(
+    jobs: list[MeshJob],
+    pool_cls: type[ProcessPoolExecutor] | type[ThreadPoolExecutor],
+    max_workers: int | None,
+    chunksize: int,
+    profile: bool,
+) -> Iterator[JobResult]:
+    chunks = list(batched(jobs, chunksize))
+    pool = pool_cls(max_workers=max_workers)
+    try:
+        futures = [pool.submit(_run_chunk, chunk, profile) for chunk in chunks]
+        for i, chunk in enumerate(chunks):
+            results, error = _outcome(futures[i])
+            if isinstance(error, BrokenExecutor):
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = _recover(futures, chunks, i, pool_cls, max_workers, profile)
+                results, error = _outcome(futures[i])
+            if error is not None:
+                # ex.: job que não pode ser serializado para o processo, ou que derrubou o worker
+                yield from (JobResult(job, error=error) for job in chunk)
+                continue
+
+            for job, result in zip(chunk, results, strict=True):
+                yield JobResult(job, *result)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _outcome(future: Future) -> tuple[list | None, Exception | None]:
+    try:
+        return future.result(), None
+    except Exception as e:
+        return None, e
+
+
+def _recover(
+    futures: list[Future],
+    chunks: list[tuple[MeshJob, ...]],
+    start: int,
+    pool_cls: type[ProcessPoolExecutor] | type[ThreadPoolExecutor],
+    max_workers: int | None,
+    profile: bool,
+) -> ProcessPoolExecutor | ThreadPoolExecutor:
+    """
+    Refaz os lotes não concluídos a partir de start depois que um worker morreu e quebrou o pool.
+
+    O lote culpado é um dos que podiam estar rodando, os primeiros não concluídos (no
+    máximo um por worker, mais um na fila do pool). Esses rodam de novo um por vez, cada
+    um sozinho num pool de um worker, e só o lote que derrubar esse pool fica com o erro.
+    Os demais vão para um pool novo, que é retornado.
+    """
+    unfinished = [
+        j
+        for j in range(start, len(chunks))
+        if not futures[j].done() or isinstance(futures[j].exception(), BrokenExecutor)
+    ]
+    window = (max_workers or os.cpu_count() or 1) + 1
+
+    pool = pool_cls(max_workers=max_workers)
+    for j in unfinished[window:]:
+        futures[j] = pool.submit(_run_chunk, chunks[j], profile)
+    for j in unfinished[:window]:
+        with pool_cls(max_workers=1) as alone:
+            futures[j] = alone.submit(_run_chunk, chunks[j], profile)
+    return pool
+
+
+def _run_chunk(jobs: tuple[MeshJob, ...], profile: bool) -> list[tuple[Exception | None, float, MeshStats | None]]:
+    return [_run(job, profile) for job in jobs]
+
+
+def run_sweep(
+    jobs: Iterable[MeshJob],
+    backend: str | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    profile: bool = False,
+    metrics: SweepMetrics | None = None,
+) -> list[JobResult]:
+    return list(iter_sweep(jobs, backend, max_workers, chunksize, profile, metrics))
+
+
+def sweep_histograms(
+    results: Iterable[JobResult], buckets: tuple[float, ...] = DEFAULT_BUCKETS
+) -> dict[str, Histogram]:
+    """Histograma do tempo de cada fase entre os jobs de um sweep com profile=True."""
+    return aggregate((r.stats for r in results if r.stats is not None), buckets)
@@ -0,0 +1,139 @@
+"""
+Validação em lote dos parâmetros de várias malhas, coluna a coluna.
+
+Em vez de lançar uma exceção no primeiro problema, validate_batch verifica todas as
+restrições de todas as linhas de uma vez e devolve um ValidationReport com a máscara das
+linhas válidas e, por linha, os códigos (Reason) de todas as restrições violadas.
+"""
+
+from dataclasses import dataclass
+from enum import IntFlag
+from typing import Any
+
+from tencim1d_mesh_generator.backend import require_numpy
+from tencim1d_mesh_generator.errors import MeshDiameterInvalid, StandoffInfosInvalid, StandoffRatioInvalid
+from tencim1d_mesh_generator.standoff import RATIO_MAX, RATIO_MIN, StandoffABC
+
+type ArrayLike = Any
+
+
+class Reason(IntFlag):
+    OK = 0
+    # casing_internal_diameter >= casing_external_diameter
+    CASING_DIAMETER = 1
+    # casing_external_diameter >= well_diameter
+    WELL_DIAMETER = 2
+    # well_diameter >= formation_diamenter
+    FORMATION_DIAMETER = 4
+    # razão de standoff fora de [0.01, 1.0]
+    STANDOFF_RATIO = 8
+    # parâmetros do standoff inválidos (ex.: Dc de StandoffRigid)
+    STANDOFF_PARAMS = 16
+
+
+DIAMETER_REASONS = Reason.CASING_DIAMETER | Reason.WELL_DIAMETER | Reason.FORMATION_DIAMETER
+
+
+def _invalid_rows_msg(mask) -> str:
+    np = require_numpy()
+    rows = np.flatnonzero(~mask)
+    shown = ', '.join(str(r) for r in rows[:10])
+    more = f' (+{rows.size - 10})' if rows.size > 10 else ''
+    return f'linhas {shown}{more}'
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    """reasons tem um inteiro por linha com os bits de Reason das restrições violadas."""
+
+    reasons: Any
+
+    def __len__(self) -> int:
+        return self.reasons.shape[0]
+
+    @property
+    def mask(self):
+        """True nas linhas válidas."""
+        return self.reasons == Reason.OK
+
+    @property
+    def all_valid(self) -> bool:
+        return not self.reasons.any()
+
+    def invalid_rows(self):
+        return require_numpy().flatnonzero(self.reasons)
+
+    def reasons_of(self, row: int) -> Reason:
+        return Reason(int(self.reasons[row]))
+
+    def counts(self) -> dict[Reason, int]:
+        """Número de linhas que violam cada restrição."""
+        np = require_numpy()
+        return {reason: int(np.count_nonzero(self.reasons & reason)) for reason in Reason if reason}
+
+    def raise_if_invalid(self):
+        """Lança a exceção do primeiro tipo de problema encontrado, listando as linhas com ele."""
+        checks = (
+            (
+                DIAMETER_REASONS,
+                MeshDiameterInvalid,
+                'Diametro precisa seguir a relação '
+                'casing_internal_diameter < casing_external_diameter < well_diameter < formation_diamenter. ',
+            ),
+            (
+                Reason.STANDOFF_RATIO,
+                StandoffRatioInvalid,
+                f'A Razão de standoff precisa estar entre {RATIO_MIN} e {RATIO_MAX}, ',
+            ),
+            (Reason.STANDOFF_PARAMS, StandoffInfosInvalid, 'Parâmetros do standoff inválidos, '),
+        )
+        for reasons, error, msg in checks:
+            ok = (self.reasons & reasons) == 0
+            if not ok.all():
+                raise error(f'{msg}falhou nas {_invalid_rows_msg(ok)}')
+
+
+def validate_batch(
+    casing_internal_diameter: ArrayLike,
+    casing_external_diameter: ArrayLike,
+    well_diameter: ArrayLike,
+    standoff_ratio: ArrayLike | None = None,
+    formation_diamenter: ArrayLike = 60.0,
+    standoff: StandoffABC | None = None,
+) -> ValidationReport:
+    """
+    Valida todas as linhas (com broadcast entre os argumentos) numa única passada.
+
+    standoff é um standoff com parâmetros em arrays (ver StandoffABC.many); nesse caso a
+    razão vem dele e os seus parâmetros também são validados.
+    """
+    np = require_numpy()
+
+    columns = [casing_internal_diameter, casing_external_diameter, well_diameter, formation_diamenter]
+    if standoff_ratio is not None:
+        columns.append(standoff_ratio)
+    di, de, dw, df, *ratio = np.broadcast_arrays(*(np.atleast_1d(np.asarray(c, dtype=np.float64)) for c in columns))
+
+    ratio_mask = params_mask = None
+    if ratio:
+        ratio_mask = (ratio[0] >= RATIO_MIN) & (ratio[0] <= RATIO_MAX)
+    if standoff is not None:
+        ratio_mask = standoff.ratio_mask()
+        params_mask = standoff.params_mask()
+
+    # Comparações com NaN são falsas, então NaN também marca a restrição como violada.
+    checks = (
+        (di < de, Reason.CASING_DIAMETER),
+        (de < dw, Reason.WELL_DIAMETER),
+        (dw < df, Reason.FORMATION_DIAMETER),
+        (ratio_mask, Reason.STANDOFF_RATIO),
+        (params_mask, Reason.STANDOFF_PARAMS),
+    )
+
+    shape = np.broadcast_shapes(di.shape, *(np.shape(ok) for ok, _ in checks if ok is not None))
+    reasons = np.zeros(shape, dtype=np.uint8)
+    for ok, reason in checks:
+        if ok is not None:
+            reasons |= np.where(ok, 0, reason).astype(np.uint8)
+
+    return ValidationReport(reasons)
@@ -0,0 +1,326 @@
+"""
+Escrita do arquivo .dat do Tencim1D.
+
+As linhas são formatadas em blocos de CHUNK_SIZE com um único `%` por bloco, usando
+um formato pré-compilado por decimal_places. '%d %10.8f' gera exatamente os mesmos
+bytes que f'{node} {x:10.8f}', então a saída é idêntica à escrita linha a linha.
+A conectividade por segmentos é formatada direto dos runs, sem materializar os elementos.
+
+Os arquivos são escritos num temporário no mesmo diretório e renomeados sobre o destino
+(atomic_path): o destino nunca é aberto para escrita, então um hard link para uma entrada
+do MeshCache é substituído em vez de sobrescrever a entrada. Links simbólicos são seguidos,
+o modo de um arquivo existente é mantido e destinos que não são arquivos regulares (ex.:
+/dev/stdout, um FIFO) são escritos diretamente.
+"""
+
+import math
+import mmap
+import os
+import secrets
+import stat
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import accumulate, batched, chain, repeat
+from pathlib import Path
+from typing import Any, TextIO
+
+from tencim1d_mesh_generator.compress import compression_of, open_binary, open_text
+from tencim1d_mesh_generator.connectivity import SegmentConnectivity
+from tencim1d_mesh_generator.profiling import MeshProfiler, current_profiler, phase
+
+CHUNK_SIZE = 65_536
+
+type Block = tuple[Callable[..., str], tuple[Any, ...]]
+
+
+@contextmanager
+def atomic_path(path: Path, suffix: str = '') -> Iterator[Path]:
+    """
+    Caminho temporário, no diretório de path, que substitui path (os.replace) se o bloco
+    terminar sem erro; com erro ele é removido e path fica como estava.
+
+    O temporário termina com o nome de path, então a extensão (e a compressão) é a mesma;
+    suffix é acrescentado depois dele quando a extensão não pode aparecer no temporário.
+    Com path um link simbólico o arquivo substituído é o alvo do link; se path já existe e
+    não é um hard link (um acerto do MeshCache), o temporário recebe o seu modo. Se path
+    existe e não é um arquivo regular, o próprio path é devolvido.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    if st is not None and not stat.S_ISREG(st.st_mode):
+        yield path
+        return
+
+    tmp = path.with_name(f'.{secrets.token_hex(8)}.{path.name}{suffix}')
+    try:
+        yield tmp
+        if st is not None and st.st_nlink == 1:
+            os.chmod(tmp, stat.S_IMODE(st.st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=64)
+def _coor_block_format(decimal_places: int, lines: int) -> str:
+    return f'%d %10.{decimal_places}f\n' * lines
+
+
+@lru_cache(maxsize=64)
+def _conn_block_format(lines: int) -> str:
+    return '%d %4d %4d %4d\n' * lines
+
+
+def format_coor(x: Sequence[float], decimal_places: int = 8, start: int = 1) -> str:
+    """Formata as linhas de coordenadas dos nós start, start + 1, ..."""
+    fmt = _coor_block_format(decimal_places, len(x))
+    return fmt % tuple(chain.from_iterable(zip(range(start, start + len(x)), x, strict=True)))
+
+
+def format_conn(conn: Sequence[tuple[int, int, int]], start: int = 1) -> str:
+    """Formata as linhas de conectividade dos elementos start, start + 1, ..."""
+    fmt = _conn_block_format(len(conn))
+    return fmt % tuple(chain.from_iterable((el, *c) for el, c in enumerate(conn, start=start)))
+
+
+def format_segment(start: int, count: int, material: int) -> str:
+    """
+    Formata count elementos (el, el + 1, material) a partir de start.
+
+    Cada número de nó aparece em duas linhas seguidas, então é formatado uma única vez.
+    """
+    nodes = range(start, start + count + 1)
+    padded = list(map(' %4d'.__mod__, nodes))
+    suffix = ' %4d\n' % material
+    return ''.join(
+        chain.from_iterable(zip(map(str, nodes[:-1]), padded[:-1], padded[1:], repeat(suffix, count), strict=True))
+    )
+
+
+def iter_blocks(
+    x: Iterable[float],
+    conn: Iterable[tuple[int, int, int]],
+    decimal_places: int = 8,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Block]:
+    """Blocos (função, argumentos) que, formatados em ordem, formam o arquivo .dat."""
+    yield str, ('coordinates\n',)
+    node = 1
+    for chunk in batched(x, chunk_size):
+        yield format_coor, (chunk, decimal_places, node)
+        node += len(chunk)
+    yield str, ('end coordinates\n',)
+
+    yield str, ('bar2\n',)
+    if isinstance(conn, SegmentConnectivity):
+        for start, count, material in conn.segments:
+            for el in range(start, start + count, chunk_size):
+                yield format_segment, (el, min(chunk_size, start + count - el), material)
+    else:
+        el = 1
+        for chunk in batched(conn, chunk_size):
+            yield format_conn, (chunk, el)
+            el += len(chunk)
+    yield str, ('end bar2\n',)
+
+    yield str, ('return\n',)
+
+
+def write_dat(
+    path: Path,
+    x: Iterable[float],
+    conn: Iterable[tuple[int, int, int]],
+    decimal_places: int = 8,
+    chunk_size: int = CHUNK_SIZE,
+    level: int | None = None,
+):
+    """Escreve a malha em path; com extensão .gz, .xz ou .zst o arquivo é comprimido (ver compress.py)."""
+    profiler = current_profiler()
+    with atomic_path(path) as tmp:
+        if profiler is not None:
+            _write_dat_profiled(profiler, tmp, x, conn, decimal_places, chunk_size, level)
+            return
+
+        with open_text(tmp, level) as fp:
+            write_blocks(fp, x, conn, decimal_places, chunk_size)
+
+
+def _write_dat_profiled(profiler: MeshProfiler, path, x, conn, decimal_places, chunk_size, level):
+    """write_dat separando o tempo de formatação (format) do de escrita no arquivo (io)."""
+    with profiler.phase('io'):
+        fp = open_text(path, level)
+    try:
+        for fn, args in iter_blocks(x, conn, decimal_places, chunk_size):
+            with profiler.phase('format'):
+                text = fn(*args)
+            with profiler.phase('io', nbytes=len(text)):
+                fp.write(text)
+    finally:
+        with profiler.phase('io'):
+            fp.close()
+
+
+def write_blocks(
+    fp: TextIO,
+    x: Iterable[float],
+    conn: Iterable[tuple[int, int, int]],
+    decimal_places: int = 8,
+    chunk_size: int = CHUNK_SIZE,
+):
+    """Escreve a malha num arquivo já aberto (texto)."""
+    for fn, args in iter_blocks(x, conn, decimal_places, chunk_size):
+        fp.write(fn(*args))
+
+
+def _digits_total(start: int, stop: int, width: int = 0) -> int:
+    """Soma de len('%*d' % (width, n)) para n em range(start, stop), sem formatar os números."""
+    if start < 0:
+        return sum(len('%*d' % (width, n)) for n in range(start, stop))
+    total, digits = 0, len(str(start))
+    while start < stop:
+        end = min(stop, 10**digits)
+        total += (end - start) * max(width, digits)
+        start, digits = end, digits + 1
+    return total
+
+
+def _coor_size(x: Sequence[float], decimal_places: int = 8, start: int = 1) -> tuple[int, int]:
+    fmt = f'%10.{decimal_places}f'
+    lo, hi = min(x), max(x)
+    # Sem zero, infinito ou NaN no bloco, a largura cresce com |x|: se o menor e o maior
+    # valor têm a mesma largura, todos têm.
+    if (lo > 0 or hi < 0) and math.isfinite(sum(x)) and len(fmt % lo) == len(fmt % hi):
+        widths = len(x) * len(fmt % lo)
+    else:
+        widths = sum(len(fmt % v) for v in x)
+    return _digits_total(start, start + len(x)) + widths + 2 * len(x), len(x)
+
+
+def _conn_size(conn: Sequence[tuple[int, int, int]], start: int = 1) -> tuple[int, int]:
+    values = tuple(chain.from_iterable(conn))
+    lo, hi = min(values), max(values)
+    if lo >= 0 and len('%4d' % lo) == len('%4d' % hi):
+        widths = len(values) * len('%4d' % lo)
+    else:
+        widths = sum(len('%4d' % v) for v in values)
+    return _digits_total(start, start + len(conn)) + widths + len(values) + len(conn), len(conn)
+
+
+def _segment_size(start: int, count: int, material: int) -> tuple[int, int]:
+    stop = start + count
+    nodes = _digits_total(start, stop) + _digits_total(start, stop, 4) + _digits_total(start + 1, stop + 1, 4)
+    return nodes + count * (2 + len(' %4d\n' % material)), count
+
+
+def _text_size(text: str) -> tuple[int, int]:
+    return len(text.encode('utf-8')), text.count('\n')
+
+
+_SIZES: dict[Callable[..., str], Callable[..., tuple[int, int]]] = {
+    str: _text_size,
+    format_coor: _coor_size,
+    format_conn: _conn_size,
+    format_segment: _segment_size,
+}
+
+
+def block_size(block: Block) -> int:
+    """Número de bytes do bloco formatado (como em _render), calculado dos dados sem formatar o bloco."""
+    fn, args = block
+    nbytes, lines = _SIZES[fn](*args)
+    return nbytes + lines * (len(os.linesep) - 1)
+
+
+def _render(block: Block) -> bytes:
+    fn, args = block
+    text = fn(*args)
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode('utf-8')
+
+
+def _render_at(path: Path, offset: int, size: int, block: Block):
+    """Formata o bloco direto na sua região [offset, offset + size) do arquivo, mapeada com mmap."""
+    data = _render(block)
+    if len(data) != size:
+        raise RuntimeError(f'Bloco com {len(data)} bytes, esperado {size}')
+    if not size:
+        return
+    # o offset do mmap precisa ser múltiplo de ALLOCATIONGRANULARITY
+    base = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with open(path, mode='r+b') as fp, mmap.mmap(fp.fileno(), offset + size - base, offset=base) as mm:
+        mm[offset - base :] = data
+
+
+def _submit_window(pool: Executor, fn: Callable[..., Any], calls: Iterable[tuple], window: int) -> Iterator[Future]:
+    """Futures das chamadas, em ordem, com no máximo window submetidas e ainda não devolvidas."""
+    pending = deque()
+    for args in calls:
+        if len(pending) >= window:
+            yield pending.popleft()
+        pending.append(pool.submit(fn, *args))
+    yield from pending
+
+
+def write_dat_parallel(
+    path: Path,
+    x: Iterable[float],
+    conn: Iterable[tuple[int, int, int]],
+    decimal_places: int = 8,
+    chunk_size: int = CHUNK_SIZE,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    level: int | None = None,
+):
+    """
+    Mesmo arquivo de write_dat, com os blocos formatados em paralelo.
+
+    Os blocos são formatados num pool (de processos com use_processes=True; de threads,
+    que só rodam em paralelo no Python free-threaded). O tamanho de cada bloco é calculado
+    dos dados (block_size), sem formatá-lo; com os offsets, o arquivo é pré-alocado e cada
+    worker formata o seu bloco direto na sua região do arquivo, mapeada com mmap. Num
+    caminho comprimido os blocos são passados em ordem ao compressor. Em qualquer caso só
+    há alguns blocos formatados por worker em memória, não o arquivo inteiro.
+    """
+    if isinstance(x, Iterator):
+        x = tuple(x)
+    if isinstance(conn, Iterator):
+        conn = tuple(conn)
+    pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    window = 2 * (max_workers or os.cpu_count() or 1)
+
+    with atomic_path(path) as tmp:
+        if compression_of(path) is not None:
+            blocks = ((block,) for block in iter_blocks(x, conn, decimal_places, chunk_size))
+            with phase('io'):
+                fp = open_binary(tmp, 'wb', level)
+            try:
+                with pool_cls(max_workers=max_workers) as pool:
+                    for future in _submit_window(pool, _render, blocks, window):
+                        with phase('format'):
+                            data = future.result()
+                        with phase('io', nbytes=len(data)):
+                            fp.write(data)
+            finally:
+                with phase('io'):
+                    fp.close()
+            return
+
+        with phase('format'):
+            sizes = list(map(block_size, iter_blocks(x, conn, decimal_places, chunk_size)))
+        offsets = [0, *accumulate(sizes)]
+        with phase('io', nbytes=offsets[-1]), open(tmp, mode='wb') as fp:
+            fp.truncate(offsets[-1])
+
+        blocks = iter_blocks(x, conn, decimal_places, chunk_size)
+        calls = zip(repeat(tmp), offsets[:-1], sizes, blocks, strict=False)
+        with phase('format'), pool_cls(max_workers=max_workers) as pool:
+            for future in _submit_window(pool, _render_at, calls, window):
+                future.result()
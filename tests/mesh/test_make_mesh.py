@@ -92,3 +92,17 @@ def test_make_mesh_with_standoff_diferent_decimal_places(tmp_path, decimal_place
 
     assert len(first_node_coor_thick.split('.')[1]) == decimal_places
     assert len(first_node_coor_thin.split('.')[1]) == decimal_places
+
+
+def test_make_mesh_standoff_concurrent(tmp_path):
+    standoff = StandoffRigid(
+        casing_external_diameter=0.17,
+        well_diameter=0.21,
+        dc=0.19,
+    )
+
+    make_mesh(0.15, 0.17, 0.21, base_dir=tmp_path / 'serial', standoff=standoff)
+    make_mesh(0.15, 0.17, 0.21, base_dir=tmp_path / 'concurrent', standoff=standoff, concurrent=True)
+
+    for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+        assert (tmp_path / 'serial' / name).read_bytes() == (tmp_path / 'concurrent' / name).read_bytes()
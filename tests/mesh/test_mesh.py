@@ -1,5 +1,8 @@
+import tracemalloc
+
 import pytest
 
+from tencim1d_mesh_generator.errors import MeshNotGenerated
 from tencim1d_mesh_generator.mesh import Mesh, MeshDiameterInvalid
 from tests.consts import CONNECTIVITY, COOR_CASE_1, COOR_CASE_2
 
@@ -153,3 +156,94 @@ def test_invalid_diameter(casing_internal_diameter, casing_external_diameter, we
             casing_external_diameter,
             well_diameter,
         )
+
+
+def test_x_array(mesh: Mesh):
+    mesh.generate()
+
+    assert mesh.x_array.typecode == 'd'
+    assert tuple(mesh.x_array) == mesh.x
+    assert isinstance(mesh.x, tuple)
+
+
+def test_conn_array(mesh: Mesh):
+    mesh.generate()
+
+    view = mesh.conn_array
+
+    assert view.shape == (len(CONNECTIVITY), 3)
+    assert view.itemsize == 4
+    assert tuple(tuple(row) for row in view.tolist()) == mesh.conn == CONNECTIVITY
+    assert view.readonly
+    with pytest.raises(TypeError):
+        view[0, 0] = -1
+    assert mesh.conn_array[0, 0] == CONNECTIVITY[0][0]
+
+
+def test_conn_array_before_generate(mesh: Mesh):
+    assert mesh.conn == ()
+    with pytest.raises(MeshNotGenerated):
+        _ = mesh.conn_array
+
+
+def test_arrays_zero_copy(mesh: Mesh):
+    np = pytest.importorskip('numpy')
+    mesh.generate()
+
+    x = np.asarray(mesh.x_array)
+    conn = np.asarray(mesh.conn_array)
+
+    assert x.dtype == np.float64
+    assert conn.dtype == np.int32
+    assert conn.shape == (len(CONNECTIVITY), 3)
+
+    mesh.x_array[0] = -1.0
+    assert x[0] == -1.0
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1000])
+def test_iter_coor(mesh: Mesh, chunk_size: int):
+    mesh.generate_coor()
+
+    chunks = list(mesh.iter_coor(chunk_size))
+
+    assert all(len(c) <= chunk_size for c in chunks)
+    assert tuple(x for c in chunks for x in c) == mesh.x
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1000])
+def test_iter_conn(mesh: Mesh, chunk_size: int):
+    chunks = list(mesh.iter_conn(chunk_size))
+
+    assert all(len(c) <= 3 * chunk_size for c in chunks)
+    assert [v for c in chunks for v in c] == [v for el in CONNECTIVITY for v in el]
+
+
+@pytest.mark.parametrize('chunk_size', [5, 65_536])
+def test_write_streaming(mesh: Mesh, tmp_path, chunk_size: int):
+    mesh.write_streaming(tmp_path / 'streaming.dat', chunk_size)
+    mesh.generate()
+    mesh.write(tmp_path / 'mesh.dat')
+
+    assert (tmp_path / 'streaming.dat').read_bytes() == (tmp_path / 'mesh.dat').read_bytes()
+
+
+def _write_streaming_peak_memory(path, formation_elements_number: int) -> int:
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.formation_elements_number = formation_elements_number
+    mesh.formation_ratio = 1.0001
+    mesh.backend = 'python'
+
+    tracemalloc.start()
+    mesh.write_streaming(path, chunk_size=1_000)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+def test_write_streaming_bounded_memory(tmp_path):
+    small = _write_streaming_peak_memory(tmp_path / 'small.dat', 10_000)
+    large = _write_streaming_peak_memory(tmp_path / 'large.dat', 40_000)
+
+    assert large < 1.2 * small
@@ -1,6 +1,6 @@
 import pytest
 
-from tencim1d_mesh_generator.mesh import MeshWithStandoff, ThicknessEnum
+from tencim1d_mesh_generator.mesh import MeshWithStandoff, ThicknessEnum, generate_standoff_pair
 from tencim1d_mesh_generator.standoff import StandoffRigid
 from tests.consts import (
     CONNECTIVITY,
@@ -94,3 +94,31 @@ def test_generate(
 
     for element, (excepted_, coon) in enumerate(zip(CONNECTIVITY, mesh_with_standoff.conn, strict=False)):
         assert excepted_ == coon, f'Node {element + 1}'
+
+
+def test_with_thickness(mesh_with_standoff: MeshWithStandoff):
+    mesh_with_standoff.thickness = ThicknessEnum.THICK.value
+    assert mesh_with_standoff.effective_well_radius == pytest.approx(2.2)
+
+    thin = mesh_with_standoff.with_thickness(ThicknessEnum.THIN.value)
+
+    assert thin.effective_well_radius == pytest.approx(1.8)
+    assert thin.element_size_sheath == pytest.approx(0.04)
+    assert thin.pipe_radius == mesh_with_standoff.pipe_radius
+    assert mesh_with_standoff.effective_well_radius == pytest.approx(2.2)
+
+
+def test_generate_standoff_pair():
+    standoff = StandoffRigid(well_diameter=4.0, casing_external_diameter=2.0, dc=3.6)
+
+    thick, thin = generate_standoff_pair(1.0, 2.0, 4.0, standoff)
+
+    for mesh, expected_coor in ((thick, COOR_CASE_3_WITH_STANDOFF_THICK), (thin, COOR_CASE_3_WITH_STANDOFF_THIN)):
+        single = MeshWithStandoff(1.0, 2.0, 4.0, standoff, thickness=mesh.thickness)
+        single.generate()
+
+        assert mesh.x == single.x
+        assert mesh.conn == single.conn == CONNECTIVITY
+        assert mesh.x == pytest.approx(expected_coor, rel=1e-5)
+
+    assert thick.connectivity is thin.connectivity
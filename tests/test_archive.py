@@ -0,0 +1,72 @@
+import zipfile
+
+import pytest
+
+from tencim1d_mesh_generator.archive import MeshArchive, main
+from tencim1d_mesh_generator.mesh import make_mesh
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tests.consts import CONNECTIVITY
+
+
+@pytest.fixture
+def standoff():
+    return StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19)
+
+
+def test_archive_same_content_as_make_mesh(tmp_path, standoff):
+    with MeshArchive(tmp_path / 'sweep.zip', mode='w') as archive:
+        archive.make_mesh('000000', 0.15, 0.17, 0.21)
+        archive.make_mesh('000001', 0.15, 0.17, 0.21, standoff=standoff)
+
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'a')
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'b', standoff=standoff)
+
+    with MeshArchive(tmp_path / 'sweep.zip') as archive:
+        assert archive.cases() == ['000000', '000001']
+        assert archive.files('000001') == ['mesh_thick.dat', 'mesh_thin.dat']
+        assert archive.read_bytes('000000') == (tmp_path / 'a/mesh.dat').read_bytes()
+        for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+            assert archive.read_bytes('000001', name) == (tmp_path / 'b' / name).read_bytes()
+
+
+def test_archive_read(tmp_path):
+    with MeshArchive(tmp_path / 'sweep.zip', mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for case in range(3):
+            archive.make_mesh(f'case{case}', 1.0 + case * 0.1, 3.0, 6.0)
+
+    with MeshArchive(tmp_path / 'sweep.zip') as archive:
+        data = archive.read('case2')
+
+    assert data.x[0] == pytest.approx(0.6)
+    assert tuple(map(tuple, data.conn.tolist())) == CONNECTIVITY
+
+
+def test_archive_extract(tmp_path, standoff):
+    with MeshArchive(tmp_path / 'sweep.zip', mode='w') as archive:
+        archive.make_mesh('000007', 0.15, 0.17, 0.21, standoff=standoff)
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'single', standoff=standoff)
+
+    with MeshArchive(tmp_path / 'sweep.zip') as archive:
+        paths = archive.extract('000007', tmp_path / 'case', ['mesh_thin.dat'])
+
+    assert paths == [tmp_path / 'case/mesh_thin.dat']
+    assert paths[0].read_bytes() == (tmp_path / 'single/mesh_thin.dat').read_bytes()
+    assert not (tmp_path / 'case/mesh_thick.dat').exists()
+
+
+def test_archive_main(tmp_path, capsys):
+    with MeshArchive(tmp_path / 'sweep.zip', mode='w') as archive:
+        archive.make_mesh('000001', 0.15, 0.17, 0.21)
+
+    main([str(tmp_path / 'sweep.zip'), '000001', str(tmp_path / 'out')])
+
+    assert (tmp_path / 'out/mesh.dat').exists()
+    assert capsys.readouterr().out.strip() == str(tmp_path / 'out/mesh.dat')
+
+
+def test_archive_missing_case(tmp_path):
+    with MeshArchive(tmp_path / 'sweep.zip', mode='w') as archive:
+        archive.make_mesh('000000', 0.15, 0.17, 0.21)
+
+    with MeshArchive(tmp_path / 'sweep.zip') as archive, pytest.raises(KeyError):
+        archive.read_bytes('000001')
@@ -0,0 +1,75 @@
+import csv
+
+import pytest
+
+from tencim1d_mesh_generator.azimuthal import (
+    eccentric_well_radius,
+    generate_coor_azimuthal,
+    make_mesh_azimuthal,
+)
+from tencim1d_mesh_generator.errors import StandoffRatioInvalid
+from tencim1d_mesh_generator.mesh import generate_standoff_pair
+from tencim1d_mesh_generator.standoff import StandoffRigid
+
+np = pytest.importorskip('numpy')
+
+
+def test_eccentric_well_radius_extremes():
+    r = eccentric_well_radius(1.0, 2.0, 0.8, [0.0, np.pi / 2, np.pi])
+
+    assert r[0] == pytest.approx(2.2)
+    assert r[1] == pytest.approx(np.sqrt(2.0**2 - 0.2**2))
+    assert r[2] == pytest.approx(1.8)
+
+
+def test_eccentric_well_radius_concentric():
+    r = eccentric_well_radius(1.0, 2.0, 1.0, np.linspace(0.0, 2.0 * np.pi, 7))
+
+    assert r == pytest.approx(np.full(7, 2.0))
+
+
+def test_generate_coor_azimuthal_thick_and_thin():
+    standoff = StandoffRigid(well_diameter=4.0, casing_external_diameter=2.0, dc=3.6)
+    thick, thin = generate_standoff_pair(1.0, 2.0, 4.0, standoff)
+
+    x = generate_coor_azimuthal(1.0, 2.0, 4.0, standoff.ratio, angles_number=4)
+
+    assert x.shape == (4, len(thick.x))
+    assert x[0] == pytest.approx(thick.x, rel=1e-12)
+    assert x[2] == pytest.approx(thin.x, rel=1e-12)
+    assert x[1] == pytest.approx(x[3], rel=1e-12)
+
+
+def test_generate_coor_azimuthal_invalid_ratio():
+    with pytest.raises(StandoffRatioInvalid):
+        generate_coor_azimuthal(1.0, 2.0, 4.0, 0.0)
+
+
+def test_make_mesh_azimuthal_one_file_per_angle(tmp_path):
+    standoff = StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19)
+
+    make_mesh_azimuthal(0.15, 0.17, 0.21, tmp_path, standoff, angles_number=8)
+
+    with open(tmp_path / 'angles.csv', encoding='utf-8') as fp:
+        rows = list(csv.DictReader(fp))
+
+    assert len(rows) == 8
+    assert float(rows[2]['angle_deg']) == pytest.approx(90.0)
+    assert float(rows[0]['effective_sheath_thickness']) > float(rows[4]['effective_sheath_thickness'])
+    assert all((tmp_path / row['file']).exists() for row in rows)
+
+
+def test_make_mesh_azimuthal_single_file(tmp_path):
+    standoff = StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19)
+
+    make_mesh_azimuthal(0.15, 0.17, 0.21, tmp_path / 'multi', standoff, angles_number=8, single_file=True)
+    make_mesh_azimuthal(0.15, 0.17, 0.21, tmp_path / 'single', standoff, angles_number=8)
+
+    content = (tmp_path / 'multi/mesh_azimuthal.dat').read_bytes()
+    with open(tmp_path / 'multi/mesh_azimuthal.csv', encoding='utf-8') as fp:
+        rows = list(csv.DictReader(fp))
+
+    assert content.count(b'return\n') == 8
+    for k, row in enumerate(rows):
+        offset, size = int(row['offset']), int(row['size'])
+        assert content[offset : offset + size] == (tmp_path / f'single/mesh_angle_{k:03d}.dat').read_bytes()
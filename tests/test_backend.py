@@ -0,0 +1,26 @@
+import pytest
+
+from tencim1d_mesh_generator import backend
+from tencim1d_mesh_generator.backend import has_numpy, use_numpy
+
+
+def test_use_numpy_forced():
+    assert use_numpy(0, 10, 'python') is False
+    assert use_numpy(10**9, 10, 'python') is False
+    if has_numpy():
+        assert use_numpy(0, 10, 'numpy') is True
+
+
+@pytest.mark.skipif(not has_numpy(), reason='numpy')
+def test_use_numpy_auto_threshold():
+    assert use_numpy(9, 10) is False
+    assert use_numpy(10, 10) is True
+    assert use_numpy(10, 10, 'auto') is True
+
+
+def test_use_numpy_without_numpy(monkeypatch):
+    monkeypatch.setattr(backend, 'get_numpy', lambda: None)
+
+    assert use_numpy(10**9, 10) is False
+    with pytest.raises(ImportError, match='NumPy'):
+        use_numpy(0, 10, 'numpy')
@@ -0,0 +1,185 @@
+import pytest
+
+from tencim1d_mesh_generator.archive import MeshArchive
+from tencim1d_mesh_generator.batch import generate_coor_batch, make_mesh_batch
+from tencim1d_mesh_generator.errors import MeshDiameterInvalid, StandoffInfosInvalid, StandoffRatioInvalid
+from tencim1d_mesh_generator.mesh import make_mesh
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tests.consts import (
+    COOR_CASE_1,
+    COOR_CASE_2,
+    COOR_CASE_3_WITH_STANDOFF_THICK,
+    COOR_CASE_3_WITH_STANDOFF_THIN,
+)
+
+np = pytest.importorskip('numpy')
+
+
+def test_generate_coor_batch():
+    x = generate_coor_batch([1.0, 0.15716], [3.0, 0.17304], [6.0, 0.20955])
+
+    assert x.shape == (2, len(COOR_CASE_1))
+    assert x[0] == pytest.approx(COOR_CASE_1)
+    assert x[1] == pytest.approx(COOR_CASE_2)
+
+
+@pytest.mark.parametrize(
+    'thickness, expected_coor',
+    [
+        ('THIN', COOR_CASE_3_WITH_STANDOFF_THIN),
+        ('THICK', COOR_CASE_3_WITH_STANDOFF_THICK),
+    ],
+)
+def test_generate_coor_batch_with_standoff(thickness, expected_coor):
+    x = generate_coor_batch(1.0, 2.0, 4.0, standoff_ratio=0.8, thickness=thickness)
+
+    assert x[0] == pytest.approx(expected_coor, rel=1e-5)
+
+
+def test_generate_coor_batch_invalid_diameter():
+    with pytest.raises(MeshDiameterInvalid, match='linhas 1'):
+        generate_coor_batch([1.0, 3.0], [3.0, 1.0], [6.0, 6.0])
+
+
+def test_generate_coor_batch_invalid_ratio():
+    with pytest.raises(StandoffRatioInvalid, match='linhas 0'):
+        generate_coor_batch([1.0, 1.0], [3.0, 3.0], [6.0, 6.0], standoff_ratio=[0.0, 0.5])
+
+
+def test_generate_coor_batch_vectorized_standoff():
+    standoff = StandoffRigid.many(2.0, 4.0, [3.8, 3.5])
+
+    x = generate_coor_batch(1.0, 2.0, 4.0, standoff=standoff)
+
+    assert x == pytest.approx(generate_coor_batch(1.0, 2.0, 4.0, standoff_ratio=standoff.ratio))
+
+
+def test_generate_coor_batch_vectorized_standoff_invalid_params():
+    # dc = 4.1 > well_diameter: razão válida, mas parâmetro inválido
+    standoff = StandoffRigid.many(2.0, 4.0, [3.8, 4.1], gamma_max=[0.0, 1.0])
+
+    with pytest.raises(StandoffInfosInvalid, match='linhas 1'):
+        generate_coor_batch(1.0, 2.0, 4.0, standoff=standoff)
+
+
+def test_generate_coor_batch_ratio_and_standoff():
+    with pytest.raises(ValueError, match='não os dois'):
+        generate_coor_batch(1.0, 2.0, 4.0, standoff_ratio=0.5, standoff=StandoffRigid.many(2.0, 4.0, 3.8))
+
+
+def test_generate_coor_batch_grid():
+    x = generate_coor_batch(np.array([[1.0], [1.1]]), [3.0, 3.1], 6.0)
+
+    assert x.shape == (4, len(COOR_CASE_1))
+    # ordem C: o último eixo (casing_external_diameter) varia mais rápido
+    for row, (di, de) in zip(x, [(1.0, 3.0), (1.0, 3.1), (1.1, 3.0), (1.1, 3.1)], strict=True):
+        assert row == pytest.approx(generate_coor_batch(di, de, 6.0)[0])
+
+
+def test_generate_coor_batch_grid_invalid_row():
+    with pytest.raises(MeshDiameterInvalid, match='linhas 1'):
+        generate_coor_batch(np.array([[1.0], [1.1]]), [3.0, 7.0], 6.0)
+
+
+def test_make_mesh_batch_same_output_as_make_mesh(tmp_path):
+    make_mesh_batch([0.15, 0.16], [0.17, 0.18], [0.21, 0.22], base_dir=tmp_path / 'batch')
+    make_mesh(0.16, 0.18, 0.22, base_dir=tmp_path / 'single')
+
+    assert (tmp_path / 'batch/000000/mesh.dat').exists()
+    assert (tmp_path / 'batch/000001/mesh.dat').read_text() == (tmp_path / 'single/mesh.dat').read_text()
+
+
+def test_make_mesh_batch_with_standoff(tmp_path):
+    standoff = StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19)
+
+    make_mesh_batch([0.15], [0.17], [0.21], base_dir=tmp_path / 'batch', standoff_ratio=[standoff.ratio])
+    make_mesh(0.15, 0.17, 0.21, base_dir=tmp_path / 'single', standoff=standoff)
+
+    for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+        batch = (tmp_path / 'batch/000000' / name).read_text().splitlines()
+        single = (tmp_path / 'single' / name).read_text().splitlines()
+        assert len(batch) == len(single)
+        for a, b in zip(batch, single, strict=True):
+            if a.split()[0].isdigit():
+                assert [float(v) for v in a.split()] == pytest.approx([float(v) for v in b.split()])
+            else:
+                assert a == b
+
+
+def test_make_mesh_batch_vectorized_standoff(tmp_path):
+    standoff = StandoffRigid.many(0.17, 0.21, [0.19, 0.3, 0.2])
+
+    report = make_mesh_batch(0.15, 0.17, 0.21, base_dir=tmp_path / 'batch', standoff=standoff, skip_invalid=True)
+    make_mesh_batch(0.15, 0.17, 0.21, base_dir=tmp_path / 'ratio', standoff_ratio=[float(standoff.ratio[2])])
+
+    assert report.mask.tolist() == [True, False, True]
+    assert sorted(p.name for p in (tmp_path / 'batch').iterdir()) == ['000000', '000002']
+    for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+        assert (tmp_path / 'batch/000002' / name).read_bytes() == (tmp_path / 'ratio/000000' / name).read_bytes()
+
+
+def test_make_mesh_batch_skip_invalid(tmp_path):
+    report = make_mesh_batch(
+        [0.15, 0.30, 0.16],
+        [0.17, 0.18, 0.18],
+        [0.21, 0.22, 0.22],
+        base_dir=tmp_path / 'batch',
+        standoff_ratio=[0.8, 0.8, 1.5],
+        skip_invalid=True,
+    )
+
+    assert report.mask.tolist() == [True, False, False]
+    assert sorted(p.name for p in (tmp_path / 'batch').iterdir()) == ['000000']
+
+
+def test_make_mesh_batch_invalid_before_writing(tmp_path):
+    with pytest.raises(MeshDiameterInvalid, match='linhas 1'):
+        make_mesh_batch([0.15, 0.30], [0.17, 0.18], [0.21, 0.22], base_dir=tmp_path / 'batch')
+
+    assert not (tmp_path / 'batch').exists()
+
+
+def test_make_mesh_batch_keeps_case_numbers(tmp_path):
+    make_mesh_batch([0.30, 0.16], [0.17, 0.18], [0.21, 0.22], base_dir=tmp_path / 'batch', skip_invalid=True)
+    make_mesh(0.16, 0.18, 0.22, base_dir=tmp_path / 'single')
+
+    assert (tmp_path / 'batch/000001/mesh.dat').read_bytes() == (tmp_path / 'single/mesh.dat').read_bytes()
+
+
+def test_make_mesh_batch_grid(tmp_path):
+    report = make_mesh_batch(np.array([[0.15], [0.30]]), [0.17, 0.18], 0.21, base_dir=tmp_path, skip_invalid=True)
+    make_mesh(0.15, 0.18, 0.21, base_dir=tmp_path / 'single')
+
+    assert report.mask.tolist() == [True, True, False, False]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['000000', '000001', 'single']
+    assert (tmp_path / '000001/mesh.dat').read_bytes() == (tmp_path / 'single/mesh.dat').read_bytes()
+
+
+def test_make_mesh_batch_formation_diameter(tmp_path):
+    report = make_mesh_batch(0.15, 0.17, [0.21, 0.5], base_dir=tmp_path, formation_diamenter=0.4, skip_invalid=True)
+    x = generate_coor_batch(0.15, 0.17, 0.21, formation_diamenter=0.4)
+
+    assert report.mask.tolist() == [True, False]
+    last = (tmp_path / '000000/mesh.dat').read_text().splitlines()[len(x[0])]
+    assert float(last.split()[1]) == pytest.approx(x[0, -1])
+    assert x[0, -1] == pytest.approx(0.2)
+
+
+def test_make_mesh_batch_archive(tmp_path):
+    with MeshArchive(tmp_path / 'batch.zip', mode='w') as archive:
+        make_mesh_batch(
+            [0.15, 0.30, 0.16],
+            [0.17, 0.18, 0.18],
+            [0.21, 0.22, 0.22],
+            base_dir=tmp_path / 'batch',
+            standoff_ratio=0.5,
+            skip_invalid=True,
+            archive=archive,
+        )
+    make_mesh_batch([0.16], [0.18], [0.22], base_dir=tmp_path / 'dirs', standoff_ratio=0.5)
+
+    assert not (tmp_path / 'batch').exists()
+    with MeshArchive(tmp_path / 'batch.zip') as archive:
+        assert archive.cases() == ['000000', '000002']
+        for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+            assert archive.read_bytes('000002', name) == (tmp_path / 'dirs/000000' / name).read_bytes()
@@ -0,0 +1,106 @@
+import struct
+
+import pytest
+
+from tencim1d_mesh_generator.binary import HEADER, binary_to_dat, dat_to_binary, read_binary, write_binary
+from tencim1d_mesh_generator.errors import MeshFormatInvalid
+from tencim1d_mesh_generator.mesh import Mesh
+from tests.consts import CONNECTIVITY, COOR_CASE_1
+
+
+@pytest.fixture
+def mesh():
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+    return mesh
+
+
+def test_write_read_binary(mesh, tmp_path):
+    path = tmp_path / 'mesh.t1d'
+    mesh.write_binary(path)
+
+    data = read_binary(path)
+
+    assert path.stat().st_size == HEADER.size + 8 * 83 + 12 * 82
+    assert data.x.tolist() == pytest.approx(COOR_CASE_1)
+    assert tuple(map(tuple, data.conn.tolist())) == CONNECTIVITY
+    assert data.decimal_places == 8
+
+
+def test_read_binary_zero_copy_read_only(mesh, tmp_path):
+    path = tmp_path / 'mesh.t1d'
+    mesh.write_binary(path)
+
+    data = read_binary(path)
+
+    assert data.x.readonly
+    assert data.conn.readonly
+    assert data.conn.shape == (82, 3)
+    assert data.x.obj is data.conn.obj
+    with pytest.raises(TypeError):
+        data.x[0] = 1.0
+
+
+def test_read_binary_numpy(mesh, tmp_path):
+    np = pytest.importorskip('numpy')
+    path = tmp_path / 'mesh.t1d'
+    mesh.write_binary(path)
+
+    data = read_binary(path)
+    x = np.asarray(data.x)
+    conn = np.asarray(data.conn)
+
+    assert x.dtype == np.float64
+    assert conn.shape == (82, 3)
+    assert not x.flags.writeable
+    assert x.tolist() == list(mesh.x)
+
+
+def test_write_binary_from_sequences(mesh, tmp_path):
+    write_binary(tmp_path / 'a.t1d', list(mesh.x), mesh.conn, mesh.decimal_places)
+    mesh.write_binary(tmp_path / 'b.t1d')
+
+    assert (tmp_path / 'a.t1d').read_bytes() == (tmp_path / 'b.t1d').read_bytes()
+
+
+@pytest.mark.parametrize('decimal_places', [4, 8])
+def test_binary_to_dat_same_as_write(tmp_path, decimal_places):
+    mesh = Mesh(0.15, 0.17, 0.21, decimal_places=decimal_places)
+    mesh.generate()
+    mesh.write(tmp_path / 'mesh.dat')
+    mesh.write_binary(tmp_path / 'mesh.t1d')
+
+    binary_to_dat(tmp_path / 'mesh.t1d', tmp_path / 'converted.dat')
+
+    assert (tmp_path / 'converted.dat').read_bytes() == (tmp_path / 'mesh.dat').read_bytes()
+
+
+def test_dat_round_trip(mesh, tmp_path):
+    mesh.write(tmp_path / 'mesh.dat')
+
+    dat_to_binary(tmp_path / 'mesh.dat', tmp_path / 'mesh.t1d')
+    binary_to_dat(tmp_path / 'mesh.t1d', tmp_path / 'round_trip.dat')
+
+    data = read_binary(tmp_path / 'mesh.t1d')
+    assert data.decimal_places == 8
+    assert data.x.tolist() == pytest.approx(mesh.x, abs=1e-8)
+    assert (tmp_path / 'round_trip.dat').read_bytes() == (tmp_path / 'mesh.dat').read_bytes()
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        b'',
+        b'T1DMESH',
+        struct.pack('<8sIIQQ', b'NOTMESH\0', 1, 8, 0, 0),
+        struct.pack('<8sIIQQ', b'T1DMESH\0', 99, 8, 0, 0),
+        struct.pack('<8sIIQQ', b'T1DMESH\0', 1, 8, 2, 1) + b'\0' * 8,
+    ],
+    ids=['empty', 'short', 'magic', 'version', 'truncated'],
+)
+def test_read_binary_invalid(tmp_path, content):
+    path = tmp_path / 'invalid.t1d'
+    path.write_bytes(content)
+
+    with pytest.raises(MeshFormatInvalid):
+        read_binary(path)
@@ -0,0 +1,157 @@
+import pickle
+
+import pytest
+
+from tencim1d_mesh_generator.cache import CACHE_VERSION, MeshCache, cache_key
+from tencim1d_mesh_generator.mesh import Mesh, MeshWithStandoff, ThicknessEnum, make_mesh
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tencim1d_mesh_generator.sweep import MeshJob, run_sweep
+from tencim1d_mesh_generator.writer import write_dat
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MeshCache(tmp_path / 'cache')
+
+
+def test_cache_key_depends_on_params():
+    mesh = Mesh(1.0, 3.0, 6.0)
+    other = Mesh(1.0, 3.0, 6.0, decimal_places=5)
+
+    assert cache_key(mesh.params()) == cache_key(Mesh(1.0, 3.0, 6.0).params())
+    assert cache_key(mesh.params()) != cache_key(other.params())
+
+
+def test_cache_key_depends_on_standoff_and_thickness():
+    standoff = StandoffRigid(casing_external_diameter=3.0, well_diameter=6.0, dc=5.0)
+    thick = MeshWithStandoff(1.0, 3.0, 6.0, standoff, thickness=ThicknessEnum.THICK)
+    thin = MeshWithStandoff(1.0, 3.0, 6.0, standoff, thickness=ThicknessEnum.THIN)
+    other = MeshWithStandoff(
+        1.0, 3.0, 6.0, StandoffRigid(casing_external_diameter=3.0, well_diameter=6.0, dc=5.5), thickness='THIN'
+    )
+
+    keys = {cache_key(m.params()) for m in (thick, thin, other, Mesh(1.0, 3.0, 6.0))}
+
+    assert len(keys) == 4
+
+
+def test_cache_key_versioned(monkeypatch):
+    params = Mesh(1.0, 3.0, 6.0).params()
+    key = cache_key(params)
+
+    monkeypatch.setattr('tencim1d_mesh_generator.cache.CACHE_VERSION', CACHE_VERSION + 1)
+
+    assert cache_key(params) != key
+
+
+@pytest.mark.parametrize('link', [True, False])
+def test_write_hit_and_miss(tmp_path, link: bool):
+    cache = MeshCache(tmp_path / 'cache', link=link)
+
+    assert cache.write(Mesh(1.0, 3.0, 6.0), tmp_path / 'a.dat') is False
+    assert cache.write(Mesh(1.0, 3.0, 6.0), tmp_path / 'b.dat') is True
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert (tmp_path / 'a.dat').read_bytes() == (tmp_path / 'b.dat').read_bytes()
+
+
+def test_make_mesh_with_cache(tmp_path, cache: MeshCache):
+    standoff = StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19)
+
+    make_mesh(0.15, 0.17, 0.21, base_dir=tmp_path / 'a', standoff=standoff, cache=cache)
+    make_mesh(0.15, 0.17, 0.21, base_dir=tmp_path / 'b', standoff=standoff, cache=cache)
+    make_mesh(0.15, 0.17, 0.21, base_dir=tmp_path / 'c')
+
+    assert cache.hits == 2
+    for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+        assert (tmp_path / 'a' / name).read_bytes() == (tmp_path / 'b' / name).read_bytes()
+    assert (tmp_path / 'c/mesh.dat').exists()
+
+
+def test_evict_lru(tmp_path):
+    cache = MeshCache(tmp_path / 'cache', link=False)
+    cache.write(Mesh(1.0, 3.0, 6.0), tmp_path / 'a.dat')
+    size = cache.size
+
+    cache.max_bytes = 2 * size + 100  # cabem duas entradas
+    cache.write(Mesh(1.0, 3.0, 7.0), tmp_path / 'b.dat')
+    cache.write(Mesh(1.0, 3.0, 6.0), tmp_path / 'a.dat')  # a passa a ser o mais recente
+    cache.write(Mesh(1.0, 3.0, 8.0), tmp_path / 'c.dat')
+
+    assert cache.size <= cache.max_bytes
+    assert cache.write(Mesh(1.0, 3.0, 6.0), tmp_path / 'a.dat') is True
+    assert cache.write(Mesh(1.0, 3.0, 7.0), tmp_path / 'b.dat') is False
+
+
+def test_clear(tmp_path, cache: MeshCache):
+    cache.write(Mesh(1.0, 3.0, 6.0), tmp_path / 'a.dat')
+    cache.clear()
+
+    assert cache.size == 0
+    assert cache.write(Mesh(1.0, 3.0, 6.0), tmp_path / 'a.dat') is False
+
+
+@pytest.mark.parametrize('parallel', [False, True])
+def test_overwriting_linked_destination_keeps_entry(tmp_path, cache: MeshCache, parallel: bool):
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'a', cache=cache)
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'a', cache=cache)
+    expected = (tmp_path / 'a/mesh.dat').read_bytes()
+
+    # o destino é um hard link para a entrada; a escrita seguinte substitui o link
+    other = Mesh(0.1, 0.17, 0.21)
+    other.generate()
+    if parallel:
+        other.write_parallel(tmp_path / 'a/mesh.dat', max_workers=2)
+    else:
+        other.write(tmp_path / 'a/mesh.dat')
+
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'b', cache=cache)
+    assert (tmp_path / 'b/mesh.dat').read_bytes() == expected
+    assert (tmp_path / 'a/mesh.dat').read_bytes() != expected
+
+
+def test_write_failure_keeps_destination(tmp_path):
+    path = tmp_path / 'mesh.dat'
+    path.write_text('antigo', encoding='utf-8')
+    mesh = Mesh(0.15, 0.17, 0.21)
+    mesh.generate()
+
+    with pytest.raises(TypeError):
+        write_dat(path, mesh.x_array, [None], mesh.decimal_places)
+
+    assert path.read_text(encoding='utf-8') == 'antigo'
+    assert [p.name for p in tmp_path.iterdir()] == ['mesh.dat']
+
+
+def test_put_is_atomic(tmp_path, cache: MeshCache):
+    key = cache_key(Mesh(1.0, 3.0, 6.0).params())
+
+    with pytest.raises(FileNotFoundError):
+        cache.put(key, tmp_path / 'nao_existe.dat')
+    assert list(cache.path(key).parent.iterdir()) == []
+
+    src = tmp_path / 'mesh.dat'
+    src.write_text('malha\n', encoding='utf-8')
+    cache.put(key, src)
+    assert [p.name for p in cache.path(key).parent.iterdir()] == [cache.path(key).name]
+    assert cache.path(key).stat().st_mode & 0o777 == 0o444
+
+
+def test_pickle_roundtrip(cache: MeshCache):
+    cache.hits = 3
+    copy = pickle.loads(pickle.dumps(cache))
+
+    assert copy.directory == cache.directory
+    assert copy.hits == 3
+    with copy._lock:
+        pass
+
+
+def test_sweep_with_cache_in_processes(tmp_path, cache: MeshCache):
+    jobs = [MeshJob(0.15, 0.17, 0.21, tmp_path / f'case-{i}', cache=cache) for i in range(4)]
+
+    results = run_sweep(jobs, backend='process', max_workers=2)
+
+    assert all(r.ok for r in results)
+    assert len(list(cache.directory.glob('*/*.dat'))) == 1
+    expected = (tmp_path / 'case-0/mesh.dat').read_bytes()
+    assert all((tmp_path / f'case-{i}/mesh.dat').read_bytes() == expected for i in range(4))
@@ -0,0 +1,164 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from tencim1d_mesh_generator.cli import RowError, detect_format, main, read_rows
+from tencim1d_mesh_generator.mesh import make_mesh
+from tencim1d_mesh_generator.standoff import StandoffRigid
+
+CSV = """\
+cid,ced,wd,dc,gamma_max,case
+0.15,0.17,0.21,,,a
+0.17,0.15,0.21,,,b
+0.15,0.17,0.21,0.19,0.001,c
+0.15,,0.21,,,d
+"""
+
+CASES = [
+    {'casing_internal_diameter': 0.15, 'casing_external_diameter': 0.17, 'well_diameter': 0.21},
+    {'cid': 0.15, 'ced': 0.17, 'wd': 0.21, 'standoff': 'ratio', 'standoff_ratio': 0.5, 'decimal_places': 4},
+    {'cid': 0.15, 'ced': 0.17, 'wd': 0.21, 'lateral_forces': 1.0, 'restoring_force': 2.0, 'gamma_max': 0.0},
+    {'cid': 0.15, 'ced': 0.17, 'wd': 'x'},
+]
+
+
+@pytest.mark.parametrize(
+    ('path', 'head', 'expected'),
+    [
+        ('casos.csv', '', 'csv'),
+        ('casos.JSON', '', 'json'),
+        ('casos.jsonl', '', 'ndjson'),
+        ('-', '  [{"cid": 1}', 'json'),
+        ('-', '{"cid": 1}\n', 'ndjson'),
+        ('-', 'cid,ced,wd\n', 'csv'),
+    ],
+)
+def test_detect_format(path, head, expected):
+    assert detect_format(path, head) == expected
+
+
+def test_read_rows_drops_empty_fields_and_applies_aliases():
+    rows = list(read_rows(io.StringIO(CSV), 'csv'))
+
+    assert rows[0] == {
+        'casing_internal_diameter': '0.15',
+        'casing_external_diameter': '0.17',
+        'well_diameter': '0.21',
+        'case': 'a',
+    }
+    assert rows[2]['dc'] == '0.19'
+
+
+def test_read_rows_invalid_json():
+    with pytest.raises(ValueError, match='lista'):
+        list(read_rows(['{"cid": 1}'], 'json'))
+
+
+def test_read_rows_errors_per_row():
+    rows = list(read_rows(['{"cid": 1}\n', '\n', '{"cid": \n', '[1]\n', '{"wd": 2}\n'], 'ndjson'))
+
+    assert rows[0] == {'casing_internal_diameter': 1}
+    assert isinstance(rows[1], RowError)
+    assert rows[1].line == 3
+    assert 'JSON inválido' in str(rows[1].error)
+    assert rows[2].line == 4
+    assert 'objeto' in str(rows[2].error)
+    assert rows[3] == {'well_diameter': 2}
+
+
+def test_read_rows_json_element_not_object():
+    rows = list(read_rows(['[{"cid": 1}, 2]'], 'json'))
+
+    assert rows[0] == {'casing_internal_diameter': 1}
+    assert rows[1] == RowError(2, rows[1].error)
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_main_csv(tmp_path, capsys, jobs):
+    src = tmp_path / 'casos.csv'
+    src.write_text(CSV, encoding='utf-8')
+    out = tmp_path / 'out'
+
+    code = main([str(src), '-o', str(out), '--jobs', str(jobs), '--backend', 'thread'])
+    captured = capsys.readouterr()
+
+    assert code == 1
+    assert captured.out.splitlines() == [f'a\t{out / "a"}', f'c\t{out / "c"}']
+    assert '#2 (caso b): MeshDiameterInvalid' in captured.err
+    assert '#4 (caso d): ValueError: Campo casing_external_diameter ausente' in captured.err
+    assert '2 casos gerados, 2 com erro' in captured.err
+
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'ref', standoff=StandoffRigid(0.17, 0.21, dc=0.19, gamma_max=0.001))
+    for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+        assert (out / 'c' / name).read_bytes() == (tmp_path / 'ref' / name).read_bytes()
+
+
+def test_main_json(tmp_path, capsys):
+    src = tmp_path / 'casos.json'
+    src.write_text(json.dumps(CASES), encoding='utf-8')
+
+    code = main([str(src), '-o', str(tmp_path / 'out')])
+    captured = capsys.readouterr()
+
+    assert code == 1
+    assert sorted(p.name for p in (tmp_path / 'out').iterdir()) == ['000000', '000001', '000002']
+    assert (tmp_path / 'out/000000/mesh.dat').exists()
+    assert (tmp_path / 'out/000002/mesh_thick.dat').exists()
+    assert '#4 (caso 000003): ValueError: Campo well_diameter inválido' in captured.err
+
+
+def test_main_ndjson_stdin(tmp_path, capsys, monkeypatch):
+    stdin = '\n'.join(json.dumps(case) for case in CASES[:2]) + '\n\n'
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(stdin))
+
+    code = main(['-o', str(tmp_path), '--case-format', 'caso-{}'])
+
+    assert code == 0
+    assert capsys.readouterr().out.splitlines() == [f'caso-0\t{tmp_path / "caso-0"}', f'caso-1\t{tmp_path / "caso-1"}']
+    first = (tmp_path / 'caso-1/mesh_thick.dat').read_text(encoding='utf-8').splitlines()[3]
+    assert len(first.split()[1].split('.')[1]) == 4
+
+
+def test_main_ndjson_broken_line(tmp_path, capsys):
+    src = tmp_path / 'casos.ndjson'
+    src.write_text(f'{json.dumps(CASES[0])}\n{{"cid": 0.15,\n{json.dumps(CASES[1])}\n', encoding='utf-8')
+
+    code = main([str(src), '-o', str(tmp_path / 'out')])
+    captured = capsys.readouterr()
+
+    assert code == 1
+    assert sorted(p.name for p in (tmp_path / 'out').iterdir()) == ['000000', '000002']
+    assert '#2 (caso 000001, linha 2): ValueError: JSON inválido' in captured.err
+    assert '2 casos gerados, 1 com erro' in captured.err
+
+
+def test_main_input_errors(tmp_path, capsys):
+    assert main([str(tmp_path / 'nao_existe.csv'), '-o', str(tmp_path)]) == 2
+
+    src = tmp_path / 'casos.json'
+    src.write_text('{', encoding='utf-8')
+    assert main([str(src), '-o', str(tmp_path)]) == 2
+    assert capsys.readouterr().err.count('tencim1d-mesh:') == 2
+
+
+def test_main_invalid_jobs(tmp_path):
+    with pytest.raises(SystemExit):
+        main(['-', '--jobs', '0'])
+
+
+def test_help_is_lazy():
+    code = (
+        'import sys\n'
+        'from tencim1d_mesh_generator import cli\n'
+        'try:\n'
+        "    cli.main(['--help'])\n"
+        'except SystemExit:\n'
+        '    pass\n'
+        "print(sorted(m for m in ('numpy', 'tencim1d_mesh_generator.sweep') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.splitlines()[-1] == '[]'
@@ -0,0 +1,147 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from tencim1d_mesh_generator import client
+from tencim1d_mesh_generator.errors import MeshDiameterInvalid, StandoffInfosInvalid
+from tencim1d_mesh_generator.mesh import make_mesh
+from tencim1d_mesh_generator.server import MeshServer
+from tencim1d_mesh_generator.spec import generate_mesh
+from tencim1d_mesh_generator.standoff import StandoffFlexible, StandoffRatio, StandoffRigid
+
+STANDOFF = StandoffRigid(0.17, 0.21, dc=0.19, gamma_max=0.001)
+
+
+@pytest.fixture
+def socket_path():
+    with tempfile.TemporaryDirectory(prefix='t1d') as tmp:
+        yield Path(tmp) / 's.sock'
+
+
+@pytest.fixture
+def server(socket_path):
+    with MeshServer(socket_path) as server:
+        thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+def test_default_socket(monkeypatch):
+    monkeypatch.setenv(client.SOCKET_ENV, '/run/t1d.sock')
+    assert client.default_socket() == Path('/run/t1d.sock')
+
+    monkeypatch.delenv(client.SOCKET_ENV)
+    monkeypatch.setenv('XDG_RUNTIME_DIR', '/run/user/1000')
+    assert client.default_socket() == Path('/run/user/1000/tencim1d-mesh.sock')
+
+    monkeypatch.delenv('XDG_RUNTIME_DIR')
+    assert client.default_socket().parent.name == f'tencim1d-mesh-{os.getuid()}'
+
+
+def test_encode_case():
+    assert client.encode_case(0.15, 0.17, 0.21, STANDOFF) == {
+        'casing_internal_diameter': 0.15,
+        'casing_external_diameter': 0.17,
+        'well_diameter': 0.21,
+        'decimal_places': 8,
+        'standoff': 'rigid',
+        'dc': 0.19,
+        'gamma_max': 0.001,
+    }
+    assert client.encode_case(0.15, 0.17, 0.21, StandoffFlexible(0.17, 0.21, 1.0, 2.0, 0.0))['standoff'] == 'flexible'
+    assert client.encode_case(0.15, 0.17, 0.21, StandoffRatio(0.17, 0.21, 0.5))['standoff_ratio'] == 0.5
+    # standoff com outros diâmetros não é enviado
+    assert client.encode_case(0.15, 0.17, 0.22, STANDOFF) is None
+
+
+@pytest.mark.parametrize('standoff', [None, STANDOFF])
+@pytest.mark.parametrize('remote', [True, False])
+def test_make_mesh(tmp_path, request, socket_path, standoff, remote):
+    if remote:
+        request.getfixturevalue('server')
+
+    client.make_mesh(0.15, 0.17, 0.21, tmp_path / 'client', standoff=standoff, socket_path=socket_path)
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'local', standoff=standoff)
+
+    names = sorted(p.name for p in (tmp_path / 'local').iterdir())
+    assert sorted(p.name for p in (tmp_path / 'client').iterdir()) == names
+    for name in names:
+        assert (tmp_path / 'client' / name).read_bytes() == (tmp_path / 'local' / name).read_bytes()
+
+
+@pytest.mark.parametrize('remote', [True, False])
+def test_make_mesh_errors(tmp_path, request, socket_path, remote):
+    if remote:
+        request.getfixturevalue('server')
+
+    with pytest.raises(MeshDiameterInvalid):
+        client.make_mesh(0.17, 0.15, 0.21, tmp_path, socket_path=socket_path)
+    with pytest.raises(StandoffInfosInvalid):
+        client.make_mesh(
+            0.15,
+            0.17,
+            0.21,
+            tmp_path,
+            standoff=StandoffRigid(0.17, 0.21, dc=0.22, gamma_max=0.006),
+            socket_path=socket_path,
+        )
+
+
+@pytest.mark.parametrize('remote', [True, False])
+def test_mesh_data(tmp_path, request, socket_path, remote):
+    if remote:
+        request.getfixturevalue('server')
+
+    meshes = client.mesh_data(0.15, 0.17, 0.21, standoff=STANDOFF, socket_path=socket_path)
+    make_mesh(0.15, 0.17, 0.21, tmp_path, standoff=STANDOFF)
+
+    assert sorted(meshes) == ['mesh_thick.dat', 'mesh_thin.dat']
+    for name, data in meshes.items():
+        data.write(tmp_path / f'data_{name}')
+        assert (tmp_path / f'data_{name}').read_bytes() == (tmp_path / name).read_bytes()
+
+
+def test_client_connection(server):
+    with client.MeshClient(server.path) as conn:
+        results = conn.generate([{'cid': 0.15, 'ced': 0.17, 'wd': 0.21}], reply='inline')
+        assert results[0]['ok']
+        assert conn.stats()['inline']['currsize'] >= 1
+        with pytest.raises(ValueError, match='inválida'):
+            conn.call({'op': 'nada'})
+
+
+def test_client_without_server(socket_path):
+    with pytest.raises(FileNotFoundError):
+        client.MeshClient(socket_path)
+
+
+def test_socket_of_other_user_is_not_used(tmp_path, server, monkeypatch):
+    uid = os.getuid()
+    monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+
+    with pytest.raises(PermissionError, match='outro usuário'):
+        client.MeshClient(server.path)
+
+    # sem um servidor confiável a malha é gerada no próprio processo, sem passar pelo servidor
+    before = generate_mesh.cache_info()
+    client.make_mesh(0.1, 0.17, 0.21, tmp_path, socket_path=server.path)
+    assert (tmp_path / 'mesh.dat').exists()
+    assert generate_mesh.cache_info() == before
+
+
+def test_peer_uid(server):
+    with client.MeshClient(server.path) as conn:
+        assert client.peer_uid(conn._sock) in (None, os.getuid())
+
+
+def test_non_socket_is_rejected(tmp_path):
+    path = tmp_path / 'mesh.sock'
+    path.write_text('', encoding='utf-8')
+
+    with pytest.raises(PermissionError, match='não é um socket'):
+        client.MeshClient(path)
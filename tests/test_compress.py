@@ -0,0 +1,133 @@
+import gzip
+import lzma
+from pathlib import Path
+
+import pytest
+
+from tencim1d_mesh_generator.cache import MeshCache
+from tencim1d_mesh_generator.compress import compression_of, open_binary, with_compression
+from tencim1d_mesh_generator.mesh import Mesh, make_mesh
+from tencim1d_mesh_generator.reader import read_mesh
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tests.consts import CONNECTIVITY
+
+
+def _has_zstd() -> bool:
+    try:
+        open_binary(Path('probe.zst'), 'rb')
+    except ImportError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+SUFFIXES = ['.gz', '.xz', pytest.param('.zst', marks=pytest.mark.skipif(not _has_zstd(), reason='zstd'))]
+
+
+@pytest.fixture
+def mesh():
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+    return mesh
+
+
+@pytest.mark.parametrize(
+    'path, compression',
+    [('mesh.dat', None), ('mesh.dat.gz', 'gz'), ('mesh.dat.xz', 'xz'), ('mesh.dat.zst', 'zst')],
+)
+def test_compression_of(path, compression):
+    assert compression_of(Path(path)) == compression
+
+
+def test_with_compression():
+    assert with_compression(Path('a/mesh.dat'), None) == Path('a/mesh.dat')
+    assert with_compression(Path('a/mesh.dat'), 'xz') == Path('a/mesh.dat.xz')
+    with pytest.raises(ValueError):
+        with_compression(Path('a/mesh.dat'), 'bz2')
+
+
+@pytest.mark.parametrize('suffix', SUFFIXES)
+def test_write_compressed_read_mesh(mesh, tmp_path, suffix):
+    mesh.write(tmp_path / 'mesh.dat')
+    mesh.write(tmp_path / f'mesh.dat{suffix}', level=1)
+
+    data = read_mesh(tmp_path / f'mesh.dat{suffix}')
+
+    assert (tmp_path / f'mesh.dat{suffix}').stat().st_size < (tmp_path / 'mesh.dat').stat().st_size
+    assert data.x.tolist() == pytest.approx(list(mesh.x), abs=1e-8)
+    assert tuple(map(tuple, data.conn.tolist())) == CONNECTIVITY
+    with open_binary(tmp_path / f'mesh.dat{suffix}', 'rb') as fp:
+        assert fp.read() == (tmp_path / 'mesh.dat').read_bytes()
+
+
+def test_stdlib_can_read(mesh, tmp_path):
+    mesh.write(tmp_path / 'mesh.dat')
+    mesh.write(tmp_path / 'mesh.dat.gz')
+    mesh.write(tmp_path / 'mesh.dat.xz')
+
+    assert gzip.decompress((tmp_path / 'mesh.dat.gz').read_bytes()) == (tmp_path / 'mesh.dat').read_bytes()
+    assert lzma.decompress((tmp_path / 'mesh.dat.xz').read_bytes()) == (tmp_path / 'mesh.dat').read_bytes()
+
+
+def test_gzip_reproducible(mesh, tmp_path):
+    mesh.write(tmp_path / 'a.dat.gz')
+    mesh.write(tmp_path / 'b.dat.gz')
+
+    assert (tmp_path / 'a.dat.gz').read_bytes() == (tmp_path / 'b.dat.gz').read_bytes()
+
+
+@pytest.mark.parametrize('mode', ['wb', 'rb'])
+def test_gzip_closes_file(tmp_path, mode):
+    path = tmp_path / 'a.gz'
+    path.write_bytes(gzip.compress(b''))
+
+    fp = open_binary(path, mode)
+    raw = fp._raw
+    fp.close()
+
+    assert raw.closed
+
+
+def test_level(tmp_path):
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.sheath_elements_number = 20_000
+    mesh.generate()
+
+    mesh.write(tmp_path / 'fast.dat.xz', level=0)
+    mesh.write(tmp_path / 'small.dat.xz', level=9)
+
+    assert (tmp_path / 'small.dat.xz').stat().st_size < (tmp_path / 'fast.dat.xz').stat().st_size
+
+
+@pytest.mark.parametrize('method', ['write_streaming', 'write_parallel'])
+def test_other_writers_compressed(mesh, tmp_path, method):
+    mesh.write(tmp_path / 'mesh.dat')
+    getattr(mesh, method)(tmp_path / 'other.dat.gz')
+
+    assert gzip.decompress((tmp_path / 'other.dat.gz').read_bytes()) == (tmp_path / 'mesh.dat').read_bytes()
+
+
+def test_make_mesh_compressed(tmp_path):
+    standoff = StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19)
+
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'gz', standoff=standoff, compression='gz', level=9)
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'dat', standoff=standoff)
+
+    assert sorted(p.name for p in (tmp_path / 'gz').iterdir()) == ['mesh_thick.dat.gz', 'mesh_thin.dat.gz']
+    for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+        compressed = gzip.decompress((tmp_path / 'gz' / f'{name}.gz').read_bytes())
+        assert compressed == (tmp_path / 'dat' / name).read_bytes()
+
+
+def test_make_mesh_compressed_cache(tmp_path):
+    cache = MeshCache(tmp_path / 'cache')
+
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'a', cache=cache)
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'b', cache=cache, compression='xz')
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'c', cache=cache, compression='xz', level=1)
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'd', cache=cache, compression='xz', level=9)
+
+    # level=1 é o padrão do xz, então c é o mesmo arquivo que b
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert (tmp_path / 'c/mesh.dat.xz').read_bytes() == (tmp_path / 'b/mesh.dat.xz').read_bytes()
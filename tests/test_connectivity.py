@@ -0,0 +1,76 @@
+import pytest
+
+from tencim1d_mesh_generator.connectivity import Segment, SegmentConnectivity
+from tests.consts import CONNECTIVITY
+
+
+@pytest.fixture
+def conn():
+    return SegmentConnectivity.from_layers(20, 20, 40)
+
+
+def test_segments(conn: SegmentConnectivity):
+    assert conn.segments == (
+        Segment(1, 20, 1),
+        Segment(21, 1, 2),
+        Segment(22, 20, 3),
+        Segment(42, 1, 2),
+        Segment(43, 40, 4),
+    )
+
+
+def test_len(conn: SegmentConnectivity):
+    assert len(conn) == 82
+
+
+def test_iter(conn: SegmentConnectivity):
+    assert tuple(conn) == CONNECTIVITY
+
+
+@pytest.mark.parametrize('index', [0, 19, 20, 21, 41, 42, 81, -1, -82])
+def test_getitem(conn: SegmentConnectivity, index: int):
+    assert conn[index] == CONNECTIVITY[index]
+
+
+def test_getitem_slice(conn: SegmentConnectivity):
+    assert conn[18:24] == CONNECTIVITY[18:24]
+    assert conn[::-7] == CONNECTIVITY[::-7]
+
+
+def test_getitem_segments_not_starting_at_one():
+    conn = SegmentConnectivity([Segment(5, 2, 1), Segment(10, 3, 2)])
+
+    assert [conn[i] for i in range(len(conn))] == list(conn)
+    assert conn[2] == (10, 11, 2)
+    assert conn[-1] == (12, 13, 2)
+
+
+@pytest.mark.parametrize('index', [82, -83])
+def test_getitem_out_of_range(conn: SegmentConnectivity, index: int):
+    with pytest.raises(IndexError):
+        conn[index]
+
+
+@pytest.mark.parametrize('size', [1, 7, 20, 82, 1000])
+def test_chunks(conn: SegmentConnectivity, size: int):
+    chunks = list(conn.chunks(size))
+
+    assert all(len(c) <= 3 * size for c in chunks)
+    flat = [v for c in chunks for v in c]
+    assert flat == [v for el in CONNECTIVITY for v in el]
+
+
+def test_to_array(conn: SegmentConnectivity):
+    buffer = conn.to_array()
+
+    assert buffer.typecode == 'i'
+    assert len(buffer) == 3 * len(CONNECTIVITY)
+    assert conn.to_array() is buffer
+
+
+def test_empty():
+    conn = SegmentConnectivity(())
+
+    assert len(conn) == 0
+    assert tuple(conn) == ()
+    assert list(conn.chunks(10)) == []
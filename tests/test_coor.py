@@ -0,0 +1,93 @@
+import pytest
+
+from tencim1d_mesh_generator.coor import TEMPLATE_MAX_ELEMENTS, geometric_layer, template, uniform_layer
+from tencim1d_mesh_generator.mesh import Mesh
+from tests.consts import COOR_CASE_1
+
+
+def _accumulated_uniform(r0, r1, h, n):
+    x = [r0]
+    for _ in range(1, n):
+        x.append(x[-1] + h)
+    return [*x, r1]
+
+
+def _accumulated_geometric(r0, r1, a, q, n):
+    x = [r0]
+    for i in range(1, n):
+        x.append(x[-1] + a * q ** (i - 1))
+    return [*x, r1]
+
+
+@pytest.mark.parametrize('n', [20, 1_000, 100_000])
+def test_uniform_layer_matches_accumulated(n):
+    h = 1.0 / n
+    x = uniform_layer(0.5, 1.5, n, backend='python')
+
+    assert len(x) == n + 1
+    assert x[-1] == 1.5
+    assert x == pytest.approx(_accumulated_uniform(0.5, 1.5, h, n), rel=1e-11)
+
+
+@pytest.mark.parametrize('n', [40, 400])
+def test_geometric_layer_matches_accumulated(n):
+    q = 1.0 + 4.0 / n
+    a = 27.0 * (q - 1.0) / (q**n - 1.0)
+    x = geometric_layer(3.0, 30.0, q, n, backend='python')
+
+    assert len(x) == n + 1
+    assert x[-1] == 30.0
+    assert x == pytest.approx(_accumulated_geometric(3.0, 30.0, a, q, n), rel=1e-14)
+
+
+def test_numpy_backend_same_as_python():
+    pytest.importorskip('numpy')
+
+    assert uniform_layer(0.5, 1.5, 20, backend='numpy') == pytest.approx(
+        uniform_layer(0.5, 1.5, 20, backend='python'), rel=1e-15
+    )
+    assert geometric_layer(3.0, 30.0, 1.1, 40, backend='numpy') == pytest.approx(
+        geometric_layer(3.0, 30.0, 1.1, 40, backend='python'), rel=1e-15
+    )
+
+
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+def test_mesh_backend(backend):
+    if backend == 'numpy':
+        pytest.importorskip('numpy')
+
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.backend = backend
+    mesh.generate_coor()
+
+    assert mesh.x == pytest.approx(COOR_CASE_1, rel=1e-14)
+
+
+@pytest.mark.parametrize('q', [None, 1.1])
+def test_template_cached(q):
+    t = template(40, q, backend='python')
+
+    assert t[0] == 0.0
+    assert len(t) == 40
+    assert template(40, q, backend='python') is t
+
+
+def test_template_range_same_as_full():
+    full = template(TEMPLATE_MAX_ELEMENTS + 10, 1.00001, backend='python')
+
+    assert template(TEMPLATE_MAX_ELEMENTS + 10, 1.00001, backend='python', start=5, end=20) == full[5:20]
+
+
+def test_template_numpy_read_only():
+    pytest.importorskip('numpy')
+
+    t = template(40, 1.1, backend='numpy')
+
+    assert not t.flags.writeable
+    assert t.tolist() == pytest.approx(list(template(40, 1.1, backend='python')), rel=1e-15)
+
+
+def test_layer_affine_on_template():
+    t = template(40, 1.1, backend='python')
+
+    assert geometric_layer(3.0, 30.0, 1.1, 40, backend='python') == [*(3.0 + 27.0 * ti for ti in t), 30.0]
@@ -0,0 +1,119 @@
+import json
+import time
+
+import pytest
+
+from tencim1d_mesh_generator.cache import MeshCache
+from tencim1d_mesh_generator.errors import MeshDiameterInvalid
+from tencim1d_mesh_generator.metrics import MetricsExporter, SweepMetrics
+from tencim1d_mesh_generator.profiling import MeshStats, PhaseRecord
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tencim1d_mesh_generator.sweep import MeshJob, run_sweep
+
+
+def _jobs(tmp_path, cache=None, prefix='case'):
+    standoff = StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19)
+    return [
+        MeshJob(0.15, 0.17, 0.21, tmp_path / f'{prefix}-0', cache=cache),
+        MeshJob(0.17, 0.15, 0.21, tmp_path / f'{prefix}-1', cache=cache),
+        MeshJob(0.15, 0.17, 0.21, tmp_path / f'{prefix}-2', standoff=standoff, cache=cache),
+        MeshJob(0.15, 0.17, 0.21, tmp_path / f'{prefix}-3', cache=cache),
+    ]
+
+
+@pytest.mark.parametrize('backend', ['serial', 'process'])
+def test_sweep_metrics(tmp_path, backend):
+    metrics = SweepMetrics()
+    cache = MeshCache(tmp_path / 'cache')
+
+    results = run_sweep(_jobs(tmp_path, cache), backend=backend, max_workers=2, metrics=metrics)
+    snapshot = metrics.snapshot()
+
+    assert snapshot['jobs_expected'] == 4
+    assert snapshot['jobs'] == 4
+    assert snapshot['jobs_failed'] == 1
+    assert snapshot['failures'] == {'MeshDiameterInvalid': 1}
+    if backend == 'serial':
+        assert (snapshot['cache_hits'], snapshot['cache_misses']) == (1, 3)
+    else:
+        # case-0 e case-3 podem rodar ao mesmo tempo e os dois errarem o cache
+        assert snapshot['cache_hits'] + snapshot['cache_misses'] == 4
+    # só as malhas geradas, não as do job com erro nem os acertos do cache
+    assert snapshot['meshes'] == snapshot['cache_misses']
+    # o acerto do cache (case-3, igual ao case-0) é copiado, não formatado
+    size = (tmp_path / 'case-0/mesh.dat').stat().st_size
+    formatted = sum(p.stat().st_size for p in tmp_path.glob('case-*/*.dat')) - snapshot['cache_hits'] * size
+    assert snapshot['bytes_written'] == formatted
+    assert snapshot['job_seconds']['count'] == 4
+    assert snapshot['phase_seconds']['validate']['count'] == 4
+    assert all(r.stats is not None for r in results)
+
+
+def test_sweep_metrics_accumulate_across_sweeps(tmp_path):
+    metrics = SweepMetrics()
+
+    run_sweep(_jobs(tmp_path, prefix='a'), backend='serial', metrics=metrics)
+    run_sweep(iter(_jobs(tmp_path, prefix='b')), backend='serial', metrics=metrics)
+
+    assert metrics.jobs == 8
+    assert metrics.jobs_expected == 4
+    assert metrics.failures == {'MeshDiameterInvalid': 2}
+
+
+def test_to_prometheus():
+    metrics = SweepMetrics(buckets=(0.1, 1.0))
+    stats = MeshStats()
+    stats.add(PhaseRecord('io', 0.05, 0.01, nbytes=100))
+    stats.counters['meshes'] = 1
+    metrics.observe(0.5, stats)
+    metrics.observe(2.0, error=MeshDiameterInvalid('x'))
+
+    text = metrics.to_prometheus()
+
+    assert '# TYPE tencim1d_mesh_jobs_total counter\ntencim1d_mesh_jobs_total 2\n' in text
+    assert 'tencim1d_mesh_job_failures_total{error="MeshDiameterInvalid"} 1\n' in text
+    assert 'tencim1d_mesh_meshes_total 1\n' in text
+    assert 'tencim1d_mesh_bytes_written_total 100\n' in text
+    assert '# TYPE tencim1d_mesh_job_seconds histogram\n' in text
+    assert 'tencim1d_mesh_job_seconds_bucket{le="0.1"} 0\n' in text
+    assert 'tencim1d_mesh_job_seconds_bucket{le="1.0"} 1\n' in text
+    assert 'tencim1d_mesh_job_seconds_bucket{le="+Inf"} 2\n' in text
+    assert 'tencim1d_mesh_job_seconds_sum 2.5\n' in text
+    assert 'tencim1d_mesh_job_seconds_count 2\n' in text
+    assert 'tencim1d_mesh_phase_seconds_bucket{phase="io",le="0.1"} 1\n' in text
+    assert 'tencim1d_mesh_phase_seconds_count{phase="io"} 1\n' in text
+
+
+def test_write_files(tmp_path):
+    metrics = SweepMetrics()
+    metrics.observe(0.1)
+
+    metrics.write_prometheus(tmp_path / 'metrics/tencim1d.prom')
+    metrics.write_json(tmp_path / 'metrics/tencim1d.json')
+
+    assert sorted(p.name for p in (tmp_path / 'metrics').iterdir()) == ['tencim1d.json', 'tencim1d.prom']
+    assert (tmp_path / 'metrics/tencim1d.prom').read_text(encoding='utf-8') == metrics.to_prometheus()
+    assert json.loads((tmp_path / 'metrics/tencim1d.json').read_text(encoding='utf-8'))['jobs'] == 1
+    assert (tmp_path / 'metrics/tencim1d.prom').stat().st_mode & 0o777 == 0o644
+
+
+def test_exporter(tmp_path):
+    metrics = SweepMetrics()
+    prom, snapshot = tmp_path / 'tencim1d.prom', tmp_path / 'tencim1d.json'
+
+    with MetricsExporter(metrics, prom, snapshot, interval=0.01):
+        assert 'tencim1d_mesh_jobs_total 0\n' in prom.read_text(encoding='utf-8')
+        metrics.observe(0.1)
+        deadline = time.monotonic() + 5.0
+        while 'tencim1d_mesh_jobs_total 1\n' not in prom.read_text(encoding='utf-8'):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        metrics.observe(0.1)
+
+    assert 'tencim1d_mesh_jobs_total 2\n' in prom.read_text(encoding='utf-8')
+    assert json.loads(snapshot.read_text(encoding='utf-8'))['jobs'] == 2
+
+
+def test_exporter_invalid_interval():
+    with pytest.raises(ValueError, match='intervalo'):
+        MetricsExporter(SweepMetrics(), interval=0)
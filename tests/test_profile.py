@@ -0,0 +1,93 @@
+import csv
+
+import pytest
+
+from tencim1d_mesh_generator.cache import MeshCache
+from tencim1d_mesh_generator.errors import StandoffRatioInvalid
+from tencim1d_mesh_generator.mesh import make_mesh
+from tencim1d_mesh_generator.profile import make_mesh_profile, quantize_ratio
+from tencim1d_mesh_generator.standoff import StandoffRatio, StandoffRigid
+
+
+@pytest.mark.parametrize(
+    'ratio,tolerance,expected',
+    [
+        (0.847, 0.01, 0.85),
+        (0.3, 0.1, 0.3),
+        (0.31, 0.05, 0.3),
+        (0.012, 0.05, 0.01),
+        (0.99, 0.25, 1.0),
+    ],
+)
+def test_quantize_ratio(ratio, tolerance, expected):
+    assert quantize_ratio(ratio, tolerance) == expected
+
+
+def test_quantize_ratio_invalid_tolerance():
+    with pytest.raises(ValueError):
+        quantize_ratio(0.5, 0.0)
+
+
+def test_make_mesh_profile_dedup(tmp_path):
+    stations = [(1000.0 + d, 0.8 + 0.001 * (d % 3)) for d in range(30)]
+    stations.append((2000.0, 0.5))
+
+    profile = make_mesh_profile(0.15, 0.17, 0.21, tmp_path, stations, tolerance=0.01)
+
+    assert [s.depth for s in profile] == [d for d, _ in stations]
+    assert {s.quantized_ratio for s in profile} == {0.8, 0.5}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['profile.csv', 'standoff_0.5', 'standoff_0.8']
+    assert profile[0].directory == tmp_path / 'standoff_0.8'
+
+
+def test_make_mesh_profile_same_as_make_mesh(tmp_path):
+    standoff = StandoffRigid(0.17, 0.21, 0.19)
+
+    make_mesh_profile(0.15, 0.17, 0.21, tmp_path / 'profile', [(10.0, standoff)], tolerance=0.1)
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'mesh', StandoffRatio(0.17, 0.21, 0.5))
+
+    for name in ('mesh_thick.dat', 'mesh_thin.dat'):
+        assert (tmp_path / 'profile/standoff_0.5' / name).read_bytes() == (tmp_path / 'mesh' / name).read_bytes()
+
+
+def test_make_mesh_profile_index(tmp_path):
+    make_mesh_profile(0.15, 0.17, 0.21, tmp_path, [(1.5, 0.42), (2.5, 0.7)], tolerance=0.05)
+
+    with open(tmp_path / 'profile.csv', encoding='utf-8', newline='') as fp:
+        rows = list(csv.DictReader(fp))
+
+    assert rows == [
+        {
+            'depth': '1.5',
+            'ratio': '0.42',
+            'quantized_ratio': '0.4',
+            'mesh_thick': 'standoff_0.4/mesh_thick.dat',
+            'mesh_thin': 'standoff_0.4/mesh_thin.dat',
+        },
+        {
+            'depth': '2.5',
+            'ratio': '0.7',
+            'quantized_ratio': '0.7',
+            'mesh_thick': 'standoff_0.7/mesh_thick.dat',
+            'mesh_thin': 'standoff_0.7/mesh_thin.dat',
+        },
+    ]
+    for row in rows:
+        assert (tmp_path / row['mesh_thick']).exists()
+        assert (tmp_path / row['mesh_thin']).exists()
+
+
+def test_make_mesh_profile_with_cache(tmp_path):
+    cache = MeshCache(tmp_path / 'cache')
+    stations = [(1.0, 0.8), (2.0, 0.6)]
+
+    make_mesh_profile(0.15, 0.17, 0.21, tmp_path / 'a', stations, cache=cache)
+    make_mesh_profile(0.15, 0.17, 0.21, tmp_path / 'b', stations, cache=cache)
+
+    assert cache.misses == 4
+    assert cache.hits == 4
+
+
+def test_make_mesh_profile_invalid_ratio(tmp_path):
+    with pytest.raises(StandoffRatioInvalid):
+        make_mesh_profile(0.15, 0.17, 0.21, tmp_path, [(1.0, 0.8), (2.0, 1.2)])
@@ -0,0 +1,159 @@
+import pytest
+
+from tencim1d_mesh_generator.cache import MeshCache
+from tencim1d_mesh_generator.mesh import Mesh, make_mesh
+from tencim1d_mesh_generator.profiling import (
+    Histogram,
+    MeshProfiler,
+    MeshStats,
+    PhaseRecord,
+    aggregate,
+    current_profiler,
+    phase,
+)
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tencim1d_mesh_generator.sweep import MeshJob, run_sweep, sweep_histograms
+
+
+@pytest.fixture
+def standoff():
+    return StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19)
+
+
+def test_phase_without_profiler_is_noop():
+    assert current_profiler() is None
+    assert phase('generate_coor') is phase('write')
+
+
+def test_make_mesh_without_profile_returns_none(tmp_path):
+    assert make_mesh(0.15, 0.17, 0.21, tmp_path) is None
+
+
+def test_make_mesh_profile(tmp_path):
+    stats = make_mesh(0.15, 0.17, 0.21, tmp_path, profile=True)
+
+    assert set(stats.phases) == {'validate', 'generate_coor', 'generate_connectivity', 'format', 'io'}
+    assert stats.phases['generate_coor'].elements == 80
+    assert stats.bytes_written == (tmp_path / 'mesh.dat').stat().st_size
+    assert stats.counters == {'meshes': 1}
+    assert stats.wall > 0.0
+    assert current_profiler() is None
+
+
+@pytest.mark.parametrize('concurrent', [False, True])
+def test_make_mesh_profile_standoff(tmp_path, standoff, concurrent):
+    stats = make_mesh(0.15, 0.17, 0.21, tmp_path, standoff=standoff, concurrent=concurrent, profile=True)
+
+    written = sum(p.stat().st_size for p in tmp_path.iterdir())
+    assert stats.bytes_written == written
+    assert stats.counters == {'meshes': 2}
+    assert stats.phases['generate_coor'].calls == 2
+
+
+def test_profile_cache_counters(tmp_path):
+    cache = MeshCache(tmp_path / 'cache')
+
+    first = make_mesh(0.15, 0.17, 0.21, tmp_path / 'a', cache=cache, profile=True)
+    second = make_mesh(0.15, 0.17, 0.21, tmp_path / 'b', cache=cache, profile=True)
+
+    assert first.counters == {'cache_misses': 1, 'meshes': 1}
+    # o acerto do cache é copiado, não gerado
+    assert second.counters == {'cache_hits': 1}
+    assert 'generate_coor' not in second.phases
+
+
+def test_failed_write_counts_no_meshes(tmp_path, standoff):
+    # a malha fina é gerada, mas não pode ser escrita por cima de um diretório
+    (tmp_path / 'mesh_thin.dat').mkdir()
+
+    with MeshProfiler() as profiler:
+        with pytest.raises(OSError):
+            make_mesh(0.15, 0.17, 0.21, tmp_path, standoff=standoff)
+
+    assert profiler.stats.phases['generate_coor'].calls == 2
+    assert 'meshes' not in profiler.stats.counters
+
+
+def test_profiler_context_manager_on_mesh(tmp_path):
+    records = []
+    with MeshProfiler(hooks=[records.append]) as profiler:
+        mesh = Mesh(1.0, 3.0, 6.0)
+        mesh.generate()
+        mesh.write_parallel(tmp_path / 'mesh.dat', max_workers=2)
+
+    assert {r.name for r in records} == {'generate_coor', 'generate_connectivity', 'format', 'io'}
+    assert all(isinstance(r, PhaseRecord) for r in records)
+    assert profiler.stats.bytes_written == (tmp_path / 'mesh.dat').stat().st_size
+
+
+def test_nested_profilers_merge(tmp_path):
+    with MeshProfiler() as outer:
+        inner = make_mesh(0.15, 0.17, 0.21, tmp_path / 'a', profile=True)
+        make_mesh(0.15, 0.17, 0.21, tmp_path / 'b')
+
+    assert inner.counters == {'meshes': 1}
+    assert outer.stats.counters == {'meshes': 2}
+    assert outer.stats.bytes_written == 2 * inner.bytes_written
+
+
+def test_stats_merge_and_to_dict():
+    a, b = MeshStats(), MeshStats()
+    a.add(PhaseRecord('io', 0.5, 0.1, nbytes=10))
+    b.add(PhaseRecord('io', 0.25, 0.1, nbytes=5))
+    b.counters['meshes'] = 1
+
+    a.merge(b)
+
+    assert a.to_dict() == {
+        'phases': {'io': {'calls': 2, 'wall': 0.75, 'cpu': 0.2, 'nbytes': 15, 'elements': 0}},
+        'counters': {'meshes': 1},
+        'wall': 0.75,
+        'cpu': 0.2,
+        'bytes_written': 15,
+    }
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.cumulative() == [2, 3, 4]
+    assert histogram.count == 4
+    assert histogram.total == pytest.approx(2.65)
+
+
+def test_aggregate():
+    stats = []
+    for wall in (0.01, 0.2):
+        s = MeshStats()
+        s.add(PhaseRecord('format', wall, wall))
+        stats.append(s)
+
+    histograms = aggregate(stats, buckets=(0.1,))
+
+    assert histograms['format'].counts == [1, 1]
+
+
+@pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+def test_sweep_profile(tmp_path, standoff, backend):
+    jobs = [
+        MeshJob(0.15, 0.17, 0.21, tmp_path / 'case-0'),
+        MeshJob(0.15, 0.17, 0.21, tmp_path / 'case-1', standoff=standoff),
+        MeshJob(0.17, 0.15, 0.21, tmp_path / 'case-2'),
+    ]
+
+    results = run_sweep(jobs, backend=backend, max_workers=2, profile=True)
+    histograms = sweep_histograms(results)
+
+    assert [r.stats.counters.get('meshes', 0) for r in results] == [1, 2, 0]
+    assert histograms['format'].count == 2
+    assert histograms['validate'].count == 3
+
+
+def test_sweep_without_profile(tmp_path):
+    results = run_sweep([MeshJob(0.15, 0.17, 0.21, tmp_path)], backend='serial')
+
+    assert results[0].stats is None
+    assert sweep_histograms(results) == {}
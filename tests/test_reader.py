@@ -0,0 +1,96 @@
+import pytest
+
+from tencim1d_mesh_generator.backend import has_numpy
+from tencim1d_mesh_generator.data import MeshData
+from tencim1d_mesh_generator.errors import MeshFormatInvalid
+from tencim1d_mesh_generator.mesh import Mesh, MeshWithStandoff
+from tencim1d_mesh_generator.reader import read_mesh
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tests.consts import CONNECTIVITY, COOR_CASE_1
+
+BACKENDS = ['python', pytest.param('numpy', marks=pytest.mark.skipif(not has_numpy(), reason='numpy'))]
+
+
+@pytest.fixture
+def mesh():
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+    return mesh
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_read_mesh(mesh, tmp_path, backend):
+    mesh.write(tmp_path / 'mesh.dat')
+
+    data = read_mesh(tmp_path / 'mesh.dat', backend=backend)
+
+    assert isinstance(data, MeshData)
+    assert data.x.tolist() == pytest.approx(COOR_CASE_1, abs=1e-8)
+    assert tuple(map(tuple, data.conn.tolist())) == CONNECTIVITY
+    assert data.conn.shape == (82, 3)
+    assert data.decimal_places == 8
+    assert data.x.readonly
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_read_mesh_round_trip(tmp_path, backend):
+    mesh = MeshWithStandoff(0.15, 0.17, 0.21, StandoffRigid(0.17, 0.21, 0.19), 'THICK', decimal_places=5)
+    mesh.sheath_elements_number = 5_000
+    mesh.generate()
+    mesh.write(tmp_path / 'mesh_thick.dat')
+
+    data = read_mesh(tmp_path / 'mesh_thick.dat', backend=backend)
+    data.write(tmp_path / 'round_trip.dat')
+
+    assert data.decimal_places == 5
+    assert (tmp_path / 'round_trip.dat').read_bytes() == (tmp_path / 'mesh_thick.dat').read_bytes()
+
+
+def test_read_mesh_backends_agree(mesh, tmp_path):
+    pytest.importorskip('numpy')
+    mesh.write(tmp_path / 'mesh.dat')
+
+    python = read_mesh(tmp_path / 'mesh.dat', backend='python')
+    numpy = read_mesh(tmp_path / 'mesh.dat', backend='numpy')
+
+    assert python.x.tolist() == numpy.x.tolist()
+    assert python.conn.tolist() == numpy.conn.tolist()
+
+
+def test_read_mesh_crlf(mesh, tmp_path):
+    mesh.write(tmp_path / 'mesh.dat')
+    content = (tmp_path / 'mesh.dat').read_bytes().replace(b'\n', b'\r\n')
+    (tmp_path / 'crlf.dat').write_bytes(content)
+
+    data = read_mesh(tmp_path / 'crlf.dat')
+
+    assert data.decimal_places == 8
+    assert tuple(map(tuple, data.conn.tolist())) == CONNECTIVITY
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize(
+    'old, new',
+    [
+        (b'end bar2', b''),
+        (b'return', b''),
+        (b'82   82   83    4', b'82   82   83'),
+        (b'83 30.00000000', b'84 30.00000000'),
+        (b'2    2    3    1', b'2    2    x    1'),
+    ],
+    ids=['no-end-bar2', 'no-return', 'missing-column', 'numbering', 'not-a-number'],
+)
+def test_read_mesh_invalid(mesh, tmp_path, backend, old, new):
+    mesh.write(tmp_path / 'mesh.dat')
+    path = tmp_path / 'invalid.dat'
+    path.write_bytes((tmp_path / 'mesh.dat').read_bytes().replace(old, new))
+
+    with pytest.raises(MeshFormatInvalid):
+        read_mesh(path, backend=backend)
+
+
+def test_read_mesh_empty(tmp_path):
+    (tmp_path / 'empty.dat').write_bytes(b'')
+
+    with pytest.raises(MeshFormatInvalid):
+        read_mesh(tmp_path / 'empty.dat')
@@ -0,0 +1,183 @@
+import base64
+import json
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from tencim1d_mesh_generator.binary import from_bytes
+from tencim1d_mesh_generator.mesh import make_mesh
+from tencim1d_mesh_generator.server import MeshServer, generate_case, handle_request
+from tencim1d_mesh_generator.standoff import StandoffRigid
+
+
+@pytest.fixture
+def server():
+    # caminho curto: sockets Unix têm limite de ~100 caracteres
+    with tempfile.TemporaryDirectory(prefix='t1d') as tmp:
+        with MeshServer(Path(tmp) / 's.sock') as server:
+            thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+            thread.start()
+            yield server
+            server.shutdown()
+            thread.join()
+
+
+def _call(path: Path, *requests) -> list[dict]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        fp = sock.makefile('rwb')
+        for request in requests:
+            fp.write(request if isinstance(request, bytes) else json.dumps(request).encode() + b'\n')
+        fp.flush()
+        return [json.loads(fp.readline()) for _ in requests]
+
+
+def test_generate_path(tmp_path, server):
+    cases = [
+        {'cid': 0.15, 'ced': 0.17, 'wd': 0.21, 'base_dir': str(tmp_path / 'a')},
+        {'cid': 0.15, 'ced': 0.17, 'wd': 0.21, 'dc': 0.19, 'gamma_max': 0.001, 'base_dir': str(tmp_path / 'b')},
+        {'cid': 0.17, 'ced': 0.15, 'wd': 0.21, 'base_dir': str(tmp_path / 'c')},
+    ]
+
+    (reply,) = _call(server.path, {'id': 'x', 'cases': cases})
+
+    assert reply['id'] == 'x'
+    ok, standoff, invalid = reply['results']
+    assert ok == {'ok': True, 'files': [str(tmp_path / 'a/mesh.dat')]}
+    assert standoff['files'] == [str(tmp_path / 'b/mesh_thick.dat'), str(tmp_path / 'b/mesh_thin.dat')]
+    assert invalid['ok'] is False
+    assert invalid['error'] == 'MeshDiameterInvalid'
+
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'ref')
+    make_mesh(0.15, 0.17, 0.21, tmp_path / 'ref', standoff=StandoffRigid(0.17, 0.21, dc=0.19, gamma_max=0.001))
+    for name in ('a/mesh.dat', 'b/mesh_thick.dat', 'b/mesh_thin.dat'):
+        assert (tmp_path / name).read_bytes() == (tmp_path / 'ref' / Path(name).name).read_bytes()
+
+
+def test_generate_inline(tmp_path, server):
+    request = {'op': 'generate', 'reply': 'inline', 'cases': [{'cid': 0.15, 'ced': 0.17, 'wd': 0.21}]}
+
+    first, second = _call(server.path, request, request)
+
+    assert first == second
+    data = from_bytes(base64.b64decode(first['results'][0]['meshes']['mesh.dat']))
+    data.write(tmp_path / 'inline.dat')
+    make_mesh(0.15, 0.17, 0.21, tmp_path)
+    assert (tmp_path / 'inline.dat').read_bytes() == (tmp_path / 'mesh.dat').read_bytes()
+
+
+def test_stats(server):
+    _call(server.path, {'reply': 'inline', 'cases': [{'cid': 0.1, 'ced': 0.17, 'wd': 0.21}] * 2})
+
+    (reply,) = _call(server.path, {'op': 'stats'})
+
+    assert reply['stats']['inline']['hits'] >= 1
+
+
+def test_invalid_requests(server):
+    replies = _call(
+        server.path,
+        b'nao json\n',
+        {'id': 1, 'op': 'nada'},
+        {'id': 2, 'reply': 'zip', 'cases': []},
+        {'id': 3},
+    )
+
+    assert [r['id'] for r in replies] == [None, 1, 2, 3]
+    assert all('error' in r for r in replies)
+
+
+@pytest.mark.parametrize(
+    ('case', 'message'),
+    [
+        ('x', 'objeto'),
+        ({'cid': 0.15, 'ced': 0.17, 'wd': 0.21}, 'base_dir ausente'),
+        ({'cid': 0.15, 'ced': 0.17, 'wd': 0.21, 'base_dir': 'rel'}, 'absoluto'),
+        ({'cid': 0.15, 'ced': 0.17}, 'well_diameter'),
+    ],
+)
+def test_generate_case_errors(case, message):
+    result = generate_case(case)
+
+    assert result['ok'] is False
+    assert result['error'] == 'ValueError'
+    assert message in result['message']
+
+
+def test_unexpected_error_stays_in_case(server):
+    cases = [
+        {'cid': 0.15, 'ced': 0.17, 'wd': 0.21},
+        # la == 0: a razão do standoff divide por zero
+        {'cid': 0.15, 'ced': 0.21, 'wd': 0.21, 'dc': 0.2},
+    ]
+
+    reply = handle_request(json.dumps({'reply': 'inline', 'cases': cases}).encode())
+    ok, failed = reply['results']
+    assert ok['ok'] is True
+    assert (failed['ok'], failed['error']) == (False, 'ZeroDivisionError')
+
+    (remote,) = _call(server.path, {'id': 7, 'reply': 'inline', 'cases': cases})
+    assert remote == reply | {'id': 7}
+
+
+def test_handler_replies_to_unexpected_errors(server, monkeypatch):
+    def fail(line):
+        raise RuntimeError('falhou')
+
+    monkeypatch.setattr('tencim1d_mesh_generator.server.handle_request', fail)
+
+    first, second = _call(server.path, {'id': 1, 'cases': []}, b'nao json\n')
+
+    assert first == {'id': 1, 'error': 'RuntimeError: falhou'}
+    assert second['id'] is None
+
+
+def test_handle_request_not_object():
+    assert handle_request(b'[1]')['error'] == 'O pedido precisa ser um objeto'
+
+
+def test_socket_in_use_and_stale(server):
+    with pytest.raises(OSError, match='Já existe'):
+        MeshServer(server.path)
+
+    with tempfile.TemporaryDirectory(prefix='t1d') as tmp:
+        path = Path(tmp) / 's.sock'
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+
+        with MeshServer(path) as other:
+            assert other.path.stat().st_mode & 0o777 == 0o600
+        assert not path.exists()
+
+
+def test_socket_of_other_user_is_not_removed(server, monkeypatch):
+    uid = os.getuid()
+    monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+
+    with pytest.raises(PermissionError, match='outro usuário'):
+        MeshServer(server.path)
+    assert server.path.exists()
+
+
+def test_default_socket_dir(monkeypatch):
+    with tempfile.TemporaryDirectory(prefix='t1d') as tmp:
+        monkeypatch.delenv('TENCIM1D_MESH_SOCKET', raising=False)
+        monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+        monkeypatch.setattr(tempfile, 'tempdir', tmp)
+
+        with MeshServer() as server:
+            assert server.path.parent == Path(tmp) / f'tencim1d-mesh-{os.getuid()}'
+            assert server.path.parent.stat().st_mode & 0o777 == 0o700
+            assert server.path.stat().st_mode & 0o777 == 0o600
+
+
+def test_unsafe_socket_dir(monkeypatch):
+    with tempfile.TemporaryDirectory(prefix='t1d') as tmp:
+        os.chmod(tmp, 0o777)
+        with pytest.raises(PermissionError, match='outros usuários'):
+            MeshServer(Path(tmp) / 's.sock')
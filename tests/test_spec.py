@@ -0,0 +1,101 @@
+import dataclasses
+
+import pytest
+
+from tencim1d_mesh_generator.errors import MeshDiameterInvalid, StandoffRatioInvalid
+from tencim1d_mesh_generator.mesh import Mesh, MeshWithStandoff
+from tencim1d_mesh_generator.spec import MeshSpec, generate_mesh
+from tencim1d_mesh_generator.standoff import StandoffRatio
+from tests.consts import CONNECTIVITY, COOR_CASE_1, COOR_CASE_3_WITH_STANDOFF_THICK
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    generate_mesh.cache_clear()
+
+
+def test_spec_is_hashable_and_frozen():
+    spec = MeshSpec(1.0, 3.0, 6.0)
+
+    assert hash(spec) == hash(MeshSpec(1.0, 3.0, 6.0))
+    assert spec == MeshSpec(1.0, 3.0, 6.0)
+    assert not hasattr(spec, '__dict__')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spec.well_diameter = 7.0
+
+
+def test_spec_invalid_diameter():
+    with pytest.raises(MeshDiameterInvalid) as spec_error:
+        MeshSpec(3.0, 1.0, 6.0)
+    with pytest.raises(MeshDiameterInvalid) as mesh_error:
+        Mesh(3.0, 1.0, 6.0)
+
+    assert str(spec_error.value) == str(mesh_error.value)
+
+
+def test_spec_invalid_ratio():
+    with pytest.raises(StandoffRatioInvalid) as spec_error:
+        MeshSpec(1.0, 2.0, 4.0, standoff_ratio=0.0)
+    with pytest.raises(StandoffRatioInvalid) as standoff_error:
+        StandoffRatio(2.0, 4.0, 0.0).validate_ratio()
+
+    assert str(spec_error.value) == str(standoff_error.value)
+
+
+def test_spec_invalid_thickness():
+    with pytest.raises(ValueError):
+        MeshSpec(1.0, 2.0, 4.0, standoff_ratio=0.8, thickness='MEDIUM')
+
+
+def test_to_mesh():
+    mesh = MeshSpec(1.0, 2.0, 4.0, standoff_ratio=0.8, thickness='THICK', formation_elements_number=10).to_mesh()
+
+    assert isinstance(mesh, MeshWithStandoff)
+    assert isinstance(mesh.standoff, StandoffRatio)
+    assert mesh.standoff.ratio == 0.8
+    assert mesh.formation_elements_number == 10
+    assert Mesh.formation_elements_number == 40
+
+
+def test_generate_mesh():
+    data = generate_mesh(MeshSpec(1.0, 3.0, 6.0))
+
+    assert data.x.tolist() == pytest.approx(COOR_CASE_1)
+    assert tuple(map(tuple, data.conn.tolist())) == CONNECTIVITY
+
+
+def test_generate_mesh_with_standoff():
+    data = generate_mesh(MeshSpec(1.0, 2.0, 4.0, standoff_ratio=0.8, thickness='THICK'))
+
+    assert data.x.tolist() == pytest.approx(COOR_CASE_3_WITH_STANDOFF_THICK, rel=1e-5)
+
+
+def test_generate_mesh_shared_and_read_only():
+    data = generate_mesh(MeshSpec(1.0, 3.0, 6.0))
+
+    assert generate_mesh(MeshSpec(1.0, 3.0, 6.0)) is data
+    assert generate_mesh.cache_info().hits == 1
+    assert data.x.readonly
+    assert data.conn.readonly
+    with pytest.raises(TypeError):
+        data.x[0] = 1.0
+
+
+def test_mesh_data_write(tmp_path):
+    data = generate_mesh(MeshSpec(1.0, 3.0, 6.0))
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+
+    data.write(tmp_path / 'data.dat')
+    mesh.write(tmp_path / 'mesh.dat')
+
+    assert (tmp_path / 'data.dat').read_bytes() == (tmp_path / 'mesh.dat').read_bytes()
+
+
+def test_mesh_data_write_without_segments(tmp_path):
+    data = generate_mesh(MeshSpec(1.0, 3.0, 6.0))
+
+    data.write(tmp_path / 'segments.dat')
+    dataclasses.replace(data, connectivity=None).write(tmp_path / 'conn.dat')
+
+    assert (tmp_path / 'segments.dat').read_bytes() == (tmp_path / 'conn.dat').read_bytes()
@@ -108,3 +108,61 @@ def test_rigid_standoff_validate(
 
     with pytest.raises(StandoffInfosInvalid, match=error):
         standoff.validate_params()
+
+
+def test_standoff_infos():
+    standoff = StandoffRigid(1.0, 2.0, 1.5, 0.1)
+
+    assert standoff.infos() == {
+        'type': 'StandoffRigid',
+        'casing_external_diameter': 1.0,
+        'well_diameter': 2.0,
+        'dc': 1.5,
+        'gamma_max': 0.1,
+    }
+
+
+def test_standoff_rigid_ratio_many():
+    np = pytest.importorskip('numpy')
+    dc = np.array([1.5, 1.0, 3.0])
+    gamma_max = np.array([0.0, 0.0, 0.2])
+
+    ratio = StandoffRigid.ratio_many(1.0, np.array([2.0, 3.0, 3.0]), dc, gamma_max)
+
+    assert ratio.tolist() == pytest.approx([0.5, 0.0, 0.8])
+
+
+def test_standoff_flexible_ratio_many_broadcast():
+    np = pytest.importorskip('numpy')
+    lateral_forces = np.array([1.0, 2.0])[:, None]
+    restoring_force = np.array([2.0, 4.0, 8.0])
+
+    ratio = StandoffFlexible.ratio_many(1.0, 2.0, lateral_forces, restoring_force, 0.1)
+
+    assert ratio.shape == (2, 3)
+    for i, j in np.ndindex(ratio.shape):
+        standoff = StandoffFlexible(1.0, 2.0, float(lateral_forces[i, 0]), float(restoring_force[j]), 0.1)
+        assert ratio[i, j] == pytest.approx(standoff.ratio)
+
+
+def test_standoff_rigid_valid_mask():
+    np = pytest.importorskip('numpy')
+    standoff = StandoffRigid.many(
+        1.0,
+        [2.0, 2.0, 3.0, 3.0, 2.0],
+        [1.5, 2.1, 0.9, 1.1, 1.009],
+        [0.0, 0.0, 0.0, 0.1, 0.0],
+    )
+
+    assert standoff.params_mask().tolist() == [True, False, False, False, True]
+    assert standoff.ratio_mask().tolist() == [True, False, False, False, False]
+    assert standoff.valid_mask().tolist() == [True, False, False, False, False]
+    assert standoff.valid_mask().dtype == np.bool_
+
+
+def test_standoff_flexible_valid_mask_without_warnings():
+    pytest.importorskip('numpy')
+    standoff = StandoffFlexible.many(1.0, 2.0, [1.0, 1.0, 6.0], [2.0, 0.0, 1.0], 0.1)
+
+    assert standoff.params_mask().tolist() == [True, True, True]
+    assert standoff.valid_mask().tolist() == [True, False, False]
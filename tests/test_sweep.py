@@ -0,0 +1,100 @@
+import os
+import time
+from concurrent.futures import BrokenExecutor
+
+import pytest
+
+from tencim1d_mesh_generator.errors import MeshDiameterInvalid, StandoffRatioInvalid
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tencim1d_mesh_generator.sweep import BackendEnum, MeshJob, default_backend, run_sweep
+
+
+def _jobs(tmp_path):
+    return [
+        MeshJob(0.15, 0.17, 0.21, tmp_path / 'case-0'),
+        MeshJob(0.17, 0.15, 0.21, tmp_path / 'case-1'),
+        MeshJob(
+            0.15,
+            0.17,
+            0.21,
+            tmp_path / 'case-2',
+            standoff=StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.19),
+        ),
+        MeshJob(
+            0.15,
+            0.17,
+            0.21,
+            tmp_path / 'case-3',
+            standoff=StandoffRigid(casing_external_diameter=0.17, well_diameter=0.21, dc=0.17),
+        ),
+    ]
+
+
+@pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+def test_run_sweep(tmp_path, backend: str):
+    jobs = _jobs(tmp_path)
+
+    results = run_sweep(jobs, backend=backend, max_workers=2, chunksize=2)
+
+    assert [r.job for r in results] == jobs
+    assert [r.ok for r in results] == [True, False, True, False]
+    assert isinstance(results[1].error, MeshDiameterInvalid)
+    assert isinstance(results[3].error, StandoffRatioInvalid)
+    assert (tmp_path / 'case-0/mesh.dat').exists()
+    assert (tmp_path / 'case-2/mesh_thick.dat').exists()
+    assert (tmp_path / 'case-2/mesh_thin.dat').exists()
+
+
+def test_invalid_backend(tmp_path):
+    with pytest.raises(ValueError):
+        run_sweep(_jobs(tmp_path), backend='gpu')
+
+
+def test_default_backend():
+    assert default_backend() in (BackendEnum.THREAD, BackendEnum.PROCESS)
+
+
+class CrashingStandoff(StandoffRigid):
+    """Mata o processo worker ao ser validado."""
+
+    def validate_infos(self) -> bool:
+        os._exit(1)
+
+
+class SlowStandoff(StandoffRigid):
+    """Standoff válido que demora para ser validado."""
+
+    def validate_infos(self) -> bool:
+        time.sleep(0.5)
+        return super().validate_infos()
+
+
+def test_unpicklable_job_does_not_abort_sweep(tmp_path):
+    class LocalStandoff(StandoffRigid): ...
+
+    jobs = _jobs(tmp_path)
+    jobs[0] = MeshJob(0.15, 0.17, 0.21, tmp_path / 'local', standoff=LocalStandoff(0.17, 0.21, dc=0.19))
+
+    results = run_sweep(jobs, backend='process', max_workers=2)
+
+    assert [r.job for r in results] == jobs
+    assert "Can't get local object" in str(results[0].error)
+    assert [r.ok for r in results[1:]] == [False, True, False]
+    assert isinstance(results[1].error, MeshDiameterInvalid)
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_dead_worker_does_not_abort_sweep(tmp_path, max_workers):
+    slow = MeshJob(0.15, 0.17, 0.21, tmp_path / 'slow', standoff=SlowStandoff(0.17, 0.21, dc=0.19))
+    crash = MeshJob(0.15, 0.17, 0.21, tmp_path / 'crash', standoff=CrashingStandoff(0.17, 0.21, dc=0.19))
+    jobs = [slow, crash, *(MeshJob(0.15, 0.17, 0.21, tmp_path / f'ok-{i}') for i in range(4))]
+
+    # com 2 workers o job lento ainda está rodando no outro worker quando o pool quebra
+    results = run_sweep(jobs, backend='process', max_workers=max_workers)
+
+    assert [r.job for r in results] == jobs
+    assert results[0].ok, results[0].error
+    assert isinstance(results[1].error, BrokenExecutor)
+    assert all(r.ok for r in results[2:])
+    assert (tmp_path / 'slow/mesh_thick.dat').exists()
+    assert all((tmp_path / f'ok-{i}/mesh.dat').exists() for i in range(4))
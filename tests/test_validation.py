@@ -0,0 +1,75 @@
+import pytest
+
+from tencim1d_mesh_generator.errors import MeshDiameterInvalid, StandoffInfosInvalid, StandoffRatioInvalid
+from tencim1d_mesh_generator.standoff import StandoffRigid
+from tencim1d_mesh_generator.validation import Reason, validate_batch
+
+np = pytest.importorskip('numpy')
+
+
+def test_validate_batch_all_valid():
+    report = validate_batch([1.0, 0.15], [3.0, 0.17], [6.0, 0.21], standoff_ratio=[0.5, 1.0])
+
+    assert len(report) == 2
+    assert report.all_valid
+    assert report.mask.tolist() == [True, True]
+    report.raise_if_invalid()
+
+
+def test_validate_batch_reports_every_reason():
+    report = validate_batch(
+        [1.0, 3.0, 1.0, 5.0, np.nan],
+        [3.0, 2.0, 7.0, 4.0, 2.0],
+        [6.0, 6.0, 6.0, 70.0, 3.0],
+        standoff_ratio=[0.5, 0.5, 1.5, 0.0, 0.5],
+    )
+
+    assert report.mask.tolist() == [True, False, False, False, False]
+    assert report.invalid_rows().tolist() == [1, 2, 3, 4]
+    assert report.reasons_of(0) == Reason.OK
+    assert report.reasons_of(1) == Reason.CASING_DIAMETER
+    assert report.reasons_of(2) == Reason.WELL_DIAMETER | Reason.STANDOFF_RATIO
+    assert report.reasons_of(3) == Reason.CASING_DIAMETER | Reason.FORMATION_DIAMETER | Reason.STANDOFF_RATIO
+    assert report.reasons_of(4) == Reason.CASING_DIAMETER
+    assert report.counts() == {
+        Reason.CASING_DIAMETER: 3,
+        Reason.WELL_DIAMETER: 1,
+        Reason.FORMATION_DIAMETER: 1,
+        Reason.STANDOFF_RATIO: 2,
+        Reason.STANDOFF_PARAMS: 0,
+    }
+
+
+def test_validate_batch_with_standoff():
+    standoff = StandoffRigid.many(1.0, 2.0, [1.5, 2.1, 1.009])
+
+    report = validate_batch(0.5, 1.0, 2.0, standoff=standoff)
+
+    assert report.reasons_of(0) == Reason.OK
+    assert report.reasons_of(1) == Reason.STANDOFF_RATIO | Reason.STANDOFF_PARAMS
+    assert report.reasons_of(2) == Reason.STANDOFF_RATIO
+
+
+@pytest.mark.parametrize(
+    'kwargs, error, match',
+    [
+        ({'standoff_ratio': [0.5, 0.0]}, MeshDiameterInvalid, 'linhas 0$'),
+        ({'standoff_ratio': [0.0, 0.5]}, StandoffRatioInvalid, 'linhas 0$'),
+        ({'standoff': StandoffRigid.many(1.0, 2.0, [2.1, 1.5], 0.3)}, StandoffRatioInvalid, 'linhas 1$'),
+        ({'standoff': StandoffRigid.many(1.0, 2.0, [2.1, 1.5], [0.3, 0.0])}, StandoffInfosInvalid, 'linhas 0$'),
+    ],
+)
+def test_raise_if_invalid(kwargs, error, match):
+    cid = [2.0, 0.5] if error is MeshDiameterInvalid else 0.5
+    report = validate_batch(cid, 1.0, 2.0, **kwargs)
+
+    with pytest.raises(error, match=match):
+        report.raise_if_invalid()
+
+
+def test_validate_batch_standoff_params_only():
+    standoff = StandoffRigid.many(1.0, 2.0, [1.5, 2.1], [0.0, 0.3])
+
+    report = validate_batch(0.5, 1.0, 2.0, standoff=standoff)
+
+    assert report.reasons_of(1) == Reason.STANDOFF_PARAMS
@@ -0,0 +1,169 @@
+import os
+import threading
+
+import pytest
+
+from tencim1d_mesh_generator.mesh import Mesh
+from tencim1d_mesh_generator.writer import (
+    _render,
+    block_size,
+    format_conn,
+    format_coor,
+    format_segment,
+    iter_blocks,
+    write_dat,
+    write_dat_parallel,
+)
+
+
+def _legacy_write(path, x, conn, decimal_places):
+    with open(path, mode='w', encoding='utf-8') as fp:
+        fp.write('coordinates\n')
+        for node, xi in enumerate(x, start=1):
+            fp.write(f'{node} {xi:10.{decimal_places}f}\n')
+        fp.write('end coordinates\n')
+
+        fp.write('bar2\n')
+        for el, c in enumerate(conn, start=1):
+            fp.write(f'{el} {c[0]:4} {c[1]:4} {c[2]:4}\n')
+        fp.write('end bar2\n')
+
+        fp.write('return\n')
+
+
+@pytest.mark.parametrize('decimal_places', [0, 3, 8, 15])
+@pytest.mark.parametrize('chunk_size', [1, 7, 65_536])
+def test_write_dat_byte_identical(tmp_path, decimal_places: int, chunk_size: int):
+    mesh = Mesh(0.15716, 0.17304, 0.20955, decimal_places=decimal_places)
+    mesh.generate()
+
+    write_dat(tmp_path / 'fast.dat', mesh.x_array, mesh.connectivity, decimal_places, chunk_size)
+    _legacy_write(tmp_path / 'legacy.dat', mesh.x, mesh.conn, decimal_places)
+
+    assert (tmp_path / 'fast.dat').read_bytes() == (tmp_path / 'legacy.dat').read_bytes()
+
+
+def test_format_coor():
+    assert format_coor([0.5, 30.0, -1.25], decimal_places=3, start=9) == (
+        '9      0.500\n10     30.000\n11     -1.250\n'
+    )
+
+
+def test_format_conn():
+    assert format_conn([(1, 2, 1), (2, 3, 4)], start=1) == '1    1    2    1\n2    2    3    4\n'
+
+
+def test_format_segment():
+    assert format_segment(9, 2, 3) == '9    9   10    3\n10   10   11    3\n'
+
+
+@pytest.mark.parametrize('use_processes', [False, True], ids=['threads', 'processes'])
+def test_write_dat_parallel_same_as_write_dat(tmp_path, use_processes: bool):
+    mesh = Mesh(0.15716, 0.17304, 0.20955)
+    mesh.generate()
+
+    write_dat(tmp_path / 'serial.dat', mesh.x_array, mesh.connectivity)
+    write_dat_parallel(
+        tmp_path / 'parallel.dat',
+        mesh.x_array,
+        mesh.connectivity,
+        chunk_size=9,
+        max_workers=2,
+        use_processes=use_processes,
+    )
+
+    assert (tmp_path / 'parallel.dat').read_bytes() == (tmp_path / 'serial.dat').read_bytes()
+
+
+def test_mesh_write_parallel(tmp_path):
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+
+    mesh.write(tmp_path / 'serial.dat')
+    mesh.write_parallel(tmp_path / 'parallel.dat', max_workers=2)
+
+    assert (tmp_path / 'parallel.dat').read_bytes() == (tmp_path / 'serial.dat').read_bytes()
+
+
+@pytest.mark.parametrize(
+    'block',
+    [
+        (str, ('end coordinates\n',)),
+        (format_coor, ((0.5, 1.25, 9.999), 8, 1)),
+        (format_coor, ((9.999999999, 9.99999999), 8, 9)),
+        (format_coor, ((0.0, -0.0, -1e-12, 1e-12), 3, 98)),
+        (format_coor, ((-2.5, -123456.5), 0, 1)),
+        (format_coor, ((1.0, float('inf'), 12345.0, float('nan'), float('-inf')), 8, 1)),
+        (format_conn, (((1, 2, 1), (99999, 100000, 4), (-1, 0, 3)), 9995)),
+        (format_segment, (1, 12, 3)),
+        (format_segment, (9990, 20, 2)),
+        (format_segment, (5, 0, 1)),
+    ],
+)
+def test_block_size(block):
+    assert block_size(block) == len(_render(block))
+
+
+def test_block_size_mesh():
+    mesh = Mesh(0.15716, 0.17304, 0.20955)
+    mesh.generate()
+
+    for block in iter_blocks(mesh.x_array, mesh.connectivity, chunk_size=7):
+        assert block_size(block) == len(_render(block))
+
+
+def test_write_dat_parallel_iterators(tmp_path):
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+
+    mesh.write(tmp_path / 'serial.dat')
+    write_dat_parallel(tmp_path / 'parallel.dat', iter(mesh.x), iter(mesh.conn), chunk_size=5, max_workers=2)
+
+    assert (tmp_path / 'parallel.dat').read_bytes() == (tmp_path / 'serial.dat').read_bytes()
+
+
+def test_write_through_symlink(tmp_path):
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+    target = tmp_path / 'target.dat'
+    target.write_text('antigo')
+    link = tmp_path / 'link.dat'
+    link.symlink_to(target)
+
+    mesh.write(link)
+
+    assert link.is_symlink()
+    assert target.read_text().startswith('coordinates\n')
+
+
+@pytest.mark.parametrize('method', ['write', 'write_parallel', 'write_binary'])
+def test_write_keeps_mode(tmp_path, method):
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+    path = tmp_path / 'mesh.dat'
+    path.write_text('antigo')
+    path.chmod(0o640)
+
+    getattr(mesh, method)(path)
+
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert path.read_bytes() != b'antigo'
+
+
+def test_write_non_regular_file(tmp_path):
+    if not hasattr(os, 'mkfifo'):
+        pytest.skip('sem FIFO')
+    mesh = Mesh(1.0, 3.0, 6.0)
+    mesh.generate()
+    mesh.write(tmp_path / 'mesh.dat')
+    fifo = tmp_path / 'fifo'
+    os.mkfifo(fifo)
+
+    received = []
+    reader = threading.Thread(target=lambda: received.append(fifo.read_bytes()))
+    reader.start()
+    mesh.write(fifo)
+    reader.join()
+
+    assert received == [(tmp_path / 'mesh.dat').read_bytes()]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['fifo', 'mesh.dat']